@@ -10,8 +10,14 @@ from pylite.lite_exceptions import (
     DuplicateModelInstanceError,
 )
 from pylite.lite_connection import LiteConnection
+from pylite.lite_cache import LiteCache
+from pylite.lite_shared_cache import LiteSharedCache
+from pylite.lite_router import LiteRouter
+from pylite.lite_async import AsyncLiteConnection
 from pylite.lite import Lite
 from pylite.lite_table import LiteTable
 from pylite.lite_collection import LiteCollection
 from pylite.lite_query import LiteQuery
 from pylite.lite_model import LiteModel
+from pylite.lite_writer import LiteWriter
+from pylite.lite_checkpointer import LiteCheckpointer
@@ -1,10 +1,11 @@
 """Contains the Lite class"""
 import os
 import re
+import sqlite3
 from pathlib import Path
 from colorama import Fore
 import inflect
-from pylite import LiteConnection
+from pylite import LiteConnection, LiteCache, LiteSharedCache
 from pylite.lite_exceptions import (
     EnvFileNotFoundError,
     DatabaseNotFoundError,
@@ -21,8 +22,12 @@ class Lite:
     """
 
     DATABASE_CONNECTIONS = {}
+    MEMORY_DATABASES = {}
     DEFAULT_CONNECTION = None
     DEBUG_MODE = False
+    TIMESTAMP_TRIGGERS = True
+    QUERY_CACHE = None
+    CHANGE_LOG_TABLE = "lite_changes"
 
     @staticmethod
     def set_debug_mode(debug_mode: bool = True):
@@ -33,6 +38,148 @@ class Lite:
         """
         Lite.DEBUG_MODE = debug_mode
 
+    @staticmethod
+    def set_timestamp_triggers(timestamp_triggers: bool = True):
+        """Sets whether new tables maintain their 'updated' field with an update trigger.
+        If False, LiteTable.update_row() sets the field within the UPDATE statement itself,
+        avoiding a second write for every updated row.
+
+        Args:
+            timestamp_triggers (bool, optional): Defaults to True.
+        """
+        Lite.TIMESTAMP_TRIGGERS = timestamp_triggers
+
+    @staticmethod
+    def enable_query_cache(
+        max_entries: int = 1024,
+        ttl: float = None,
+        max_rows: int = 10000,
+        check_data_version: bool = False,
+    ) -> LiteCache:
+        """Caches the results of LiteQuery queries and LiteModel.find(), until a table
+        they read from is written to. See LiteCache for arguments.
+
+        Returns:
+            LiteCache: The query cache, exposing hit and miss stats
+        """
+
+        Lite.disable_query_cache()
+        Lite.QUERY_CACHE = LiteCache(max_entries, ttl, max_rows, check_data_version)
+        return Lite.QUERY_CACHE
+
+    @staticmethod
+    def enable_shared_query_cache(
+        cache_path: str,
+        slots: int = 4096,
+        slot_size: int = 4096,
+        ttl: float = None,
+        check_data_version: bool = False,
+    ) -> LiteSharedCache:
+        """Caches the results of LiteQuery queries and LiteModel.find() in a file
+        shared by every process that enables it with the same path.
+        See LiteSharedCache for arguments.
+
+        Returns:
+            LiteSharedCache: The query cache, exposing this process's hit and miss stats
+        """
+
+        Lite.disable_query_cache()
+        Lite.QUERY_CACHE = LiteSharedCache(
+            cache_path, slots, slot_size, ttl, check_data_version
+        )
+        return Lite.QUERY_CACHE
+
+    @staticmethod
+    def disable_query_cache():
+        """Stops caching the results of LiteQuery queries."""
+        if isinstance(Lite.QUERY_CACHE, LiteSharedCache):
+            Lite.QUERY_CACHE.close()
+        Lite.QUERY_CACHE = None
+
+    @staticmethod
+    def changes_since(
+        seq: int = 0,
+        table_names: list = None,
+        lite_connection: LiteConnection = None,
+        batch_size: int = 500,
+    ):
+        """Yields changes recorded in the change log after a sequence number, oldest
+        first. Changes are read in batches, so the log isn't locked while consumed.
+        See LiteTable.track_changes().
+
+        Usage:
+            for seq, table_name, row_id, op in Lite.changes_since(last_seq):
+                ...
+
+        Args:
+            seq (int, optional): Sequence number of the last change consumed.
+                Defaults to 0.
+            table_names (list, optional): Only yield changes to these tables.
+                Defaults to all tables.
+            lite_connection (LiteConnection, optional): Defaults to Lite.DEFAULT_CONNECTION.
+            batch_size (int, optional): Changes read per query. Defaults to 500.
+
+        Yields:
+            tuple: (seq, table_name, row_id, op), where op is "I", "U" or "D"
+        """
+
+        lite_connection = lite_connection or Lite.DEFAULT_CONNECTION
+        if not Lite._has_change_log(lite_connection):
+            return
+
+        table_str = ""
+        if table_names:
+            table_str = f"AND table_name IN ({', '.join('?' for _ in table_names)})"
+
+        while True:
+            rows = lite_connection.execute(
+                f"""
+                SELECT seq, table_name, row_id, op FROM {Lite.CHANGE_LOG_TABLE} 
+                WHERE seq > ? {table_str} 
+                ORDER BY seq LIMIT ?
+            """,
+                (seq, *(table_names or []), batch_size),
+            ).fetchall()
+
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            seq = rows[-1][0]
+
+    @staticmethod
+    def compact_changes(seq: int, lite_connection: LiteConnection = None) -> int:
+        """Deletes changes up to and including a sequence number, once every consumer
+        has processed them.
+
+        Args:
+            seq (int): Sequence number of the last change to delete
+            lite_connection (LiteConnection, optional): Defaults to Lite.DEFAULT_CONNECTION.
+
+        Returns:
+            int: Number of changes deleted
+        """
+
+        lite_connection = lite_connection or Lite.DEFAULT_CONNECTION
+        if not Lite._has_change_log(lite_connection):
+            return 0
+
+        result = lite_connection.execute(
+            f"DELETE FROM {Lite.CHANGE_LOG_TABLE} WHERE seq <= ?", (seq,)
+        )
+        result.commit()
+        return result.rowcount
+
+    @staticmethod
+    def _has_change_log(lite_connection: LiteConnection) -> bool:
+        """Internal method. Checks if the change log table exists."""
+
+        return bool(
+            lite_connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (Lite.CHANGE_LOG_TABLE,),
+            ).fetchone()
+        )
+
     @staticmethod
     def get_env() -> dict:
         """Returns dict of values from .env file.
@@ -76,19 +223,55 @@ class Lite:
     def create_database(database_path: str):
         """Creates an empty SQLite database.
 
+        A named in-memory database (see LiteConnection.memory_database()) is kept alive
+        until Lite.drop_memory_database() is called, even while no LiteConnection uses it.
+        Private in-memory databases (":memory:") are created by each connection instead.
+
         Args:
-            database_path (str): Desired database location
+            database_path (str): Desired database location, ":memory:", or a "file:" URI.
 
         Raises:
             DatabaseAlreadyExistsError: Database already exists at given filepath.
         """
 
+        if LiteConnection.is_memory_database(database_path):
+            if "cache=shared" not in database_path:
+                return
+
+            if database_path in Lite.MEMORY_DATABASES:
+                raise DatabaseAlreadyExistsError(database_path)
+
+            # A shared in-memory database lives as long as a connection to it is open
+            Lite.MEMORY_DATABASES[database_path] = sqlite3.connect(
+                database_path, uri=True, check_same_thread=False
+            )
+            return
+
+        database_file = LiteConnection.database_file(database_path)
+
         # Raise error if database already exists
-        if os.path.exists(database_path):
+        if os.path.exists(database_file):
             raise DatabaseAlreadyExistsError(database_path)
 
         # Create database
-        Path(database_path).touch()
+        Path(database_file).touch()
+
+    @staticmethod
+    def drop_memory_database(database_path: str):
+        """Releases a named in-memory database created with Lite.create_database().
+        Its contents are discarded once every LiteConnection to it is closed.
+
+        Args:
+            database_path (str): URI of the database
+
+        Raises:
+            DatabaseNotFoundError: Database not created by Lite.create_database()
+        """
+
+        if database_path not in Lite.MEMORY_DATABASES:
+            raise DatabaseNotFoundError(database_path)
+
+        Lite.MEMORY_DATABASES.pop(database_path).close()
 
     @staticmethod
     def connect(lite_connection: LiteConnection):
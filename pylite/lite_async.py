@@ -0,0 +1,91 @@
+"""Contains the AsyncLiteConnection class and asyncio helpers"""
+import asyncio
+import functools
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pylite import LiteConnection
+
+
+class AsyncLiteConnection(LiteConnection):
+    """A LiteConnection whose queries run on a dedicated executor thread,
+    so they don't block the asyncio event loop.
+
+    Every call made through the async API, e.g. `await Model.afind()`, runs on the same
+    thread, which serializes writes. The sync API remains available, but shouldn't be
+    used while async calls are in flight.
+    """
+
+    def __init__(
+        self,
+        database_path: str = None,
+        isolation: bool = False,
+        wal: bool = True,
+        profile: str = None,
+        **pragmas,
+    ) -> None:
+        """AsyncLiteConnection initializer. Accepts the same arguments as LiteConnection."""
+
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pylite")
+        super().__init__(database_path, isolation, wal, profile, **pragmas)
+
+    def _connect(self, database_path: str, isolation: bool) -> sqlite3.Connection:
+        """Internal method. Opens a connection usable from the executor thread."""
+
+        uri = self.is_uri(database_path)
+
+        if isolation:
+            return sqlite3.connect(database_path, check_same_thread=False, uri=uri)
+        return sqlite3.connect(
+            database_path, isolation_level=None, check_same_thread=False, uri=uri
+        )
+
+    async def run(self, func, *args, **kwargs):
+        """Runs a function on the connection's executor thread.
+
+        Args:
+            func (callable): Function to run
+
+        Returns:
+            The function's return value
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def aexecute(self, sql_str: str, values: tuple[any, ...] = ()) -> list:
+        """Executes a query on the executor thread and fetches its results.
+
+        Args:
+            sql_str (str): the query to execute
+            values (tuple, optional): the values to pass to the query. Defaults to ().
+
+        Returns:
+            list: Query results
+        """
+
+        return await self.run(lambda: self.execute(sql_str, values).fetchall())
+
+    def close(self) -> None:
+        """Waits for pending calls, then closes the connection to the database."""
+
+        self.executor.shutdown(wait=True)
+        super().close()
+
+
+async def run_async(lite_connection: LiteConnection, func, *args, **kwargs):
+    """Runs a function on the executor thread of an AsyncLiteConnection.
+    Runs it directly if the connection is a regular LiteConnection.
+
+    Args:
+        lite_connection (LiteConnection): Connection used by the function
+        func (callable): Function to run
+
+    Returns:
+        The function's return value
+    """
+
+    if isinstance(lite_connection, AsyncLiteConnection):
+        return await lite_connection.run(func, *args, **kwargs)
+    return func(*args, **kwargs)
@@ -0,0 +1,227 @@
+"""Contains the LiteCache class"""
+import itertools
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pylite import LiteConnection
+
+
+class LiteCache:
+    """An LRU cache of query results, keyed by SQL string and values.
+
+    Each entry records the version of the tables it read. LiteTable bumps a table's
+    version whenever it writes to the table, so entries are invalidated precisely by
+    writes made through LiteTable, LiteModel and LiteCollection. Writes made by other
+    connections or processes are caught by checking PRAGMA data_version, if enabled.
+    Since it doesn't tell which tables changed, such a write invalidates every result
+    cached from the database.
+
+    Usage:
+        Lite.enable_query_cache(max_entries=1024, ttl=60)
+        Person.where("status").is_equal_to("active").all()  # Queries the database
+        Person.where("status").is_equal_to("active").all()  # Served from the cache
+    """
+
+    # {(database_key, table_name): version}, bumped by LiteTable writes
+    TABLE_VERSIONS = {}
+
+    # {LiteConnection: number}, naming the private in-memory database of a connection
+    MEMORY_DATABASE_KEYS = weakref.WeakKeyDictionary()
+    _memory_database_numbers = itertools.count(1)
+
+    # Open LiteSharedCache instances, whose versions are shared across processes
+    SHARED_CACHES = weakref.WeakSet()
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = None,
+        max_rows: int = 10000,
+        check_data_version: bool = False,
+    ) -> None:
+        """LiteCache initializer.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached results, beyond which
+                the least recently used are evicted. Defaults to 1024.
+            ttl (float, optional): Seconds after which results expire. Defaults to None.
+            max_rows (int, optional): Results with more rows aren't cached.
+                Defaults to 10000.
+            check_data_version (bool, optional): Check PRAGMA data_version before each
+                hit, to catch writes from other connections. Such writes invalidate
+                every result cached from the database. Defaults to False.
+        """
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.check_data_version = check_data_version
+
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        # {LiteConnection: data_version} as last checked, and
+        # {database_key: generation}, bumped when a data_version changes
+        self._data_versions = weakref.WeakKeyDictionary()
+        self._database_generations = {}
+
+    @staticmethod
+    def database_key(lite_connection: LiteConnection) -> str:
+        """Returns the name under which results from a connection's database are cached.
+        Files are named by absolute path, so every path to a file shares its results.
+        Private in-memory databases are named per connection, since each connection
+        opens a database of its own.
+
+        Args:
+            lite_connection (LiteConnection): Connection to the database
+
+        Returns:
+            str: Database key
+        """
+
+        database_path = lite_connection.database_path
+        if LiteConnection.is_memory_database(database_path):
+            if "cache=shared" in database_path:
+                return database_path
+
+            keys = LiteCache.MEMORY_DATABASE_KEYS
+            if lite_connection not in keys:
+                keys[lite_connection] = next(LiteCache._memory_database_numbers)
+            return f":memory:{os.getpid()}:{keys[lite_connection]}"
+
+        return os.path.abspath(LiteConnection.database_file(database_path))
+
+    @staticmethod
+    def bump_table_version(lite_connection: LiteConnection, table_name: str) -> None:
+        """Invalidates cached results that read from a table.
+
+        Args:
+            lite_connection (LiteConnection): Connection to the database containing
+                the table
+            table_name (str): Name of the table
+        """
+
+        database_key = LiteCache.database_key(lite_connection)
+        key = (database_key, table_name)
+        LiteCache.TABLE_VERSIONS[key] = LiteCache.TABLE_VERSIONS.get(key, 0) + 1
+
+        # Notify other processes through shared caches
+        for shared_cache in list(LiteCache.SHARED_CACHES):
+            shared_cache.bump_shared_version(database_key, table_name)
+
+    @staticmethod
+    def _get_table_versions(database_key: str, table_names: list) -> tuple:
+        """Internal method. Returns the current versions of tables."""
+
+        return tuple(
+            LiteCache.TABLE_VERSIONS.get((database_key, table_name), 0)
+            for table_name in table_names
+        )
+
+    @staticmethod
+    def _read_data_version(lite_connection) -> int:
+        """Internal method. Reads PRAGMA data_version through a cursor of its own,
+        so it can't reset rows another thread is reading from the shared cursor."""
+
+        return lite_connection.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def _get_data_version(self, lite_connection) -> int:
+        """Internal method. Returns a generation of the database, bumped when
+        another connection commits to it, or None if not checked. Connections
+        checked for the first time may have missed earlier commits, so they bump it too.
+        """
+
+        if not self.check_data_version:
+            return None
+
+        data_version = self._read_data_version(lite_connection)
+        database_key = self.database_key(lite_connection)
+
+        with self._lock:
+            generations = self._database_generations
+            if self._data_versions.get(lite_connection) != data_version:
+                self._data_versions[lite_connection] = data_version
+                generations[database_key] = generations.get(database_key, 0) + 1
+            return generations[database_key]
+
+    def fetch(
+        self, lite_connection, table_names: list, sql_str: str, values: tuple = ()
+    ) -> list:
+        """Returns the rows of a query, from the cache if still valid.
+        Queries made within a transaction bypass the cache, since they may read
+        writes that are later rolled back.
+
+        Args:
+            lite_connection (LiteConnection): Connection to run the query on
+            table_names (list): Tables read by the query
+            sql_str (str): the query to execute
+            values (tuple, optional): the values to pass to the query. Defaults to ().
+
+        Returns:
+            list: Query results
+        """
+
+        if lite_connection.in_transaction():
+            return lite_connection.execute(sql_str, values).fetchall()
+
+        database_key = self.database_key(lite_connection)
+        key = (database_key, sql_str, tuple(values))
+        stamp = (
+            self._get_table_versions(database_key, table_names),
+            self._get_data_version(lite_connection),
+        )
+
+        rows = self._get(key, stamp)
+        if rows is not None:
+            return rows
+
+        rows = lite_connection.execute(sql_str, values).fetchall()
+        if len(rows) <= self.max_rows:
+            self._put(key, stamp, rows)
+
+        return rows
+
+    def _get(self, key: tuple, stamp: tuple) -> list:
+        """Internal method. Returns the cached rows of a query, or None if they're
+        missing, expired, or were cached with a different stamp."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, entry_stamp, rows = entry
+                fresh = expires is None or expires > time.monotonic()
+                if fresh and entry_stamp == stamp:
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return list(rows)
+
+                del self._entries[key]
+                self.stats["invalidations"] += 1
+
+            self.stats["misses"] += 1
+            return None
+
+    def _put(self, key: tuple, stamp: tuple, rows: list) -> None:
+        """Internal method. Caches the rows of a query, evicting the least recently
+        used results beyond max_entries."""
+
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires, stamp, tuple(rows))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Removes every cached result."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
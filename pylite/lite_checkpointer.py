@@ -0,0 +1,227 @@
+"""Contains the LiteCheckpointer class"""
+import queue
+import threading
+import time
+import warnings
+from concurrent.futures import Future
+from pylite import LiteConnection
+
+
+class LiteCheckpointer:
+    """Checkpoints a WAL-mode database from a background thread, on a schedule and
+    whenever the write-ahead log grows past a size threshold.
+
+    SQLite's automatic checkpoints are PASSIVE, so they can't reset the log while
+    readers still use it. Under sustained writes and long reads, the log then grows
+    without bound, slowing every read. Once the log is larger than `max_wal_size`,
+    the checkpointer escalates to `escalate_mode`, which waits for readers to finish
+    so the log can be reset.
+
+    Usage:
+        checkpointer = lite_connection.start_checkpointer(interval=5)
+        print(checkpointer.metrics)
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        interval: float = 1.0,
+        mode: str = "PASSIVE",
+        max_wal_size: int = 64 * 1024 * 1024,
+        escalate_mode: str = "TRUNCATE",
+        on_blocked=None,
+        busy_timeout: int = 1000,
+    ) -> None:
+        """LiteCheckpointer initializer. Opens its own connection on the background thread.
+
+        Args:
+            database_path (str): Path to the database
+            interval (float, optional): Seconds between checkpoints. Defaults to 1.0.
+            mode (str, optional): Mode of scheduled checkpoints. Defaults to "PASSIVE".
+            max_wal_size (int, optional): Log size in bytes past which checkpoints
+                use `escalate_mode`. Defaults to 64 MiB.
+            escalate_mode (str, optional): Mode of checkpoints of an oversized log.
+                Defaults to "TRUNCATE".
+            on_blocked (callable, optional): Called with .metrics when readers or
+                writers prevent a checkpoint from completing, i.e. it's busy, or
+                a RESTART or TRUNCATE checkpoint leaves frames in the log.
+                PASSIVE checkpoints lagging behind writes are expected, and don't
+                call it. Defaults to issuing a RuntimeWarning.
+            busy_timeout (int, optional): Milliseconds RESTART and TRUNCATE checkpoints
+                wait for readers. Defaults to 1000.
+
+        Raises:
+            DatabaseNotFoundError: Database not found
+            ValueError: Unknown checkpoint mode, an in-memory database,
+                or a database not in WAL mode
+        """
+
+        for checkpoint_mode in (mode, escalate_mode):
+            if checkpoint_mode.upper() not in LiteConnection.CHECKPOINT_MODES:
+                raise ValueError(f'Unknown checkpoint mode "{checkpoint_mode}".')
+
+        if LiteConnection.database_file(database_path) is None:
+            raise ValueError("In-memory databases have no write-ahead log.")
+
+        self.interval = interval
+        self.mode = mode
+        self.max_wal_size = max_wal_size
+        self.escalate_mode = escalate_mode
+        self.on_blocked = on_blocked or self._warn_blocked
+
+        self.metrics = {
+            "checkpoints": 0,
+            "blocked": 0,
+            "wal_size": 0,
+            "log_frames": 0,
+            "checkpointed_frames": 0,
+            "lag_frames": 0,
+            "last_checkpoint": None,
+            "seconds": 0.0,
+            "errors": 0,
+        }
+
+        self._requests = queue.Queue()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._lock = threading.Lock()  # Orders requests queued against .close()
+
+        connected = Future()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(database_path, busy_timeout, connected),
+            name="pylite-checkpointer",
+            daemon=True,
+        )
+        self._thread.start()
+
+        # Re-raise connection errors in the calling thread
+        connected.result()
+
+    @staticmethod
+    def _warn_blocked(metrics: dict) -> None:
+        """Internal method. Default hook for checkpoints blocked by readers."""
+
+        warnings.warn(
+            f"WAL checkpoint blocked: {metrics['lag_frames']} frames remain "
+            f"in a {metrics['wal_size']} byte log. Long-running readers may be "
+            "holding it back.",
+            RuntimeWarning,
+        )
+
+    def _run(self, database_path: str, busy_timeout: int, connected: Future):
+        """Internal method. Body of the checkpointer thread."""
+
+        try:
+            # Leave the journal mode as the database's users set it
+            self.connection = LiteConnection(
+                database_path, wal=None, busy_timeout=busy_timeout
+            )
+        except Exception as exc:
+            connected.set_exception(exc)
+            return
+
+        journal_mode = self.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        if journal_mode.lower() != "wal":
+            self.connection.close()
+            connected.set_exception(
+                ValueError("LiteCheckpointer requires a database in WAL mode.")
+            )
+            return
+        connected.set_result(True)
+
+        while not self._stopping:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+            if self._requests.empty():
+                if not self._stopping:
+                    self._checkpoint_safely()
+                continue
+
+            while not self._requests.empty():
+                mode, future = self._requests.get()
+                try:
+                    future.set_result(self._checkpoint(mode))
+                except Exception as exc:
+                    future.set_exception(exc)
+
+        while not self._requests.empty():
+            self._requests.get()[1].set_exception(
+                RuntimeError("This LiteCheckpointer has been closed.")
+            )
+
+        self.connection.close()
+
+    def _checkpoint(self, mode: str = None) -> dict:
+        """Internal method. Runs a checkpoint on the checkpointer thread,
+        escalating its mode if the log is oversized, and updates .metrics."""
+
+        wal_size = self.connection.wal_size()
+        if mode is None:
+            mode = self.escalate_mode if wal_size > self.max_wal_size else self.mode
+
+        started = time.perf_counter()
+        result = self.connection.checkpoint(mode)
+
+        lag_frames = max(result["log_frames"] - result["checkpointed_frames"], 0)
+        self.metrics.update(
+            {
+                "checkpoints": self.metrics["checkpoints"] + 1,
+                "wal_size": self.connection.wal_size(),
+                "log_frames": result["log_frames"],
+                "checkpointed_frames": result["checkpointed_frames"],
+                "lag_frames": lag_frames,
+                "last_checkpoint": time.time(),
+                "seconds": self.metrics["seconds"] + time.perf_counter() - started,
+            }
+        )
+
+        # PASSIVE checkpoints don't wait for readers, so normally lag under writes
+        escalated = mode.upper() in ("RESTART", "TRUNCATE")
+        if result["busy"] or (escalated and lag_frames):
+            self.metrics["blocked"] += 1
+            self.on_blocked(dict(self.metrics))
+
+        return result
+
+    def _checkpoint_safely(self) -> None:
+        """Internal method. Runs a scheduled checkpoint. Errors, e.g. a locked database,
+        are counted and the checkpoint is retried on the next interval."""
+
+        try:
+            self._checkpoint()
+        except Exception:
+            self.metrics["errors"] += 1
+
+    def checkpoint(self, mode: str = None) -> dict:
+        """Runs a checkpoint now, on the checkpointer thread, and waits for it.
+
+        Args:
+            mode (str, optional): Checkpoint mode. Defaults to the scheduled mode,
+                or `escalate_mode` if the log is oversized.
+
+        Raises:
+            RuntimeError: The checkpointer has been closed.
+
+        Returns:
+            dict: See LiteConnection.checkpoint()
+        """
+
+        with self._lock:
+            if self._stopping or not self._thread.is_alive():
+                raise RuntimeError("This LiteCheckpointer has been closed.")
+
+            future = Future()
+            self._requests.put((mode, future))
+        self._wake.set()
+        return future.result()
+
+    def close(self) -> None:
+        """Stops the checkpointer thread and closes its connection."""
+
+        with self._lock:
+            self._stopping = True
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join()
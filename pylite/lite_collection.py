@@ -13,6 +13,7 @@ class LiteCollection:
 
     def __init__(self, model_instances=None):
         self.list = []
+        self._refreshed_at = None  # Database time of the last fresh(). Used by delta
         if model_instances:
             for instance in model_instances:
                 self.add(instance)
@@ -118,8 +119,8 @@ class LiteCollection:
             RelationshipError: Relationship already exists.
         """
 
-        for model in self.list:
-            model.attach_many(model_instances)
+        if self.list:
+            self.list[0]._attach_pairs(self.list, model_instances)
 
     def detach_many_from_all(self, model_instances) -> None:
         """Detaches a list of model instances from all the model instances in the collection.
@@ -134,8 +135,8 @@ class LiteCollection:
             RelationshipError: Relationship does not exist.
         """
 
-        for model in self.list:
-            model.detach_many(model_instances)
+        if self.list:
+            self.list[0]._detach_pairs(self.list, model_instances)
 
     def attach_to_all(
         self, model_instance, self_fkey: str = None, model_fkey: str = None
@@ -149,8 +150,11 @@ class LiteCollection:
             RelationshipError: Relationship already exists.
         """
 
-        for model in self.list:
-            model.attach(model_instance, self_fkey, model_fkey)
+        if self_fkey or model_fkey:
+            for model in self.list:
+                model.attach(model_instance, self_fkey, model_fkey)
+        elif self.list:
+            self.list[0]._attach_pairs(self.list, [model_instance])
 
     def detach_from_all(self, model_instance) -> None:
         """
@@ -164,8 +168,8 @@ class LiteCollection:
                 that points to this model instance (default is None).
         """
 
-        for model in self.list:
-            model.detach(model_instance)
+        if self.list:
+            self.list[0]._detach_pairs(self.list, [model_instance])
 
     def first(self) -> "LiteModel":
         """Returns the first model instance in the collection."""
@@ -188,11 +192,132 @@ class LiteCollection:
         self.list.sort(key=lambda x: getattr(x, field), reverse=reverse)
         return self
 
-    def fresh(self) -> None:
-        """Retrieves a fresh copy of each model instance in the collection from the database."""
+    def fresh(self, delta: bool = False) -> list:
+        """Retrieves a fresh copy of each model instance in the collection from the database,
+        selecting their rows in chunks of ids rather than one at a time. Model instances
+        whose rows were deleted are removed from the collection.
 
+        With delta, only the 'id' and 'updated' fields are selected, and only rows updated
+        since they were loaded, or since the collection was last refreshed, are reloaded.
+        The first refresh of a collection reloads every row. Writes made without PyLite
+        that don't set the 'updated' field are missed.
+
+        Args:
+            delta (bool, optional): Only reload rows that were updated. Defaults to False.
+
+        Returns:
+            list: Model instances removed from the collection
+        """
+
+        models = {}
         for model in self.list:
-            model.fresh()
+            if model.id is not None:
+                models.setdefault(model.id, []).append(model)
+        if not models:
+            return []
+
+        table = self.list[0].table
+        columns = self.list[0].table_columns
+        ids = [(model_id,) for model_id in models]
+
+        # Rows updated within the same second as the last refresh may have been missed
+        refreshed_at = self._refreshed_at
+        self._refreshed_at = table.connection.execute(
+            "SELECT CURRENT_TIMESTAMP"
+        ).fetchone()[0]
+
+        # Deferred columns are left out again, and reloaded on access
+        model_class = type(self.list[0])
+        loaded_columns = model_class._get_loaded_columns(columns)
+        select_columns = ["*"]
+        if loaded_columns != columns:
+            select_columns = [f'"{column}"' for column in loaded_columns]
+
+        if delta and refreshed_at and "updated" in columns:
+            timestamps = dict(table.select_many(["id"], ids, ["id", "updated"]))
+            found_ids = set(timestamps)
+            ids = [
+                (model_id,)
+                for model_id, updated in timestamps.items()
+                if updated is None
+                or updated >= refreshed_at
+                or any(model.updated != updated for model in models[model_id])
+            ]
+            rows = table.select_many(["id"], ids, select_columns) if ids else []
+        else:
+            rows = table.select_many(["id"], ids, select_columns)
+            found_ids = {row[loaded_columns.index("id")] for row in rows}
+
+        if loaded_columns != columns:
+            rows = [
+                model_class._expand_row(columns, loaded_columns, row) for row in rows
+            ]
+
+        for row in rows:
+            for model in models[row[columns.index("id")]]:
+                model._load_values(columns, row)
+                model._mark_saved()
+
+        removed_ids = models.keys() - found_ids
+        removed = [model for model in self.list if model.id in removed_ids]
+        self.list = [model for model in self.list if model.id not in removed_ids]
+        return removed
+
+    def load(self, *column_names) -> None:
+        """Loads deferred columns for every model instance in the collection,
+        selecting their values in chunks of ids rather than one at a time.
+        See LiteQuery.defer().
+
+        Usage:
+            documents = Document.where("author_id").is_equal_to(5).defer("body").all()
+            documents.load("body")
+
+        Args:
+            *column_names (str): Deferred columns to load
+        """
+
+        models = {}
+        for model in self.list:
+            if any(model._is_deferred(column) for column in column_names):
+                models.setdefault(model.id, []).append(model)
+        if not models:
+            return
+
+        rows = self.list[0].table.select_many(
+            ["id"],
+            [(model_id,) for model_id in models],
+            ["id"] + [f'"{column}"' for column in column_names],
+        )
+        for row in rows:
+            for model in models[row[0]]:
+                for column, value in zip(column_names, row[1:]):
+                    if model._is_deferred(column):
+                        model._load_deferred_value(column, value)
+
+    def save_all(self) -> None:
+        """Saves changes to the model instances in the collection within a single
+        transaction. Only changed columns are written, and instances changing the same
+        columns are updated by a single prepared statement. Unsaved instances are created.
+        """
+
+        if not self.list:
+            return
+
+        table = self.list[0].table
+        updated_models = []
+        with table.connection.transaction():
+            rows = []
+            for model in self.list:
+                if model.id is None:
+                    model.save()
+                elif changed_columns := model._get_changed_columns():
+                    rows.append({"id": model.id, **changed_columns})
+                    updated_models.append(model)
+
+            table.update_rows(rows)
+
+        for model in updated_models:
+            model._mark_saved()
 
     def delete_all(self) -> None:
         """Deletes all model instances in the collection from the database."""
@@ -1,63 +1,610 @@
 """Contains the LiteConnection class and DB Enum"""
+import itertools
 import os
+import random
 import sqlite3
+import time
+from contextlib import contextmanager
+from urllib.parse import parse_qs, urlsplit
+from urllib.request import url2pathname
 from pylite import DatabaseNotFoundError
 
 
 class LiteConnection:
     """This class is used to create a connection to a database and execute queries."""
 
+    # Upper bound, in seconds, for the delay between retries of locked statements
+    MAX_RETRY_DELAY = 1.0
+
+    # PRAGMA settings that may be passed to the initializer or .set_pragmas()
+    PRAGMAS = [
+        "page_size",
+        "synchronous",
+        "cache_size",
+        "mmap_size",
+        "temp_store",
+        "busy_timeout",
+        "wal_autocheckpoint",
+        "foreign_keys",
+    ]
+
+    # Named PRAGMA profiles, applied with the `profile` argument or .use_profile()
+    PROFILES = {
+        "default": {},
+        "durable": {
+            "synchronous": "FULL",
+            "busy_timeout": 5000,
+        },
+        "bulk_load": {
+            "synchronous": "OFF",
+            "cache_size": -262144,  # 256 MiB
+            "temp_store": "MEMORY",
+            "wal_autocheckpoint": 0,
+        },
+        "read_heavy": {
+            "synchronous": "NORMAL",
+            "cache_size": -131072,  # 128 MiB
+            "mmap_size": 268435456,  # 256 MiB
+            "temp_store": "MEMORY",
+            "busy_timeout": 5000,
+        },
+    }
+
     def __init__(
-        self, database_path: str = None, isolation: bool = False, wal: bool = True
+        self,
+        database_path: str = None,
+        isolation: bool = False,
+        wal: bool = True,
+        profile: str = None,
+        retries: int = 0,
+        retry_delay: float = 0.01,
+        **pragmas,
     ) -> None:
+        """LiteConnection initializer.
+
+        Args:
+            database_path (str): Path to the database, ":memory:", or a "file:" URI.
+                See LiteConnection.memory_database() for shared in-memory databases.
+            isolation (bool, optional): Enable isolation. Defaults to False.
+            wal (bool, optional): Use WAL journal mode, or the rollback journal if
+                False. None leaves the journal mode unchanged. Defaults to True.
+                Ignored by in-memory databases.
+            profile (str, optional): Name of a PRAGMA profile from LiteConnection.PROFILES.
+            retries (int, optional): Times a statement or transaction is retried when
+                the database is locked. Defaults to 0.
+            retry_delay (float, optional): Initial delay in seconds between retries,
+                doubled after each attempt. Defaults to 0.01.
+            **pragmas: PRAGMA settings from LiteConnection.PRAGMAS,
+                overriding those of the profile. e.g. cache_size=-64000
+
+        Raises:
+            DatabaseNotFoundError: Database not found
+            ValueError: Unknown profile or PRAGMA
+        """
+
         self.database_path = database_path
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.lock_stats = {"lock_errors": 0, "retries": 0, "failures": 0, "waited": 0.0}
+
+        pragmas = {**self._get_profile(profile or "default"), **pragmas}
+        self._validate_pragmas(pragmas)
 
         # Raise an error if the database doesn't exist
-        if not os.path.exists(database_path):
-            raise DatabaseNotFoundError(database_path)
-        elif database_path is None:
+        if database_path is None:
             raise DatabaseNotFoundError("No database path provided.")
+        elif not self.database_exists(database_path):
+            raise DatabaseNotFoundError(database_path)
+
+        self.connection = self._connect(database_path, isolation)
+        self.cursor = self.connection.cursor()
+
+        # Depth of nested .transaction() blocks. Used to defer commits.
+        self._transaction_depth = 0
+        self._transaction_callbacks = []
+
+        # Page size must be set before switching to WAL mode
+        if "page_size" in pragmas:
+            self.set_pragmas(page_size=pragmas.pop("page_size"))
+
+        # Set journal mode. The result is fetched so the statement releases its lock.
+        if wal is not None:
+            self.cursor.execute(f"PRAGMA journal_mode={'wal' if wal else 'delete'};")
+            self.cursor.fetchall()
+
+        self.set_pragmas(**pragmas)
+
+    def _connect(self, database_path: str, isolation: bool) -> sqlite3.Connection:
+        """Internal method. Opens the underlying sqlite3 connection.
+
+        Args:
+            database_path (str): Path to the database
+            isolation (bool): Enable isolation
+        """
+
+        uri = self.is_uri(database_path)
 
         # Enable/disable isolation
         if isolation:
-            self.connection = sqlite3.connect(database_path)
-        else:
-            self.connection = sqlite3.connect(database_path, isolation_level=None)
+            return sqlite3.connect(database_path, uri=uri)
+        return sqlite3.connect(database_path, isolation_level=None, uri=uri)
 
-        self.cursor = self.connection.cursor()
+    @staticmethod
+    def memory_database(name: str) -> str:
+        """Returns the URI of a named in-memory database. Every connection opened with
+        the URI in this process shares the same database, which lives until the last
+        of them is closed. See Lite.create_database() to keep it alive without one.
+
+        Args:
+            name (str): Name of the database
+
+        Returns:
+            str: URI of the database
+        """
+
+        return f"file:{name}?mode=memory&cache=shared"
+
+    @staticmethod
+    def is_uri(database_path: str) -> bool:
+        """Checks if a database path is a "file:" URI.
+
+        Args:
+            database_path (str): Path to the database
+
+        Returns:
+            bool
+        """
+
+        return database_path.startswith("file:")
+
+    @staticmethod
+    def _parse_uri(database_path: str) -> tuple[str, dict]:
+        """Internal method. Splits a "file:" URI into its path and query parameters."""
+
+        parts = urlsplit(database_path)
+        params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        return url2pathname(parts.path), params
+
+    @staticmethod
+    def is_memory_database(database_path: str) -> bool:
+        """Checks if a database path refers to an in-memory database.
+
+        Args:
+            database_path (str): Path to the database
+
+        Returns:
+            bool
+        """
+
+        if database_path in (":memory:", ""):
+            return True
+
+        if LiteConnection.is_uri(database_path):
+            path, params = LiteConnection._parse_uri(database_path)
+            return path == ":memory:" or params.get("mode") == "memory"
+
+        return False
+
+    @staticmethod
+    def database_file(database_path: str) -> str:
+        """Returns the file backing a database, or None for in-memory databases.
+
+        Args:
+            database_path (str): Path to the database
+
+        Returns:
+            str: Path to the database file
+        """
 
-        # Set journal mode
-        self.cursor.execute(f"PRAGMA journal_mode={'wal' if wal else 'delete'};")
+        if LiteConnection.is_memory_database(database_path):
+            return None
+
+        if LiteConnection.is_uri(database_path):
+            return LiteConnection._parse_uri(database_path)[0]
+
+        return database_path
+
+    @staticmethod
+    def database_exists(database_path: str) -> bool:
+        """Checks if a database can be opened. In-memory databases, and URIs
+        that ask SQLite to create the file ("mode=rwc"), always can.
+
+        Args:
+            database_path (str): Path to the database
+
+        Returns:
+            bool
+        """
+
+        database_file = LiteConnection.database_file(database_path)
+        if database_file is None:
+            return True
+
+        if LiteConnection.is_uri(database_path):
+            if LiteConnection._parse_uri(database_path)[1].get("mode") == "rwc":
+                return True
+
+        return os.path.exists(database_file)
 
     class ExecuteResult:
         """An instance of this class is returned by a call to LiteConnection.execute().
         It includes modifier methods that can be stringed onto
         the .execute() call to commit or fetch.
+
+        Each result is bound to its own cursor, so rows can be streamed by iterating
+        over the result while other queries run on the same connection.
+
+        Usage:
+            with lite_connection.execute("SELECT * FROM people") as result:
+                for row in result:
+                    ...
         """
 
-        def __init__(self, lite_connection: "LiteConnection") -> None:
+        def __init__(
+            self, lite_connection: "LiteConnection", cursor: sqlite3.Cursor = None
+        ) -> None:
             self.outer = lite_connection
+            self.cursor = cursor or lite_connection.cursor
+
+        def __iter__(self):
+            return iter(self.cursor)
+
+        def __enter__(self) -> "LiteConnection.ExecuteResult":
+            return self
+
+        def __exit__(self, *_) -> None:
+            self.close()
 
         def commit(self) -> None:
-            """Commits changes made by .execute() to the database."""
+            """Commits changes made by .execute() to the database.
+            Inside a .transaction() block, the commit is deferred until the block exits.
+            """
 
-            self.outer.connection.commit()
+            if self.outer._transaction_depth == 0:
+                self.outer.connection.commit()
+                self.outer._run_transaction_callbacks()
 
         def fetchall(self) -> list[tuple[any, ...]]:
             """Makes a fetchall call to the database using the query passed to .execute()."""
 
-            return self.outer.cursor.fetchall()
+            return self.cursor.fetchall()
 
         def fetchone(self) -> tuple[any, ...]:
             """Makes a fetchone call to the database using the query passed to .execute()."""
 
-            return self.outer.cursor.fetchone()
+            return self.cursor.fetchone()
+
+        def fetchmany(self, size: int = None) -> list[tuple[any, ...]]:
+            """Fetches the next rows of the query passed to .execute().
+
+            Args:
+                size (int, optional): Maximum number of rows. Defaults to the
+                    cursor's arraysize.
+            """
+
+            return self.cursor.fetchmany(size or self.cursor.arraysize)
+
+        @property
+        def rowcount(self) -> int:
+            """Number of rows modified by the query, or -1 for SELECT queries."""
+
+            return self.cursor.rowcount
+
+        @property
+        def lastrowid(self) -> int:
+            """Row id of the last row inserted by the query."""
+
+            return self.cursor.lastrowid
+
+        def close(self) -> None:
+            """Closes the result's cursor, discarding any rows not yet fetched."""
+
+            if self.cursor is not self.outer.cursor:
+                self.cursor.close()
+
+    def _get_profile(self, profile: str) -> dict:
+        """Internal method. Returns the PRAGMA settings of a named profile.
+
+        Raises:
+            ValueError: Unknown profile
+        """
+
+        if profile not in self.PROFILES:
+            raise ValueError(f'Unknown PRAGMA profile "{profile}".')
+        return self.PROFILES[profile]
+
+    def _validate_pragmas(self, pragmas: dict) -> None:
+        """Internal method. Ensures PRAGMA names and values are safe to format into SQL.
+
+        Raises:
+            ValueError: Unknown PRAGMA or invalid value
+        """
+
+        for name, value in pragmas.items():
+            if name not in self.PRAGMAS:
+                raise ValueError(f'Unsupported PRAGMA "{name}".')
+            if not isinstance(value, int) and not str(value).isalnum():
+                raise ValueError(f'Invalid value for PRAGMA "{name}": {value}')
+
+    def set_pragmas(self, **pragmas) -> None:
+        """Applies PRAGMA settings to the connection.
+
+        Args:
+            **pragmas: PRAGMA settings from LiteConnection.PRAGMAS. e.g. synchronous="NORMAL"
+
+        Raises:
+            ValueError: Unknown PRAGMA or invalid value
+        """
+
+        self._validate_pragmas(pragmas)
+
+        # Apply in the order of LiteConnection.PRAGMAS, so page_size comes first
+        for name in self.PRAGMAS:
+            if name in pragmas:
+                self.cursor.execute(f"PRAGMA {name} = {pragmas[name]}")
+                self.cursor.fetchall()
+
+    def get_pragmas(self, *names: str) -> dict:
+        """Returns the current value of PRAGMA settings.
+
+        Args:
+            *names (str): PRAGMA names. Defaults to all of LiteConnection.PRAGMAS.
+
+        Returns:
+            dict: {pragma_name: value}
+        """
+
+        self._validate_pragmas({name: 0 for name in names})
+        return {
+            name: self.cursor.execute(f"PRAGMA {name}").fetchone()[0]
+            for name in names or self.PRAGMAS
+        }
+
+    def apply_profile(self, profile: str, **pragmas) -> None:
+        """Applies a named PRAGMA profile to the connection.
+
+        Args:
+            profile (str): Name of a profile from LiteConnection.PROFILES
+            **pragmas: PRAGMA settings overriding those of the profile
+        """
+
+        self.set_pragmas(**{**self._get_profile(profile), **pragmas})
+
+    @contextmanager
+    def use_profile(self, profile: str = "bulk_load", **pragmas):
+        """Temporarily applies a named PRAGMA profile,
+        restoring the previous settings when the block exits.
+
+        Usage:
+            with lite_connection.use_profile("bulk_load"):
+                ...
+
+        Args:
+            profile (str, optional): Name of a profile. Defaults to "bulk_load".
+            **pragmas: PRAGMA settings overriding those of the profile
+        """
+
+        pragmas = {**self._get_profile(profile), **pragmas}
+        previous = self.get_pragmas(*pragmas)
+
+        self.set_pragmas(**pragmas)
+        try:
+            yield self
+        finally:
+            self.set_pragmas(**previous)
 
     def close(self) -> None:
-        """Closes the connection to the database."""
+        """Closes the connection to the database, stopping its checkpointer if started."""
+
+        if getattr(self, "checkpointer", None):
+            self.checkpointer.close()
+            self.checkpointer = None
 
         self.connection.close()
 
+    # Modes accepted by PRAGMA wal_checkpoint
+    CHECKPOINT_MODES = ["PASSIVE", "FULL", "RESTART", "TRUNCATE"]
+
+    def checkpoint(self, mode: str = "PASSIVE") -> dict:
+        """Copies frames from the write-ahead log back into the database file.
+
+        Args:
+            mode (str, optional): One of LiteConnection.CHECKPOINT_MODES.
+                PASSIVE never waits for readers or writers; RESTART and TRUNCATE wait,
+                up to busy_timeout, so the log can be reset (TRUNCATE also empties
+                the file). Defaults to "PASSIVE".
+
+        Raises:
+            ValueError: Unknown mode
+
+        Returns:
+            dict: {"busy": bool, "log_frames": int, "checkpointed_frames": int}
+                Frames are -1 if the database is not in WAL mode.
+        """
+
+        mode = mode.upper()
+        if mode not in self.CHECKPOINT_MODES:
+            raise ValueError(f'Unknown checkpoint mode "{mode}".')
+
+        busy, log_frames, checkpointed_frames = self.cursor.execute(
+            f"PRAGMA wal_checkpoint({mode})"
+        ).fetchone()
+
+        return {
+            "busy": bool(busy),
+            "log_frames": log_frames,
+            "checkpointed_frames": checkpointed_frames,
+        }
+
+    def wal_size(self) -> int:
+        """Returns the size in bytes of the write-ahead log file,
+        or 0 if there is none.
+
+        Returns:
+            int
+        """
+
+        database_file = self.database_file(self.database_path)
+        if database_file is None or not os.path.exists(f"{database_file}-wal"):
+            return 0
+        return os.path.getsize(f"{database_file}-wal")
+
+    def start_checkpointer(self, **options):
+        """Starts a LiteCheckpointer for the database, stopped when this
+        connection is closed. See LiteCheckpointer for options.
+
+        Returns:
+            LiteCheckpointer
+        """
+
+        from pylite.lite_checkpointer import LiteCheckpointer
+
+        if getattr(self, "checkpointer", None):
+            self.checkpointer.close()
+
+        self.checkpointer = LiteCheckpointer(self.database_path, **options)
+        return self.checkpointer
+
+    def backup_to(
+        self,
+        target: "str | LiteConnection",
+        pages_per_step: int = 256,
+        pause: float = 0,
+        progress=None,
+    ) -> dict:
+        """Copies the database to another database while it remains in use.
+        Pages are copied in steps, and the source is only locked during a step,
+        so writers may proceed between steps.
+
+        Args:
+            target (str | LiteConnection): Path to, or connection to, the target database.
+                Its contents are replaced.
+            pages_per_step (int, optional): Pages copied per step, or -1 to copy the
+                whole database in one step. Defaults to 256.
+            pause (float, optional): Seconds to sleep between steps. Defaults to 0.
+            progress (callable, optional): Called after each step with the number of
+                pages copied so far and the total number of pages.
+
+        Returns:
+            dict: Number of pages and steps, duration in seconds, and pages per second
+        """
+
+        stats = {"pages": 0, "steps": 0, "seconds": 0.0, "pages_per_second": 0.0}
+
+        def _step(_, remaining, total):
+            stats["pages"] = total
+            stats["steps"] += 1
+            if progress:
+                progress(total - remaining, total)
+            if remaining:
+                # Also releases the GIL, letting other threads write between steps
+                time.sleep(pause)
+
+        if isinstance(target, LiteConnection):
+            target_connection = target.connection
+        else:
+            target_connection = sqlite3.connect(target, uri=self.is_uri(target))
+
+        started = time.perf_counter()
+        try:
+            self.connection.backup(
+                target_connection, pages=pages_per_step, progress=_step
+            )
+        finally:
+            if not isinstance(target, LiteConnection):
+                target_connection.close()
+
+        stats["seconds"] = time.perf_counter() - started
+        if stats["seconds"] > 0:
+            stats["pages_per_second"] = stats["pages"] / stats["seconds"]
+
+        return stats
+
+    def snapshot_in_memory(
+        self, pages_per_step: int = 256, pause: float = 0, progress=None
+    ) -> "LiteConnection":
+        """Copies the database into a new private in-memory database. Long reads made on
+        the snapshot don't hold back checkpoints or lock the database file.
+        See .backup_to() for arguments. The copy's stats are saved in the snapshot's
+        .backup_stats attribute.
+
+        Returns:
+            LiteConnection: Connection to the snapshot
+        """
+
+        # An in-memory target must have the same page size as its source
+        page_size = self.get_pragmas("page_size")["page_size"]
+        snapshot = LiteConnection(":memory:", page_size=page_size)
+
+        snapshot.backup_stats = self.backup_to(
+            snapshot, pages_per_step, pause, progress
+        )
+        return snapshot
+
+    @contextmanager
+    def transaction(self, immediate: bool = False):
+        """Groups the statements executed within the block into a single transaction.
+        Commits when the block exits, or rolls back if an exception is raised.
+        Nested blocks are implemented with savepoints.
+
+        Usage:
+            with lite_connection.transaction():
+                ...
+
+        Args:
+            immediate (bool, optional): Acquire the write lock when the transaction
+                begins, rather than on its first write. Defaults to False.
+        """
+
+        depth = self._transaction_depth
+        savepoint = f"lite_savepoint_{depth}"
+
+        if depth > 0 or self.connection.in_transaction:
+            self.cursor.execute(f"SAVEPOINT {savepoint}")
+        else:
+            self.cursor.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            savepoint = None
+
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if savepoint:
+                self.cursor.execute(f"ROLLBACK TO {savepoint}")
+                self.cursor.execute(f"RELEASE {savepoint}")
+            else:
+                self.connection.rollback()
+                self._run_transaction_callbacks()
+            raise
+
+        self._transaction_depth -= 1
+        if savepoint:
+            self.cursor.execute(f"RELEASE {savepoint}")
+        else:
+            self.connection.commit()
+            self._run_transaction_callbacks()
+
+    def after_transaction(self, callback) -> None:
+        """Calls a function once the current transaction is committed or rolled back,
+        or immediately if no transaction is open.
+
+        Args:
+            callback (callable): Function to call, without arguments
+        """
+
+        if self.in_transaction():
+            self._transaction_callbacks.append(callback)
+        else:
+            callback()
+
+    def _run_transaction_callbacks(self) -> None:
+        """Internal method. Calls the functions registered by .after_transaction()."""
+
+        callbacks, self._transaction_callbacks = self._transaction_callbacks, []
+        for callback in callbacks:
+            callback()
+
     def execute(self, sql_str: str, values: tuple[any, ...] = ()) -> ExecuteResult:
         """Executes a query on the database.
 
@@ -69,5 +616,139 @@ class LiteConnection:
             ExecuteResult: an instance of the ExecuteResult class
         """
 
-        self.cursor.execute(sql_str, values)
-        return self.ExecuteResult(self)
+        cursor = self.connection.cursor()
+        if self.in_transaction():
+            # A lock error within a transaction requires retrying the whole transaction.
+            # See .run_transaction()
+            cursor.execute(sql_str, values)
+        else:
+            self._retry_if_locked(cursor.execute, sql_str, values)
+
+        return self.ExecuteResult(self, cursor)
+
+    def execute_many(self, sql_str: str, values_list, chunk_size: int = 1000) -> int:
+        """Executes a statement once for each set of values, within a single transaction.
+        Values are passed to SQLite in chunks, so they may be a generator.
+
+        Args:
+            sql_str (str): the statement to execute
+            values_list (iterable): [(value,..),..] one tuple per execution
+            chunk_size (int, optional): Executions per executemany() call.
+                Defaults to 1000.
+
+        Returns:
+            int: Number of rows modified
+        """
+
+        def _execute_chunks():
+            rowcount = 0
+            cursor = self.connection.cursor()
+            values_iter = iter(values_list)
+            while chunk := list(itertools.islice(values_iter, chunk_size)):
+                cursor.executemany(sql_str, chunk)
+                rowcount += max(cursor.rowcount, 0)
+            cursor.close()
+            return rowcount
+
+        return self.run_transaction(_execute_chunks)
+
+    def execute_script(self, sql_script: str) -> None:
+        """Executes a script of semicolon-separated statements within a single transaction.
+        The script shouldn't begin or commit transactions itself.
+
+        Args:
+            sql_script (str): the statements to execute
+        """
+
+        def _execute_statements():
+            cursor = self.connection.cursor()
+            for statement in self._split_script(sql_script):
+                cursor.execute(statement)
+            cursor.close()
+
+        self.run_transaction(_execute_statements)
+
+    @staticmethod
+    def _split_script(sql_script: str) -> list:
+        """Internal method. Splits a script into complete statements,
+        keeping semicolons within strings and trigger bodies."""
+
+        statements = []
+        statement = ""
+        for part in sql_script.split(";"):
+            statement += part + ";"
+            if sqlite3.complete_statement(statement):
+                statements.append(statement.strip())
+                statement = ""
+
+        if statement.strip(" \t\n;"):
+            statements.append(statement)
+        return statements
+
+    def in_transaction(self) -> bool:
+        """Checks if a transaction is open on the connection.
+
+        Returns:
+            bool
+        """
+
+        return self._transaction_depth > 0 or self.connection.in_transaction
+
+    def run_transaction(self, func, *args, **kwargs):
+        """Runs a function within an immediate transaction. If the database is locked,
+        the whole transaction is rolled back and retried, up to `retries` times.
+
+        Args:
+            func (callable): Function executing the transaction's statements.
+                It may run more than once, so it should only write to the database.
+
+        Returns:
+            The function's return value
+        """
+
+        def _attempt():
+            with self.transaction(immediate=True):
+                return func(*args, **kwargs)
+
+        if self.in_transaction():
+            return _attempt()
+        return self._retry_if_locked(_attempt)
+
+    @staticmethod
+    def _is_lock_error(exc: sqlite3.OperationalError) -> bool:
+        """Internal method. Checks if an error was caused by a locked database."""
+
+        error_code = getattr(exc, "sqlite_errorcode", None)
+        if error_code is not None:
+            return error_code & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+        return "locked" in str(exc)
+
+    def _retry_if_locked(self, func, *args, **kwargs):
+        """Internal method. Calls a function, retrying it with jittered exponential
+        backoff while the database is locked. Outside a transaction, a statement that
+        couldn't acquire its lock had no effect, so it is safe to run again.
+
+        Raises:
+            sqlite3.OperationalError: The database remained locked after every retry.
+        """
+
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except sqlite3.OperationalError as exc:
+                if not self._is_lock_error(exc):
+                    raise
+
+                self.lock_stats["lock_errors"] += 1
+                if attempt >= self.retries:
+                    self.lock_stats["failures"] += 1
+                    raise
+
+                delay = min(self.MAX_RETRY_DELAY, self.retry_delay * 2**attempt)
+                delay *= random.uniform(0.5, 1.0)
+
+                self.lock_stats["retries"] += 1
+                self.lock_stats["waited"] += delay
+                time.sleep(delay)
+                attempt += 1
@@ -1,7 +1,9 @@
 """Contains the LiteModel class definition"""
+import json
 import typing
 from pylite import Lite, LiteTable, LiteCollection, LiteConnection, LiteQuery
 from pylite.lite_exceptions import ModelInstanceNotFoundError, RelationshipError
+from pylite.lite_async import run_async
 
 
 class LiteModel:
@@ -17,6 +19,12 @@ class LiteModel:
     DEFAULT_CONNECTION = None  # Overridden by LiteModel.connect()
     CUSTOM_PIVOT_TABLES = {}  # Filled by calls to .pivots_with()
     PIVOT_TABLE_CACHE = {}  # Used by belongs_to_many()
+    HIERARCHY_TABLES = {}  # Filled by calls to .tracks_hierarchy()
+
+    # Columns left out when loading instances, and loaded on first access instead.
+    # Overridden by subclasses, and by LiteQuery.defer() and .only().
+    DEFERRED_COLUMNS = []
+    DEFERRED = object()  # Stands in for the values of deferred columns
 
     # Declare common class attributes
     id = None
@@ -43,8 +51,11 @@ class LiteModel:
             and self.table.table_name == other.table.table_name
             and self.table_columns == other.table_columns
         ):
+            # Deferred columns aren't loaded just to compare instances
             return all(
-                getattr(self, col) == getattr(other, col) for col in self.table_columns
+                getattr(self, col) == getattr(other, col)
+                for col in self.table_columns
+                if not self._is_deferred(col) and not other._is_deferred(col)
             )
         return False
 
@@ -248,26 +259,164 @@ class LiteModel:
         # Used by .get_foreign_key_column_for_model()
         self._foreign_key_map = self.table.get_foreign_key_references()
 
-        # Load model instance from database if an id is provided
+        # Stored values of columns decoded on first access. Used by .__getattr__()
+        self._raw_values = {}
+
+        # Load model instance from database if an id is provided.
+        # This also caches the table's JSON columns, so LiteWriter can save
+        # the instance from its own thread.
         columns = self.table.get_column_names()
         if _id is not None:
             if not _values:
-                _values = self.table.select_rows([["id", "=", _id]])
+                _values = self._select_row(self.table, _id, columns)
 
             # Add columns and values to python class instance as attributes
-            for col in enumerate(columns):
-                value = _values[0][col[0]]
-                setattr(self, col[1], value)
+            self._load_values(columns, _values[0])
 
             # Store list of all table column names. Used by .save()
         self.table_columns = columns
 
+        # Values as last loaded or saved. Used by ._get_changed_columns()
+        self._saved_values = {}
+        if _id is not None:
+            self._mark_saved()
+
+    def __getattr__(self, name: str):
+        """Loads the value of a deferred column, or decodes the stored value of
+        a column, e.g. JSON text or compressed values, on first access.
+        The value is then cached on the model instance."""
+
+        raw_values = self.__dict__.get("_raw_values")
+        if not raw_values or name not in raw_values:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        if raw_values[name] is self.DEFERRED:
+            rows = self.table.select_rows([["id", "=", self.id]], [name])
+            if not rows:
+                raise ModelInstanceNotFoundError(self.id)
+            self._load_deferred_value(name, rows[0][0])
+
+        raw_value = raw_values.pop(name)
+        value = self.table._decode_value(name, raw_value)
+        setattr(self, name, value)
+
+        # Decoding doesn't change the value. Only later changes should be saved.
+        if self.__dict__.get("_saved_values", {}).get(name) is raw_value:
+            self._saved_values[name] = self._get_saved_value(name)
+        return value
+
+    def _load_values(self, columns: list, values: tuple) -> None:
+        """Internal method. Sets the model instance's attributes from a table row.
+        Values of JSON and compressed columns are kept as stored, and decoded
+        on first access, as are deferred columns, which are loaded on first access."""
+
+        for column, value in zip(columns, values):
+            if value is self.DEFERRED or (
+                value is not None and self.table._is_encoded_column(column)
+            ):
+                self.__dict__.pop(column, None)
+                self._raw_values[column] = self._as_stored(column, value)
+            else:
+                setattr(self, column, value)
+
+    def _load_deferred_value(self, column: str, value) -> None:
+        """Internal method. Stores the loaded value of a deferred column,
+        to be decoded on first access. Used by LiteCollection.load()."""
+
+        value = self._as_stored(column, value)
+        self._raw_values[column] = value
+        if "_saved_values" in self.__dict__:
+            self._saved_values[column] = value
+
+    def _as_stored(self, column: str, value):
+        """Internal method. Marks JSON text read from a JSON column, and bytes read
+        from a compressed column, so they're saved as-is rather than encoded again."""
+
+        if isinstance(value, str) and column in self.table.get_json_columns():
+            return LiteTable.JSONText(value)
+        if isinstance(value, bytes) and column in LiteTable.COMPRESSED_COLUMNS.get(
+            self.table.table_name, {}
+        ):
+            return LiteTable.CompressedValue(value)
+        return value
+
+    def _is_deferred(self, column: str) -> bool:
+        """Internal method. Checks if a deferred column hasn't been loaded yet."""
+
+        return (
+            column not in self.__dict__
+            and self.__dict__.get("_raw_values", {}).get(column) is self.DEFERRED
+        )
+
+    @classmethod
+    def _get_loaded_columns(cls, columns: list, deferred_columns: list = None) -> list:
+        """Internal method. Returns the columns selected when loading instances,
+        leaving out deferred columns."""
+
+        if deferred_columns is None:
+            deferred_columns = cls.DEFERRED_COLUMNS
+
+        return [
+            column
+            for column in columns
+            if column not in deferred_columns or column == "id"
+        ]
+
+    @classmethod
+    def _expand_row(cls, columns: list, loaded_columns: list, row: tuple) -> tuple:
+        """Internal method. Expands a row of loaded columns into a full table row,
+        with DEFERRED standing in for the values of deferred columns."""
+
+        values = dict(zip(loaded_columns, row))
+        return tuple(values.get(column, cls.DEFERRED) for column in columns)
+
+    @classmethod
+    def _select_row(
+        cls, table: LiteTable, _id: int, columns: list = None, use_cache: bool = False
+    ) -> list:
+        """Internal method. Selects the row of an instance, leaving out deferred columns.
+
+        Args:
+            table (LiteTable): The model's table
+            _id (int): Id of model instance within database table
+            columns (list, optional): The table's columns. Only needed if the model
+                defers columns, and looked up if not passed. Defaults to None.
+            use_cache (bool, optional): Select through the query cache if enabled.
+                Defaults to False.
+
+        Returns:
+            list: [row] expanded into a full table row, or [] if not found
+        """
+
+        select_str = "*"
+        if cls.DEFERRED_COLUMNS:
+            columns = columns or table.get_column_names()
+            loaded_columns = cls._get_loaded_columns(columns)
+            select_str = ", ".join(f'"{column}"' for column in loaded_columns)
+
+        sql_str = f"SELECT {select_str} FROM {table.table_name} WHERE id = ?"
+        if use_cache and Lite.QUERY_CACHE is not None:
+            rows = Lite.QUERY_CACHE.fetch(
+                table.connection, [table.table_name], sql_str, (_id,)
+            )
+        else:
+            rows = table.connection.execute(sql_str, (_id,)).fetchall()
+
+        if cls.DEFERRED_COLUMNS:
+            rows = [cls._expand_row(columns, loaded_columns, row) for row in rows]
+        return rows
+
     @classmethod
     def requires_table(
         cls,
         columns: dict[str, str],
         foreign_keys: dict[str, list[str, str]] = None,
         lite_connection: LiteConnection = None,
+        fulltext: list = None,
+        json_indexes: list = None,
+        compressed: dict = None,
     ) -> None:
         """
         Creates a database table for the LiteModel if it doesn't exist.
@@ -280,13 +429,47 @@ class LiteModel:
             foreign_keys (dict, optional): {
                 column_name: [foreign_table_name, foreign_column_name]
             }
+            fulltext (list, optional): Text columns to index for full-text search,
+                searched with LiteQuery.matches(). Also indexes an existing table
+                without a full-text index. Defaults to None.
+            json_indexes (list, optional): [(column_name, path),..] Paths within JSON
+                columns to index, also created on an existing table. Defaults to None.
+            compressed (dict, optional): {column_name: "zlib" or "lzma"} Columns whose
+                values are compressed. See LiteTable.compress_columns().
+                Defaults to None.
         """
 
         if not hasattr(cls, "table_name"):
             cls.table_name = cls._get_table_name(cls)
 
+        if compressed:
+            LiteTable._check_fulltext_columns(
+                cls.table_name, fulltext or [], compressed
+            )
+            LiteTable.compress_columns(
+                cls.table_name, compressed, lite_connection=lite_connection
+            )
+
         if not LiteTable.exists(cls.table_name, lite_connection):
-            LiteTable.create(cls.table_name, columns, foreign_keys, lite_connection)
+            LiteTable.create(
+                cls.table_name,
+                columns,
+                foreign_keys,
+                lite_connection,
+                fulltext=fulltext,
+                json_indexes=json_indexes,
+            )
+            return
+
+        if fulltext and not LiteTable(
+            cls.table_name, lite_connection
+        ).get_fulltext_columns():
+            LiteTable.create_fulltext_index(cls.table_name, fulltext, lite_connection)
+
+        for column_name, path in json_indexes or []:
+            LiteTable.create_json_index(
+                cls.table_name, column_name, path, lite_connection
+            )
 
     @classmethod
     def find_or_fail(cls, _id: int) -> "LiteModel":
@@ -313,7 +496,7 @@ class LiteModel:
             table_name = cls.table_name
 
         table = LiteTable(table_name, lite_connection)
-        rows = table.select_rows([["id", "=", _id]])
+        rows = cls._select_row(table, _id, use_cache=True)
 
         if len(rows) > 0:
             return cls(id, table, rows, lite_connection)
@@ -363,6 +546,66 @@ class LiteModel:
                 collected_models.append(collected_model)
         return LiteCollection(collected_models)
 
+    @classmethod
+    def _get_connection(cls) -> LiteConnection:
+        """Internal method. Returns the connection used by this model class."""
+
+        if cls.DEFAULT_CONNECTION is not None:
+            return cls.DEFAULT_CONNECTION
+        return Lite.DEFAULT_CONNECTION
+
+    @classmethod
+    async def afind(cls, _id: int) -> "LiteModel":
+        """Async version of .find(). Runs on the executor thread of an AsyncLiteConnection.
+
+        Args:
+            id (int): Id of model instance within database table
+
+        Returns:
+            LiteModel: LiteModel with matching id or None
+        """
+
+        return await run_async(cls._get_connection(), cls.find, _id)
+
+    @classmethod
+    async def afind_or_fail(cls, _id: int) -> "LiteModel":
+        """Async version of .find_or_fail().
+
+        Args:
+            id (int): Id of model instance within database table
+
+        Raises:
+            ModelInstanceNotFoundError: Model does not exist in database.
+
+        Returns:
+            LiteModel: LiteModel with matching id
+        """
+
+        return await run_async(cls._get_connection(), cls.find_or_fail, _id)
+
+    @classmethod
+    async def aall(cls) -> LiteCollection:
+        """Async version of .all().
+
+        Returns:
+            LiteCollection: Collection of all model instances
+        """
+
+        return await run_async(cls._get_connection(), cls.all)
+
+    @classmethod
+    async def acreate(cls, column_values: dict) -> "LiteModel":
+        """Async version of .create().
+
+        Args:
+            column_values (dict): The initial values to be stored for this model instance.
+
+        Returns:
+            LiteModel: Created model instance.
+        """
+
+        return await run_async(cls._get_connection(), cls.create, column_values)
+
     @classmethod
     def where(cls, column_name: str) -> LiteQuery:
         """Returns a new LiteQuery instance.
@@ -376,6 +619,27 @@ class LiteModel:
 
         return LiteQuery(cls, column_name)
 
+    @classmethod
+    def where_json(cls, column_name: str, path: str) -> LiteQuery:
+        """Returns a new LiteQuery instance comparing a path within a JSON column.
+        Uses an index on the path if one exists. See LiteTable.create_json_index().
+
+        Usage:
+            Document.where_json("payload", "$.user.id").is_equal_to(5).all()
+
+        Args:
+            column_name (str): Name of JSON column to query
+            path (str): JSON path, e.g. '$.user.id'
+
+        Raises:
+            ValueError: Invalid JSON path
+
+        Returns:
+            LiteQuery: New LiteQuery instance
+        """
+
+        return LiteQuery(cls, column_name).json_path(path)
+
     @classmethod
     def create(cls, column_values: dict) -> "LiteModel":
         """Creates a new instance of a LiteModel and returns it.
@@ -396,22 +660,9 @@ class LiteModel:
         if hasattr(cls, "table_name"):
             table_name = cls.table_name
 
-        # Insert into table
+        # Insert into table, and load the inserted instance
         table = LiteTable(table_name, lite_connection)
-        table.insert_row(column_values)
-
-        # Get latest instance with this id
-        sql_str = f"""
-            SELECT id FROM {table_name} 
-            WHERE {list(column_values.keys())[0]} = ? 
-            ORDER BY id DESC
-        """
-
-        ids = table.connection.execute(
-            sql_str, (column_values[list(column_values.keys())[0]],)
-        ).fetchall()
-
-        return cls.find_or_fail(ids[0][0])
+        return cls.find_or_fail(table.insert_row(column_values))
 
     @classmethod
     def create_many(cls, column_list: list) -> LiteCollection:
@@ -427,6 +678,53 @@ class LiteModel:
         model_list = [cls.create(column_set) for column_set in column_list]
         return LiteCollection(model_list)
 
+    @classmethod
+    def update_many(cls, rows: list) -> int:
+        """Updates many model instances, keyed by id, with per-row values.
+        Rows changing the same columns are applied by a single prepared statement,
+        all within one transaction. See LiteTable.update_rows().
+
+        Args:
+            rows (list): [{"id": instance_id, column_name: value,..},..]
+
+        Raises:
+            ValueError: A row has no id
+
+        Returns:
+            int: Number of instances updated
+        """
+
+        table_name = Lite.HelperFunctions.pluralize_noun(cls.__name__.lower())
+        if hasattr(cls, "table_name"):
+            table_name = cls.table_name
+
+        table = LiteTable(table_name, cls._get_connection())
+        return table.update_rows(rows)
+
+    @classmethod
+    def upsert_many(
+        cls, rows: list, conflict_columns: list, update_columns: list = None
+    ) -> list:
+        """Creates model instances, or updates the existing instances they conflict with.
+        See LiteTable.upsert_rows().
+
+        Args:
+            rows (list): [{column_name: value,..},..]
+            conflict_columns (list): Columns of a unique index identifying existing instances
+            update_columns (list, optional): Columns updated on conflict.
+                Defaults to the rows' other columns.
+
+        Returns:
+            list: Ids of the created or updated instances, in the order of the passed rows
+        """
+
+        table_name = Lite.HelperFunctions.pluralize_noun(cls.__name__.lower())
+        if hasattr(cls, "table_name"):
+            table_name = cls.table_name
+
+        table = LiteTable(table_name, cls._get_connection())
+        return table.upsert_rows(rows, conflict_columns, update_columns)
+
     @classmethod
     def pivots_with(
         cls,
@@ -463,9 +761,39 @@ class LiteModel:
 
         cls.DEFAULT_CONNECTION = lite_connection
 
+    @classmethod
+    def tracks_hierarchy(
+        cls, table_name: str, lite_connection: LiteConnection = None
+    ) -> None:
+        """Maintains a closure table for the self-referential relationship of this model.
+        Once declared, .attach() and .detach() between two instances of this model
+        also update the closure table, making ancestry queries single indexed lookups.
+
+        `child.attach(parent)` places `child` directly below `parent`.
+
+        Args:
+            table_name (str): Name of the closure table. Created if it doesn't exist.
+            lite_connection (LiteConnection, optional):
+                Connection to the database storing the closure table.
+                Defaults to the model's connection.
+        """
+
+        if lite_connection is None:
+            if cls.DEFAULT_CONNECTION is not None:
+                lite_connection = cls.DEFAULT_CONNECTION
+            else:
+                lite_connection = Lite.DEFAULT_CONNECTION
+
+        cls.HIERARCHY_TABLES[cls.__name__] = [table_name, lite_connection]
+
+        if not LiteTable.exists(table_name, lite_connection):
+            LiteTable.create_closure(table_name, lite_connection)
+            cls().rebuild_hierarchy()
+
     def to_dict(self) -> dict:
         """Converts LiteModel instance into human-readable dict,
-        truncating string values if necessary.
+        truncating string values if necessary. Deferred columns that haven't
+        been loaded are left out, rather than loaded.
 
         Returns:
             dict: LiteModel attributes as dictionary
@@ -474,6 +802,9 @@ class LiteModel:
         print_dict = {}
 
         for column in self.table_columns:
+            if self._is_deferred(column):
+                continue
+
             attribute = getattr(self, column)
 
             if isinstance(attribute, bytes):
@@ -498,6 +829,24 @@ class LiteModel:
             RelationshipError: Relationship already exists.
         """
 
+        closure_table = self._get_hierarchy_table(model_instance)
+        if closure_table is None:
+            return self._attach(model_instance, self_fkey, model_fkey)
+
+        # Attach and update the closure table within the same transaction
+        with closure_table.connection.transaction():
+            self._check_hierarchy_link(closure_table, model_instance)
+            self._attach(model_instance, self_fkey, model_fkey)
+            self._link_hierarchy(closure_table, model_instance)
+
+        return True
+
+    def _attach(
+        self, model_instance: "LiteModel", self_fkey: str = None, model_fkey: str = None
+    ) -> None:
+        """Internal method. Defines a relationship between two model instances.
+        Called by .attach()."""
+
         try:
             pivot_table_name, lite_connection = self._get_pivot_name(model_instance)
         except (RelationshipError, AttributeError, TypeError):
@@ -506,21 +855,12 @@ class LiteModel:
         if pivot_table_name:  # Is a many-to-many relationship
             pivot_table = LiteTable(pivot_table_name, lite_connection)
 
-            # Derive foreign keys from pivot table
-            foreign_keys = pivot_table.get_foreign_key_references()
-
             # user should provide a self and model foreign keys if the pivot
             # table associates two rows from the *same* table
             if not self_fkey or not model_fkey:
-                if (
-                    model_instance.table_name == self.table_name
-                    and len(foreign_keys[self.table_name]) > 1
-                ):
-                    model_fkey = foreign_keys[model_instance.table_name][1][1]
-                else:
-                    model_fkey = foreign_keys[model_instance.table_name][0][1]
-
-                self_fkey = foreign_keys[self.table_name][0][1]
+                self_fkey, model_fkey = self._get_pivot_keys(
+                    pivot_table, model_instance
+                )
 
             # Make sure this relationship doesn't already exist
             relationships = pivot_table.select_rows(
@@ -573,18 +913,161 @@ class LiteModel:
 
         return True
 
-    def attach_many(self, model_instances: list["LiteModel"]) -> None:
+    def _get_pivot_keys(
+        self, pivot_table: LiteTable, model_instance: "LiteModel"
+    ) -> tuple[str, str]:
+        """Internal method. Derives the pivot table columns referencing
+        self and the passed model instance.
+
+        Returns:
+            tuple: (self foreign key, model foreign key)
+        """
+
+        foreign_keys = pivot_table.get_foreign_key_references()
+
+        if (
+            model_instance.table_name == self.table_name
+            and len(foreign_keys[self.table_name]) > 1
+        ):
+            model_fkey = foreign_keys[model_instance.table_name][1][1]
+        else:
+            model_fkey = foreign_keys[model_instance.table_name][0][1]
+
+        return foreign_keys[self.table_name][0][1], model_fkey
+
+    @staticmethod
+    def _group_pivot_pairs(
+        self_instances: list["LiteModel"], model_instances: list["LiteModel"]
+    ) -> tuple[dict, list]:
+        """Internal method. Groups every (self instance, model instance) pair by the
+        pivot table storing their relationship. The pivot table and its foreign keys are
+        resolved once per pair of model classes.
+
+        Returns:
+            tuple: (
+                {
+                    (pivot_table_name, self_fkey, model_fkey):
+                        [pivot_table, [(self_id, model_id),..]]
+                },
+                [(self_instance, model_instance),..] # Not stored in a pivot table
+            )
+        """
+
+        resolved = {}
+        pivot_pairs = {}
+        other_pairs = []
+
+        for self_instance in self_instances:
+            for model_instance in model_instances:
+                class_pair = (self_instance.__class__, model_instance.__class__)
+
+                if class_pair not in resolved:
+                    resolved[class_pair] = None
+                    try:
+                        pivot = self_instance._get_pivot_name(model_instance)
+                    except (AttributeError, TypeError):
+                        pivot = False
+
+                    # Hierarchies are maintained pair by pair, through .attach()
+                    if pivot and not self_instance._get_hierarchy_table(model_instance):
+                        pivot_table = LiteTable(*pivot)
+                        keys = self_instance._get_pivot_keys(pivot_table, model_instance)
+                        resolved[class_pair] = (pivot_table, (pivot[0], *keys))
+
+                if resolved[class_pair] is None:
+                    other_pairs.append((self_instance, model_instance))
+                    continue
+
+                pivot_table, key = resolved[class_pair]
+                pivot_pairs.setdefault(key, [pivot_table, {}])
+                pivot_pairs[key][1][(self_instance.id, model_instance.id)] = None
+
+        return (
+            {key: [table, list(pairs)] for key, (table, pairs) in pivot_pairs.items()},
+            other_pairs,
+        )
+
+    @staticmethod
+    def _attach_pairs(
+        self_instances: list["LiteModel"],
+        model_instances: list["LiteModel"],
+        or_ignore: bool = False,
+    ) -> None:
+        """Internal method. Attaches every model instance to every self instance.
+        Many-to-many relationships are inserted with multi-row statements.
+        All relationships, and the closure tables of hierarchies, are written
+        in a single transaction, so a failing pair leaves none attached.
+
+        Raises:
+            RelationshipError: Relationship already exists.
+        """
+
+        pivot_pairs, other_pairs = LiteModel._group_pivot_pairs(
+            self_instances, model_instances
+        )
+
+        with self_instances[0].table.connection.transaction():
+            for (_, self_fkey, model_fkey), (pivot_table, pairs) in pivot_pairs.items():
+                with pivot_table.connection.transaction():
+                    if not or_ignore and pivot_table.select_many(
+                        [self_fkey, model_fkey], pairs
+                    ):
+                        raise RelationshipError("This relationship already exists.")
+
+                    pivot_table.insert_many([self_fkey, model_fkey], pairs, or_ignore)
+
+            for self_instance, model_instance in other_pairs:
+                self_instance.attach(model_instance)
+
+    @staticmethod
+    def _detach_pairs(
+        self_instances: list["LiteModel"],
+        model_instances: list["LiteModel"],
+        or_ignore: bool = False,
+    ) -> None:
+        """Internal method. Detaches every model instance from every self instance.
+        Many-to-many relationships are deleted with multi-row statements.
+        All relationships, and the closure tables of hierarchies, are written
+        in a single transaction, so a failing pair leaves none detached.
+
+        Raises:
+            RelationshipError: Relationship does not exist.
+        """
+
+        pivot_pairs, other_pairs = LiteModel._group_pivot_pairs(
+            self_instances, model_instances
+        )
+
+        with self_instances[0].table.connection.transaction():
+            for (_, self_fkey, model_fkey), (pivot_table, pairs) in pivot_pairs.items():
+                with pivot_table.connection.transaction():
+                    if not or_ignore and len(
+                        set(pivot_table.select_many([self_fkey, model_fkey], pairs))
+                    ) < len(pairs):
+                        raise RelationshipError(
+                            "Relationship does not exist. Cannot detach."
+                        )
+
+                    pivot_table.delete_many([self_fkey, model_fkey], pairs)
+
+            for self_instance, model_instance in other_pairs:
+                self_instance.detach(model_instance)
+
+    def attach_many(
+        self, model_instances: list["LiteModel"], or_ignore: bool = False
+    ) -> None:
         """Defines relationships between the current model instance and many model instances.
 
         Args:
             model_instances (list, LiteCollection): Model instances to attach to self.
+            or_ignore (bool, optional): Skip relationships that already exist,
+                rather than raising an error. Defaults to False.
 
         Raises:
             RelationshipError: Relationship already exists.
         """
 
-        for model_instance in model_instances:
-            self.attach(model_instance)
+        self._attach_pairs([self], model_instances, or_ignore)
 
     def detach(self, model_instance: "LiteModel") -> None:
         """Removes a relationship between two model instances.
@@ -596,6 +1079,21 @@ class LiteModel:
             RelationshipError: Relationship does not exist.
         """
 
+        closure_table = self._get_hierarchy_table(model_instance)
+        if closure_table is None:
+            return self._detach(model_instance)
+
+        # Detach and update the closure table within the same transaction
+        with closure_table.connection.transaction():
+            self._detach(model_instance)
+            self._unlink_hierarchy(closure_table, model_instance)
+
+        return True
+
+    def _detach(self, model_instance: "LiteModel") -> None:
+        """Internal method. Removes a relationship between two model instances.
+        Called by .detach()."""
+
         try:
             pivot_table_name, lite_connection = self._get_pivot_name(model_instance)
         except (AttributeError, TypeError):
@@ -636,17 +1134,7 @@ class LiteModel:
         pivot_table = LiteTable(pivot_table_name, lite_connection)
 
         # Derive foreign keys
-        foreign_keys = pivot_table.get_foreign_key_references()
-
-        model_fkey = (
-            foreign_keys[model_instance.table_name][1][1]
-            if (
-                model_instance.table_name == self.table_name
-                and len(foreign_keys[self.table_name]) > 1
-            )
-            else foreign_keys[model_instance.table_name][0][1]
-        )
-        self_fkey = foreign_keys[self.table_name][0][1]
+        self_fkey, model_fkey = self._get_pivot_keys(pivot_table, model_instance)
 
         # Make sure this relationship doesn't already exist
         if (
@@ -665,18 +1153,21 @@ class LiteModel:
 
         return True
 
-    def detach_many(self, model_instances: list["LiteModel"]) -> None:
+    def detach_many(
+        self, model_instances: list["LiteModel"], or_ignore: bool = False
+    ) -> None:
         """Removes relationships between the current model instance and many model instances.
 
         Args:
             model_instances (list, LiteCollection): Model instances to detach from self.
+            or_ignore (bool, optional): Skip relationships that don't exist,
+                rather than raising an error. Defaults to False.
 
         Raises:
             RelationshipError: Relationship does not exist.
         """
 
-        for model_instance in model_instances:
-            self.detach(model_instance)
+        self._detach_pairs([self], model_instances, or_ignore)
 
     def delete(self) -> None:
         """Deletes the current model instance.
@@ -691,6 +1182,9 @@ class LiteModel:
         # Take care of attachments that stick around after deleting the model instance
         self._clean_attachments()
 
+        if (closure_table := self._get_hierarchy_table(self)) is not None:
+            self._remove_from_hierarchy(closure_table)
+
         self.table.delete_rows([["id", "=", self.id]])
 
         for column in self.table_columns:
@@ -699,30 +1193,88 @@ class LiteModel:
     def save(self) -> None:
         """Saves any changes to model instance attributes."""
 
-        update_columns = {
-            column: getattr(self, column)
+        self._save_to(self.table)
+
+    def _save_to(self, table: LiteTable) -> None:
+        """Internal method. Saves the model instance's attributes through the passed table.
+        Called by .save() and LiteWriter.save()."""
+
+        update_columns = self._get_saved_columns()
+
+        if self.id is None:  # Create model if no id is provided
+            self.id = table.insert_row(update_columns)  # Id of inserted row
+        else:
+            table.update_row(update_columns, [["id", "=", self.id]])
+
+        self._mark_saved()
+
+    def _get_saved_columns(self) -> dict:
+        """Internal method. Returns the values of the columns written by .save()."""
+
+        return {
+            column: self._get_saved_value(column)
             for column in self.table_columns
             if column not in ["id", "created", "updated"]
+            and not self._is_deferred(column)
         }
 
-        if self.id is None:  # Create model if no id is provided
-            self.table.insert_row(update_columns)
-            self.id = (
-                self.__class__().all().sort("id").last().id
-            )  # Get id of last inserted row
-        else:
-            self.table.update_row(update_columns, [["id", "=", self.id]])
+    def _get_saved_value(self, column: str):
+        """Internal method. Returns the value of a column written by .save().
+        Values not yet decoded are written as stored, while values of JSON columns
+        are encoded here, so changes made in place are detected."""
+
+        if column not in self.__dict__ and column in self._raw_values:
+            return self._raw_values[column]
+
+        value = getattr(self, column)
+        if value is not None and column in self.table.get_json_columns():
+            return LiteTable.JSONText(json.dumps(value))
+        return value
+
+    def _get_changed_columns(self) -> dict:
+        """Internal method. Returns the values of the columns changed since the model
+        instance was last loaded or saved."""
+
+        return {
+            column: value
+            for column, value in self._get_saved_columns().items()
+            if column not in self._saved_values or self._saved_values[column] != value
+        }
+
+    def _mark_saved(self) -> None:
+        """Internal method. Records the model instance's values as saved."""
+
+        self._saved_values = self._get_saved_columns()
+
+    async def asave(self) -> None:
+        """Async version of .save()."""
+
+        await run_async(self.table.connection, self.save)
+
+    async def adelete(self) -> None:
+        """Async version of .delete().
+
+        Raises:
+            ModelInstanceNotFoundError: Model does not exist in database.
+        """
+
+        await run_async(self.table.connection, self.delete)
+
+    async def afresh(self) -> None:
+        """Async version of .fresh()."""
+
+        await run_async(self.table.connection, self.fresh)
 
     def fresh(self) -> None:
         """Reloads the model's attributes from the database."""
 
         # Load model instance from database by primary key
-        values = self.table.select_rows([["id", "=", self.id]])
+        values = self._select_row(self.table, self.id, self.table_columns)
 
         # Set attributes of Python class instance
-        for index, column in enumerate(self.table_columns):
-            value = values[0][index]
-            setattr(self, column, value)
+        self._load_values(self.table_columns, values[0])
+
+        self._mark_saved()
 
     def belongs_to(self, model: "LiteModel", foreign_key: str = None) -> "LiteModel":
         """Defines the current model instance as a child of the passed model class.
@@ -830,6 +1382,65 @@ class LiteModel:
 
         return LiteCollection(siblings_collection)
 
+    def sync(self, model: "LiteModel", ids: list) -> dict:
+        """Replaces the many-to-many relationships between the current model instance
+        and a model class with exactly the passed ids. Only the difference between
+        the current and desired relationships is written, in a single transaction.
+
+        Args:
+            model (LiteModel): Sibling model class
+            ids (list): Ids or model instances to relate to the current model instance
+
+        Raises:
+            RelationshipError: Models are not related through a pivot table.
+
+        Returns:
+            dict: {
+                "attached": [id,..],
+                "detached": [id,..]
+            }
+        """
+
+        if not (pivot := self._get_pivot_name(model)):
+            raise RelationshipError(
+                "Models must be related through a pivot table to be synced."
+            )
+
+        pivot_table = LiteTable(*pivot)
+        model_instance = model()
+        self_fkey, model_fkey = self._get_pivot_keys(pivot_table, model_instance)
+
+        desired_ids = list(dict.fromkeys(getattr(_id, "id", _id) for _id in ids))
+
+        # Hold the write lock from reading the current relationships until the
+        # difference is written, so concurrent attachments can't interleave
+        with pivot_table.connection.transaction(immediate=True):
+            current_ids = [
+                row[0]
+                for row in self.get_relationships(pivot_table, self_fkey, model_fkey)
+            ]
+
+            current_set, desired_set = set(current_ids), set(desired_ids)
+            attached = [_id for _id in desired_ids if _id not in current_set]
+            detached = [_id for _id in current_ids if _id not in desired_set]
+
+            if self._get_hierarchy_table(model_instance):
+                for _id in detached:
+                    self.detach(model.find_or_fail(_id))
+                for _id in attached:
+                    self.attach(model.find_or_fail(_id))
+            elif attached or detached:
+                pivot_table.delete_many(
+                    [self_fkey, model_fkey], [(self.id, _id) for _id in detached]
+                )
+                pivot_table.insert_many(
+                    [self_fkey, model_fkey],
+                    [(self.id, _id) for _id in attached],
+                    or_ignore=True,
+                )
+
+        return {"attached": attached, "detached": detached}
+
     def has_one(self, model: "LiteModel", foreign_key: str = None) -> "LiteModel":
         """Reverse of belongs_to.
         Defines the current model instance as a parent of the passed model class.
@@ -883,6 +1494,271 @@ class LiteModel:
         children_collection = [model.find(row[0]) for row in child_rows]
         return LiteCollection(children_collection)
 
+    def _get_hierarchy_table(self, model_instance: "LiteModel") -> LiteTable:
+        """Internal method. Returns the closure table maintained for relationships
+        between self and the passed model instance, or None if there isn't one."""
+
+        if (
+            model_instance.__class__ is not self.__class__
+            or self.__class__.__name__ not in self.HIERARCHY_TABLES
+        ):
+            return None
+
+        table_name, lite_connection = self.HIERARCHY_TABLES[self.__class__.__name__]
+        return LiteTable(table_name, lite_connection)
+
+    def _require_hierarchy_table(self) -> LiteTable:
+        """Internal method. Returns the closure table declared by .tracks_hierarchy().
+
+        Raises:
+            RelationshipError: The model does not track a hierarchy.
+        """
+
+        closure_table = self._get_hierarchy_table(self)
+        if closure_table is None:
+            raise RelationshipError("This model does not track a hierarchy.")
+        return closure_table
+
+    def _find_many(self, ids: list) -> LiteCollection:
+        """Internal method. Loads instances of this model by id, in the given order,
+        selecting their rows in chunks of ids rather than one at a time."""
+
+        columns = self.table.get_column_names()
+        loaded_columns = self._get_loaded_columns(columns)
+        select_columns = ["*"]
+        if loaded_columns != columns:
+            select_columns = [f'"{column}"' for column in loaded_columns]
+
+        rows = self.table.select_many(["id"], [(_id,) for _id in ids], select_columns)
+
+        id_index = loaded_columns.index("id")
+        models = {
+            row[id_index]: self.__class__(
+                row[id_index],
+                self.table,
+                [self._expand_row(columns, loaded_columns, row)],
+                self.table.connection,
+            )
+            for row in rows
+        }
+        return LiteCollection([models[_id] for _id in ids if _id in models])
+
+    def _check_hierarchy_link(self, closure_table: LiteTable, parent: "LiteModel"):
+        """Internal method. Ensures that placing self below the passed parent
+        keeps the hierarchy a tree."""
+
+        if parent.id == self.id or self._closure_depth(closure_table, self, parent):
+            raise RelationshipError("This relationship would create a cycle.")
+
+        if closure_table.select_rows(
+            [["descendant_id", "=", self.id], ["depth", "=", 1]], ["ancestor_id"]
+        ):
+            raise RelationshipError(
+                """This model instance already has a parent. 
+                Remove it with .detach() before proceeding."""
+            )
+
+    def _link_hierarchy(self, closure_table: LiteTable, parent: "LiteModel"):
+        """Internal method. Adds closure rows connecting every ancestor of
+        the parent (inclusive) to every descendant of self (inclusive)."""
+
+        for node_id in (parent.id, self.id):
+            closure_table.insert_row(
+                {"ancestor_id": node_id, "descendant_id": node_id, "depth": 0},
+                or_ignore=True,
+            )
+
+        closure_table.connection.execute(
+            f"""
+            INSERT OR IGNORE INTO {closure_table.table_name} 
+            (ancestor_id, descendant_id, depth)
+            SELECT a.ancestor_id, d.descendant_id, a.depth + d.depth + 1
+            FROM {closure_table.table_name} a, {closure_table.table_name} d
+            WHERE a.descendant_id = ? AND d.ancestor_id = ?
+        """,
+            (parent.id, self.id),
+        ).commit()
+        closure_table._bump_version()
+
+    def _unlink_hierarchy(self, closure_table: LiteTable, parent: "LiteModel"):
+        """Internal method. Removes closure rows connecting every ancestor of
+        the parent (inclusive) to every descendant of self (inclusive)."""
+
+        closure_table.connection.execute(
+            f"""
+            DELETE FROM {closure_table.table_name} 
+            WHERE ancestor_id IN (
+                SELECT ancestor_id FROM {closure_table.table_name} 
+                WHERE descendant_id = ?
+            )
+            AND descendant_id IN (
+                SELECT descendant_id FROM {closure_table.table_name} 
+                WHERE ancestor_id = ?
+            )
+        """,
+            (parent.id, self.id),
+        ).commit()
+        closure_table._bump_version()
+
+    def _remove_from_hierarchy(self, closure_table: LiteTable):
+        """Internal method. Removes self from the closure table.
+        Descendants of self become roots of their own subtrees. Called by .delete()."""
+
+        closure_table.connection.execute(
+            f"""
+            DELETE FROM {closure_table.table_name} 
+            WHERE ancestor_id IN (
+                SELECT ancestor_id FROM {closure_table.table_name} 
+                WHERE descendant_id = ?
+            )
+            AND descendant_id IN (
+                SELECT descendant_id FROM {closure_table.table_name} 
+                WHERE ancestor_id = ?
+            )
+        """,
+            (self.id, self.id),
+        ).commit()
+        closure_table._bump_version()
+
+    @staticmethod
+    def _closure_depth(
+        closure_table: LiteTable, ancestor: "LiteModel", descendant: "LiteModel"
+    ) -> int:
+        """Internal method. Returns the depth of descendant below ancestor, or None."""
+
+        rows = closure_table.select_rows(
+            [["ancestor_id", "=", ancestor.id], ["descendant_id", "=", descendant.id]],
+            ["depth"],
+        )
+        return rows[0][0] if rows else None
+
+    def rebuild_hierarchy(self) -> None:
+        """Rebuilds the closure table declared by .tracks_hierarchy() from the
+        model's self-referential foreign key or pivot table."""
+
+        closure_table = self._require_hierarchy_table()
+
+        # Derive (child, parent) edges from the pivot table or the foreign key column
+        if pivot := self._get_pivot_name(self):
+            pivot_table = LiteTable(*pivot)
+            foreign_keys = pivot_table.get_foreign_key_references()[self.table_name]
+            edges_sql = f"""
+                SELECT {foreign_keys[0][1]}, {foreign_keys[1][1]} 
+                FROM {pivot_table.table_name}
+            """
+        elif self.table_name in self._foreign_key_map:
+            parent_key = self._foreign_key_map[self.table_name][0][1]
+            edges_sql = f"""
+                SELECT id, {parent_key} FROM {self.table_name} 
+                WHERE {parent_key} IS NOT NULL
+            """
+        else:
+            raise RelationshipError(
+                "This model has no self-referential relationship to track."
+            )
+
+        with closure_table.connection.transaction():
+            closure_table.delete_rows()
+            closure_table.connection.execute(
+                f"""
+                WITH RECURSIVE 
+                edges(child, parent) AS ({edges_sql}),
+                paths(ancestor_id, descendant_id, depth) AS (
+                    SELECT parent, child, 1 FROM edges
+                    UNION
+                    SELECT paths.ancestor_id, edges.child, paths.depth + 1
+                    FROM paths JOIN edges ON edges.parent = paths.descendant_id
+                )
+                INSERT OR IGNORE INTO {closure_table.table_name} 
+                (ancestor_id, descendant_id, depth)
+                SELECT child, child, 0 FROM edges
+                UNION ALL SELECT parent, parent, 0 FROM edges
+                UNION ALL SELECT ancestor_id, descendant_id, depth FROM paths
+            """
+            ).commit()
+            closure_table._bump_version()
+
+    def ancestors(self) -> LiteCollection:
+        """Returns the ancestors of the current model instance, nearest first.
+        Requires .tracks_hierarchy().
+
+        Returns:
+            LiteCollection: Ancestor model instances
+
+        Raises:
+            RelationshipError: The model does not track a hierarchy.
+        """
+
+        closure_table = self._require_hierarchy_table()
+        rows = closure_table.select_rows(
+            [["descendant_id", "=", self.id], ["depth", ">", 0]],
+            ["depth", "ancestor_id"],
+        )
+
+        return self._find_many([row[1] for row in sorted(rows)])
+
+    def descendants(self, max_depth: int = None) -> LiteCollection:
+        """Returns the descendants of the current model instance, nearest first.
+        Requires .tracks_hierarchy().
+
+        Args:
+            max_depth (int, optional): Maximum depth below this instance. Defaults to no limit.
+
+        Returns:
+            LiteCollection: Descendant model instances
+
+        Raises:
+            RelationshipError: The model does not track a hierarchy.
+        """
+
+        closure_table = self._require_hierarchy_table()
+        where_columns = [["ancestor_id", "=", self.id], ["depth", ">", 0]]
+        if max_depth is not None:
+            where_columns.append(["depth", "<=", max_depth])
+
+        rows = closure_table.select_rows(where_columns, ["depth", "descendant_id"])
+
+        return self._find_many([row[1] for row in sorted(rows)])
+
+    def is_descendant_of(self, model_instance: "LiteModel") -> bool:
+        """Checks if the current model instance is below the passed model instance.
+        Requires .tracks_hierarchy().
+
+        Args:
+            model_instance (LiteModel): Possible ancestor
+
+        Returns:
+            bool
+
+        Raises:
+            RelationshipError: The model does not track a hierarchy.
+        """
+
+        closure_table = self._require_hierarchy_table()
+        depth = self._closure_depth(closure_table, model_instance, self)
+        return depth is not None and depth > 0
+
+    def path_length_to(self, model_instance: "LiteModel") -> int:
+        """Returns the number of edges between the current model instance and an
+        ancestor or descendant, or None if neither is below the other.
+        Requires .tracks_hierarchy().
+
+        Args:
+            model_instance (LiteModel): Ancestor or descendant model instance
+
+        Returns:
+            int: Path length or None
+
+        Raises:
+            RelationshipError: The model does not track a hierarchy.
+        """
+
+        closure_table = self._require_hierarchy_table()
+        depth = self._closure_depth(closure_table, model_instance, self)
+        if depth is None:
+            depth = self._closure_depth(closure_table, self, model_instance)
+        return depth
+
     def find_path(
         self, to_model_instance: "LiteModel", max_depth: int = 100
     ) -> LiteCollection:
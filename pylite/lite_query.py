@@ -1,5 +1,6 @@
 """Contains the LiteQuery class """
 from pylite import LiteTable, LiteCollection, Lite
+from pylite.lite_async import run_async
 
 
 class LiteQuery:
@@ -19,6 +20,16 @@ class LiteQuery:
         self.where_clause = ""
         self.params = []
 
+        # Full-text matches joined by .matches(), and their bound parameters
+        self.join_clause = ""
+        self.join_params = []
+        self.order_clause = ""
+        self._extra_columns = []
+
+        # Columns left out of the SELECT, and loaded on first access
+        self.deferred_columns = list(self.model.DEFERRED_COLUMNS)
+        self._table_columns = None
+
         table_name = Lite.HelperFunctions.pluralize_noun(self.model.__name__.lower())
 
         if self.model.DEFAULT_CONNECTION is not None:
@@ -32,6 +43,7 @@ class LiteQuery:
         self.table = LiteTable(table_name, lite_connection)
 
         self.where_clause = f" WHERE {column_name}"
+        self._column_name = column_name
 
     def _check_single_word(self, value):
         """Checks if the value is a single word.
@@ -144,26 +156,251 @@ class LiteQuery:
     def _where_handler(self, column_name, arg1):
         self._check_single_word(column_name)
         self.where_clause += f"{arg1}{column_name}"
+        self._column_name = column_name
+        return self
+
+    def matches(self, query: str, snippet: bool = False):
+        """Checks if the column matches a full-text search query, using its FTS5 index.
+        Results are ordered by relevance. See LiteTable.create_fulltext_index().
+
+        Usage:
+            Article.where("body").matches("sqlite AND fast*", snippet=True).all()
+
+        Args:
+            query (str): FTS5 query, e.g. 'sqlite AND fast*'. May contain several words.
+            snippet (bool, optional): Set a '{column}_snippet' attribute on each result,
+                an excerpt of the column with matched terms in <b> tags.
+                Defaults to False.
+
+        Raises:
+            ValueError: The column has no full-text index
+        """
+
+        column_name = self._column_name
+        fulltext_columns = self.table.get_fulltext_columns()
+        if column_name not in fulltext_columns:
+            raise ValueError(f"Column '{column_name}' has no full-text index.")
+
+        fulltext_table = f"{self.table.table_name}_fts"
+        alias = f"lite_match_{self.join_clause.count(' JOIN ')}"
+
+        snippet_str = ""
+        if snippet:
+            snippet_str = f""", snippet({fulltext_table}, 
+                {fulltext_columns.index(column_name)}, '<b>', '</b>', '...', 16
+            ) AS lite_snippet"""
+            self._extra_columns.append(
+                (f"{column_name}_snippet", f"{alias}.lite_snippet")
+            )
+
+        # Matches are left joined, so they can also be combined with OR
+        self.join_clause += f""" LEFT JOIN (
+            SELECT rowid AS lite_id, rank AS lite_rank{snippet_str} 
+            FROM {fulltext_table} WHERE {fulltext_table} MATCH ?
+        ) AS {alias} ON {alias}.lite_id = {self.table.table_name}.id"""
+        self.join_params.append(f"{{{column_name}}} : ({query})")
+
+        self._replace_column(f"{alias}.lite_id IS NOT NULL")
+        if not self.order_clause:
+            self.order_clause = f" ORDER BY {alias}.lite_rank NULLS LAST"
+        return self
+
+    def json_path(self, path: str):
+        """Compares a path within the JSON column, rather than the column itself.
+        See LiteModel.where_json().
+
+        Usage:
+            Document.where("payload").json_path("$.user.id").is_equal_to(5)
+
+        Args:
+            path (str): JSON path, e.g. '$.user.id'
+
+        Raises:
+            ValueError: Invalid JSON path
+        """
+
+        self._replace_column(LiteTable._json_expression(self._column_name, path))
+        return self
+
+    def defer(self, *column_names):
+        """Leaves columns out of the query's results, in addition to the model's
+        DEFERRED_COLUMNS. They're loaded on first access, or for a whole collection
+        by LiteCollection.load().
+
+        Usage:
+            Document.where("author_id").is_equal_to(5).defer("body").all()
+        """
+
+        self.deferred_columns += column_names
+        return self
+
+    def only(self, *column_names):
+        """Only selects the given columns, and 'id'. Other columns are deferred,
+        as by .defer().
+
+        Usage:
+            Document.where("author_id").is_equal_to(5).only("title").all()
+        """
+
+        self.deferred_columns = [
+            column
+            for column in self._get_table_columns()
+            if column not in column_names
+        ]
         return self
 
+    def _get_table_columns(self) -> list:
+        """Internal method. Returns the table's columns, looked up once per query."""
+
+        if self._table_columns is None:
+            self._table_columns = self.table.get_column_names()
+        return self._table_columns
+
+    def _get_loaded_columns(self) -> list:
+        """Internal method. Returns the columns selected by the query, or None if
+        no columns are deferred."""
+
+        if not self.deferred_columns:
+            return None
+        return self.model._get_loaded_columns(
+            self._get_table_columns(), self.deferred_columns
+        )
+
+    def _replace_column(self, expression: str) -> None:
+        """Internal method. Replaces the column last added to the where clause."""
+
+        self.where_clause = self.where_clause[: -len(self._column_name)] + expression
+        self._column_name = expression
+
+    def _select(self, order_clause: str = None, columns: str = None) -> str:
+        """Internal method. Returns the SELECT statement for the query."""
+
+        table_name = self.table.table_name
+
+        row_columns = [f"{table_name}.*"]
+        if loaded_columns := self._get_loaded_columns():
+            row_columns = [f'{table_name}."{column}"' for column in loaded_columns]
+
+        select_str = columns or ", ".join(
+            row_columns + [column for _, column in self._extra_columns]
+        )
+
+        if order_clause is None:
+            order_clause = self.order_clause
+        return (
+            f"SELECT {select_str} FROM {table_name}"
+            f"{self.join_clause}{self.where_clause}{order_clause}"
+        )
+
+    def __iter__(self):
+        """Executes the query, yielding models as their rows are read.
+
+        Usage:
+            for model in Model.where("age").is_greater_than(30):
+                ...
+        """
+
+        query = self._select()
+        with self.table.connection.execute(query, self._get_params()) as result:
+            for row in result:
+                yield self._model_from_row(row)
+
+    def _get_params(self) -> list:
+        """Internal method. Returns the query's parameters, in statement order."""
+
+        return self.join_params + self.params
+
+    def _model_from_row(self, row: tuple):
+        """Internal method. Creates a model instance from a row of the selected
+        columns, followed by the values of any extra columns."""
+
+        split = len(row) - len(self._extra_columns)
+        values = row[:split]
+        if loaded_columns := self._get_loaded_columns():
+            values = self.model._expand_row(
+                self._get_table_columns(), loaded_columns, values
+            )
+
+        _id = values[self._get_table_columns().index("id")]
+        model = self.model(_id, self.table, [values], self.table.connection)
+        for (name, _), value in zip(self._extra_columns, row[split:]):
+            setattr(model, name, value)
+        return model
+
+    def _fetch_rows(self, query: str) -> list:
+        """Internal method. Executes a query on the model's table,
+        through the query cache if enabled."""
+
+        if Lite.QUERY_CACHE is not None:
+            return Lite.QUERY_CACHE.fetch(
+                self.table.connection,
+                [self.table.table_name],
+                query,
+                self._get_params(),
+            )
+        return self.table.connection.execute(query, self._get_params()).fetchall()
+
     def all(self):
         """Executes the query and returns a LiteCollection"""
 
-        query = f"SELECT id FROM {self.table.table_name}{self.where_clause}"
-        rows = self.table.connection.execute(query, self.params).fetchall()
-        collection = [self.model.find(row[0]) for row in rows]
-        return LiteCollection(collection)
+        rows = self._fetch_rows(self._select())
+        return LiteCollection([self._model_from_row(row) for row in rows])
 
     def first(self):
         """Executes the query and returns the first result"""
-        return self._extents_handler(" LIMIT 1")
+        return self._extents_handler(f"{self.order_clause} LIMIT 1")
 
     def last(self):
         """Executes the query and returns the last result"""
         return self._extents_handler(" ORDER BY id DESC LIMIT 1")
 
     def _extents_handler(self, arg0):
-        where_clause = self.where_clause
-        query = f"SELECT id FROM {self.table.table_name}{where_clause}{arg0}"
-        row = self.table.connection.execute(query, self.params).fetchone()
-        return self.model.find(row[0]) if row else None
+        rows = self._fetch_rows(self._select(arg0))
+        return self._model_from_row(rows[0]) if rows else None
+
+    async def aall(self):
+        """Executes the query without blocking the event loop and returns a LiteCollection"""
+
+        return await run_async(self.table.connection, self.all)
+
+    async def afirst(self):
+        """Executes the query without blocking the event loop and returns the first result"""
+
+        return await run_async(self.table.connection, self.first)
+
+    async def alast(self):
+        """Executes the query without blocking the event loop and returns the last result"""
+
+        return await run_async(self.table.connection, self.last)
+
+    async def aiter(self, batch_size: int = 100):
+        """Executes the query without blocking the event loop,
+        loading matching models in batches.
+
+        Usage:
+            async for model in Model.where("age").is_greater_than(30).aiter():
+                ...
+
+        Args:
+            batch_size (int, optional): Rows fetched per executor call. Defaults to 100.
+        """
+
+        connection = self.table.connection
+        result = await run_async(
+            connection, lambda: connection.execute(self._select(), self._get_params())
+        )
+
+        try:
+            while True:
+                models = await run_async(
+                    connection,
+                    lambda: [
+                        self._model_from_row(row) for row in result.fetchmany(batch_size)
+                    ],
+                )
+                if not models:
+                    break
+                for model in models:
+                    yield model
+        finally:
+            await run_async(connection, result.close)
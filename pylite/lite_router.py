@@ -0,0 +1,232 @@
+"""Contains the LiteRouter class"""
+import itertools
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from urllib.request import pathname2url
+from pylite import LiteConnection
+
+
+class LiteRouter(LiteConnection):
+    """A LiteConnection that keeps one writer connection and a pool of read-only
+    connections to the same database. Reads are routed to the read-only connections,
+    while writes, and any reads made within a transaction, go to the writer.
+
+    In WAL mode, this allows many threads to read while another writes.
+    """
+
+    # PRAGMAs that only read from the database, and may be routed to readers
+    READ_PRAGMAS = [
+        "table_info",
+        "table_xinfo",
+        "foreign_key_list",
+        "index_list",
+        "index_info",
+        "data_version",
+        "schema_version",
+    ]
+
+    def __init__(
+        self,
+        database_path: str = None,
+        readers: int = 4,
+        isolation: bool = False,
+        wal: bool = True,
+        profile: str = None,
+        **pragmas,
+    ) -> None:
+        """LiteRouter initializer.
+
+        Args:
+            database_path (str): Path to the database
+            readers (int, optional): Number of read-only connections. Defaults to 4.
+            isolation (bool, optional): Enable isolation for the writer. Defaults to False.
+            wal (bool, optional): Use WAL journal mode. Defaults to True.
+            profile (str, optional): Name of a PRAGMA profile from LiteConnection.PROFILES.
+            **pragmas: PRAGMA settings overriding those of the profile,
+                and other LiteConnection arguments.
+
+        Raises:
+            DatabaseNotFoundError: Database not found
+            ValueError: Unknown profile or PRAGMA, or a private in-memory database
+        """
+
+        if database_path and LiteConnection.is_memory_database(database_path):
+            if "cache=shared" not in database_path:
+                raise ValueError(
+                    "LiteRouter requires a shared in-memory database. "
+                    "See LiteConnection.memory_database()."
+                )
+
+        # Serializes use of the writer connection across threads
+        self._write_lock = threading.RLock()
+        self._transaction_owner = None
+
+        super().__init__(database_path, isolation, wal, profile, **pragmas)
+
+        reader_pragmas = {
+            name: value
+            for name, value in {
+                **self._get_profile(profile or "default"),
+                **pragmas,
+            }.items()
+            if name in self.PRAGMAS and name != "page_size"
+        }
+
+        # Readers of a shared in-memory database open the same URI, but may only read
+        if self.is_memory_database(database_path):
+            reader_uri = database_path
+            reader_pragmas["query_only"] = 1
+        else:
+            database_file = os.path.abspath(self.database_file(database_path))
+            reader_uri = f"file:{pathname2url(database_file)}?mode=ro"
+
+        self.readers = []
+        self._reader_pool = queue.Queue()
+        for _ in range(readers):
+            reader = sqlite3.connect(
+                reader_uri,
+                uri=True,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            for name, value in reader_pragmas.items():
+                reader.execute(f"PRAGMA {name} = {value}").fetchall()
+
+            self.readers.append(reader)
+            self._reader_pool.put(reader)
+
+        self.route_stats = {"reads": 0, "writes": 0}
+
+    def _connect(self, database_path: str, isolation: bool) -> sqlite3.Connection:
+        """Internal method. Opens the writer connection, shared across threads."""
+
+        uri = self.is_uri(database_path)
+
+        if isolation:
+            return sqlite3.connect(database_path, check_same_thread=False, uri=uri)
+        return sqlite3.connect(
+            database_path, isolation_level=None, check_same_thread=False, uri=uri
+        )
+
+    def _is_read(self, sql_str: str) -> bool:
+        """Internal method. Checks if a statement only reads from the database.
+
+        Args:
+            sql_str (str): the query to check
+
+        Returns:
+            bool
+        """
+
+        keyword = sql_str.lstrip().split(None, 1)[0].upper() if sql_str.strip() else ""
+
+        if keyword == "SELECT":
+            return True
+
+        if keyword == "PRAGMA" and "=" not in sql_str:
+            pragma = sql_str.lstrip()[len("PRAGMA") :].strip().split("(")[0].strip()
+            return pragma.lower() in self.READ_PRAGMAS
+
+        return False
+
+    def _owns_transaction(self) -> bool:
+        """Internal method. Checks if the calling thread has a transaction open
+        on the writer connection."""
+
+        return (
+            self.connection.in_transaction
+            and self._transaction_owner == threading.get_ident()
+        )
+
+    @contextmanager
+    def transaction(self, immediate: bool = False):
+        """Groups the statements executed within the block into a single transaction
+        on the writer connection. Reads made within the block are routed to the writer,
+        so they observe the transaction's own writes.
+
+        Args:
+            immediate (bool, optional): Acquire the write lock when the transaction
+                begins, rather than on its first write. Defaults to False.
+        """
+
+        with self._write_lock:
+            owner = self._transaction_owner
+            self._transaction_owner = threading.get_ident()
+            try:
+                with super().transaction(immediate):
+                    yield self
+            finally:
+                self._transaction_owner = owner
+
+    def execute(
+        self, sql_str: str, values: tuple[any, ...] = ()
+    ) -> LiteConnection.ExecuteResult:
+        """Executes a query on a read-only connection if it only reads from
+        the database, or on the writer connection otherwise.
+
+        Args:
+            sql_str (str): the query to execute
+            values (tuple, optional): the values to pass to the query. Defaults to ().
+
+        Returns:
+            ExecuteResult: an instance of the ExecuteResult class
+        """
+
+        if self._is_read(sql_str) and not self._owns_transaction():
+            self.route_stats["reads"] += 1
+
+            # Rows are fetched before the reader is returned to the pool
+            reader = self._reader_pool.get()
+            try:
+                rows = self._retry_if_locked(
+                    lambda: reader.execute(sql_str, values).fetchall()
+                )
+            finally:
+                self._reader_pool.put(reader)
+
+            return self.ExecuteResult(self, _FetchedCursor(rows))
+
+        self.route_stats["writes"] += 1
+        with self._write_lock:
+            cursor = self.connection.cursor()
+            if self.in_transaction():
+                cursor.execute(sql_str, values)
+            else:
+                self._retry_if_locked(cursor.execute, sql_str, values)
+            return self.ExecuteResult(self, cursor)
+
+    def close(self) -> None:
+        """Closes the writer and read-only connections."""
+
+        for reader in self.readers:
+            reader.close()
+        super().close()
+
+
+class _FetchedCursor:
+    """Presents rows already fetched from a read-only connection as a cursor."""
+
+    arraysize = 1
+    rowcount = -1
+    lastrowid = None
+
+    def __init__(self, rows: list) -> None:
+        self._rows = iter(rows)
+
+    def __iter__(self):
+        return self._rows
+
+    def fetchone(self) -> tuple:
+        return next(self._rows, None)
+
+    def fetchmany(self, size: int = 1) -> list:
+        return list(itertools.islice(self._rows, size))
+
+    def fetchall(self) -> list:
+        return list(self._rows)
+
+    def close(self) -> None:
+        self._rows = iter(())
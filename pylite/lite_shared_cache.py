@@ -0,0 +1,288 @@
+"""Contains the LiteSharedCache class"""
+import marshal
+import mmap
+import os
+import struct
+import time
+import weakref
+import zlib
+from contextlib import contextmanager
+from pylite import LiteCache
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+
+class LiteSharedCache(LiteCache):
+    """A LiteCache stored in a memory-mapped file, shared by every process that opens
+    the same file. Worker processes then share one copy of hot rows and results,
+    instead of each caching their own.
+
+    The file holds a header of shared table versions, followed by fixed-size slots.
+    Each result is stored in the slot its key hashes to, replacing any other result
+    there, serialized with marshal. Slots are written under a file lock, and read
+    without one using a sequence counter, retrying reads that overlap a write.
+
+    Table versions bumped by LiteTable writes in any process are visible to all
+    of them. Writes made without PyLite are caught by checking PRAGMA data_version,
+    if enabled, which invalidates every result cached from the database.
+
+    Usage:
+        Lite.enable_shared_query_cache("/tmp/app.cache")
+    """
+
+    MAGIC = b"PYLITESC"
+    HEADER_FORMAT = "=8sIIQ"  # magic, slots, slot_size, generation
+    VERSION_COUNTERS = 1024
+    HEADER_SIZE = 16384
+    SLOT_HEADER_FORMAT = "=QQI"  # sequence, key hash, payload length
+
+    def __init__(
+        self,
+        cache_path: str,
+        slots: int = 4096,
+        slot_size: int = 4096,
+        ttl: float = None,
+        check_data_version: bool = False,
+    ) -> None:
+        """LiteSharedCache initializer. Creates the cache file if needed.
+
+        Args:
+            cache_path (str): Path to the cache file, shared by the processes
+            slots (int, optional): Number of cached results. Defaults to 4096.
+            slot_size (int, optional): Bytes per slot. Larger serialized results
+                aren't cached. Defaults to 4096.
+            ttl (float, optional): Seconds after which results expire. Defaults to None.
+            check_data_version (bool, optional): Check PRAGMA data_version before each
+                hit, to catch writes made without PyLite. Defaults to False.
+
+        Raises:
+            RuntimeError: File locking is not supported on this platform
+            ValueError: The cache file was created with a different layout
+        """
+
+        if fcntl is None:
+            raise RuntimeError("LiteSharedCache requires fcntl file locking.")
+
+        super().__init__(slots, ttl, check_data_version=check_data_version)
+        self.cache_path = cache_path
+        self.slots = slots
+        self.slot_size = slot_size
+
+        self._slot_header_size = struct.calcsize(self.SLOT_HEADER_FORMAT)
+        self._data_versions = weakref.WeakKeyDictionary()
+
+        # Create and size the file once, under the lock, then map it
+        size = self.HEADER_SIZE + slots * slot_size
+        self._fd = os.open(cache_path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._file_lock():
+            header = os.pread(self._fd, struct.calcsize(self.HEADER_FORMAT), 0)
+            if len(header) < struct.calcsize(self.HEADER_FORMAT):
+                os.ftruncate(self._fd, size)
+                header = struct.pack(self.HEADER_FORMAT, self.MAGIC, slots, slot_size, 0)
+                os.pwrite(self._fd, header, 0)
+
+        if struct.unpack(self.HEADER_FORMAT, header)[:3] != (
+            self.MAGIC,
+            slots,
+            slot_size,
+        ):
+            os.close(self._fd)
+            raise ValueError(
+                f'Cache file "{cache_path}" was created with a different layout.'
+            )
+
+        self._map = mmap.mmap(self._fd, size)
+        LiteCache.SHARED_CACHES.add(self)
+
+    @contextmanager
+    def _file_lock(self):
+        """Internal method. Excludes writers in other processes and threads.
+        POSIX record locks are held per process, so they also exclude forked workers
+        sharing the file descriptor."""
+
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _hash(value) -> int:
+        """Internal method. Hashes a value consistently across processes.
+        Its repr is hashed since marshal's output depends on string interning."""
+
+        return zlib.crc32(repr(value).encode())
+
+    def _counter_offset(self, database_key: str, table_name: str) -> int:
+        """Internal method. Returns the header offset of a table's version counter.
+        Tables sharing a counter only cause extra invalidations."""
+
+        index = self._hash((database_key, table_name)) % self.VERSION_COUNTERS
+        return struct.calcsize(self.HEADER_FORMAT) + index * 8
+
+    def _read_u64(self, offset: int) -> int:
+        """Internal method. Reads a counter from the mapped file."""
+
+        return struct.unpack_from("=Q", self._map, offset)[0]
+
+    def bump_shared_version(self, database_key: str, table_name: str) -> None:
+        """Invalidates results cached by any process that read from a table.
+        Called by LiteCache.bump_table_version().
+
+        Args:
+            database_key (str): Key of the database containing the table,
+                see LiteCache.database_key()
+            table_name (str): Name of the table
+        """
+
+        offset = self._counter_offset(database_key, table_name)
+        with self._file_lock():
+            struct.pack_into("=Q", self._map, offset, self._read_u64(offset) + 1)
+
+    def _bump_generation(self) -> None:
+        """Internal method. Invalidates every cached result."""
+
+        offset = struct.calcsize(self.HEADER_FORMAT) - 8
+        with self._file_lock():
+            struct.pack_into("=Q", self._map, offset, self._read_u64(offset) + 1)
+
+    def _get_table_versions(self, database_key: str, table_names: list) -> tuple:
+        """Internal method. Returns the current shared versions of tables."""
+
+        return tuple(
+            self._read_u64(self._counter_offset(database_key, table_name))
+            for table_name in table_names
+        )
+
+    def _get_data_version(self, lite_connection) -> tuple:
+        """Internal method. Returns the cache's generation, and the database's shared
+        generation, after bumping it if another connection committed to the database
+        since it was last checked."""
+
+        generation = self._read_u64(struct.calcsize(self.HEADER_FORMAT) - 8)
+        if not self.check_data_version:
+            return generation
+
+        # Database generations share the table version counters, under no table
+        database_key = self.database_key(lite_connection)
+        data_version = self._read_data_version(lite_connection)
+
+        # Connections checked for the first time may have missed earlier writes
+        if self._data_versions.get(lite_connection) != data_version:
+            self._data_versions[lite_connection] = data_version
+            self.bump_shared_version(database_key, None)
+
+        database_generation = self._read_u64(self._counter_offset(database_key, None))
+        return generation, database_generation
+
+    def _slot_offset(self, key_hash: int) -> int:
+        """Internal method. Returns the file offset of the slot for a key."""
+
+        return self.HEADER_SIZE + (key_hash % self.slots) * self.slot_size
+
+    def _get(self, key: tuple, stamp: tuple) -> list:
+        """Internal method. Returns the cached rows of a query from its slot, or None."""
+
+        key_hash = self._hash(key)
+        offset = self._slot_offset(key_hash)
+
+        # Retry reads that overlap a write to the slot
+        for _ in range(3):
+            sequence, slot_hash, length = struct.unpack_from(
+                self.SLOT_HEADER_FORMAT, self._map, offset
+            )
+            if sequence % 2:
+                continue
+
+            start = offset + self._slot_header_size
+            payload = self._map[start : start + length]
+            if struct.unpack_from("=Q", self._map, offset)[0] == sequence:
+                break
+        else:
+            self.stats["misses"] += 1
+            return None
+
+        if slot_hash != key_hash or not length:
+            self.stats["misses"] += 1
+            return None
+
+        try:
+            entry_key, expires, entry_stamp, rows = marshal.loads(payload)
+        except (ValueError, EOFError, TypeError):  # Corrupt slot
+            self.stats["misses"] += 1
+            return None
+
+        if entry_key != key:
+            self.stats["misses"] += 1
+            return None
+
+        if (expires is not None and expires <= time.time()) or entry_stamp != stamp:
+            self.stats["invalidations"] += 1
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return list(rows)
+
+    def _put(self, key: tuple, stamp: tuple, rows: list) -> None:
+        """Internal method. Caches the rows of a query in its slot,
+        unless they don't fit."""
+
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        try:
+            payload = marshal.dumps((key, expires, stamp, tuple(rows)))
+        except ValueError:  # Unserializable values
+            return
+
+        if len(payload) > self.slot_size - self._slot_header_size:
+            return
+
+        key_hash = self._hash(key)
+        offset = self._slot_offset(key_hash)
+        start = offset + self._slot_header_size
+
+        with self._file_lock():
+            sequence, slot_hash, length = struct.unpack_from(
+                self.SLOT_HEADER_FORMAT, self._map, offset
+            )
+            if length and slot_hash != key_hash:
+                self.stats["evictions"] += 1
+
+            # An odd sequence marks the slot as being written. A sequence left odd
+            # by a process that died mid-write is reset by the next write.
+            sequence -= sequence % 2
+            struct.pack_into("=Q", self._map, offset, sequence + 1)
+            self._map[start : start + len(payload)] = payload
+            struct.pack_into(
+                self.SLOT_HEADER_FORMAT,
+                self._map,
+                offset,
+                sequence + 2,
+                key_hash,
+                len(payload),
+            )
+
+    def clear(self) -> None:
+        """Invalidates every cached result, in every process."""
+
+        self._bump_generation()
+
+    def __len__(self) -> int:
+        return sum(
+            1
+            for slot in range(self.slots)
+            if struct.unpack_from(
+                self.SLOT_HEADER_FORMAT, self._map, self._slot_offset(slot)
+            )[2]
+        )
+
+    def close(self) -> None:
+        """Unmaps the cache file. The file itself is left for other processes."""
+
+        LiteCache.SHARED_CACHES.discard(self)
+        self._map.close()
+        os.close(self._fd)
@@ -1,5 +1,9 @@
 """Contains the LiteTable class """
-from pylite import Lite, LiteConnection
+import json
+import lzma
+import re
+import zlib
+from pylite import Lite, LiteConnection, LiteCache
 from pylite.lite_exceptions import TableNotFoundError
 
 
@@ -12,6 +16,31 @@ class LiteTable:
         TableNotFoundError: Table not found within database
     """
 
+    # Maximum number of bound parameters per statement.
+    # SQLite's default SQLITE_MAX_VARIABLE_NUMBER prior to 3.32.
+    MAX_VARIABLES = 999
+
+    COMPRESSED_COLUMNS = {}  # Filled by calls to .compress_columns()
+    COMPRESSION_STATS = {}  # Updated as compressed columns are written
+
+    # Compressed values start with this header, followed by an algorithm byte
+    # and a byte marking whether the original value was text or bytes
+    COMPRESSION_HEADER = b"\x1fL"
+    COMPRESSION_ALGORITHMS = {
+        "zlib": (b"z", zlib.compress, zlib.decompress),
+        "lzma": (b"x", lzma.compress, lzma.decompress),
+    }
+
+    class JSONText(str):
+        """JSON text as stored in a JSON column. Written to the column as-is,
+        while other strings are encoded as JSON. Used by LiteModel to save
+        values it hasn't decoded."""
+
+    class CompressedValue(bytes):
+        """A value as stored in a compressed column. Written to the column as-is,
+        while other values are compressed. Used by LiteModel to save values
+        it hasn't decoded."""
+
     def get_foreign_key_references(self) -> dict:
         """Returns dictionary of foreign keys associated with table.
 
@@ -88,12 +117,13 @@ class LiteTable:
                 print(f"Table '{table_name}' not found in database.")
             return False
 
-        # Check that number of columns in table is equal to 2, not including 'id' field
-        table_columns = temp_table.get_column_names()
-
-        table_columns.remove("id")
-        table_columns.remove("created")
-        table_columns.remove("updated")
+        # Check that number of columns in table is equal to 2, not including 'id' field.
+        # Compact pivot tables, made by .create_pivot(), have no 'id' or timestamp fields
+        table_columns = [
+            column
+            for column in temp_table.get_column_names()
+            if column not in ["id", "created", "updated"]
+        ]
 
         if len(table_columns) != 2:
             return False
@@ -113,6 +143,10 @@ class LiteTable:
         columns: dict,
         foreign_keys: dict = None,
         lite_connection: LiteConnection = None,
+        timestamp_trigger: bool = None,
+        track_changes: bool = False,
+        fulltext: list = None,
+        json_indexes: list = None,
     ) -> "LiteTable":
         """Creates a table within the database.
 
@@ -124,12 +158,29 @@ class LiteTable:
             foreign_keys (dict, optional): {
                 column_name: [foreign_table_name, foreign_column_name]
             }
+            timestamp_trigger (bool, optional): Maintain the 'updated' field with an
+                update trigger. Defaults to Lite.TIMESTAMP_TRIGGERS.
+            track_changes (bool, optional): Record changes to the table in the change
+                log. See LiteTable.track_changes(). Defaults to False.
+            fulltext (list, optional): Text columns to index for full-text search.
+                See LiteTable.create_fulltext_index(). Defaults to None.
+            json_indexes (list, optional): [(column_name, path),..] Paths within JSON
+                columns to index. See LiteTable.create_json_index(). Defaults to None.
+
+        Raises:
+            ValueError: A full-text indexed column is compressed
         """
 
         if not foreign_keys:
             foreign_keys = {}
         if not lite_connection:
             lite_connection = Lite.DEFAULT_CONNECTION
+        if timestamp_trigger is None:
+            timestamp_trigger = Lite.TIMESTAMP_TRIGGERS
+
+        LiteTable._check_fulltext_columns(
+            table_name, fulltext or [], LiteTable.COMPRESSED_COLUMNS.get(table_name, {})
+        )
 
         table_desc = [
             '"created" TIMESTAMP DEFAULT CURRENT_TIMESTAMP',
@@ -168,13 +219,419 @@ class LiteTable:
         # Create table within database
         lite_connection.execute(table_sql).commit()
 
+        if timestamp_trigger:
+            lite_connection.execute(
+                f"""
+                CREATE TRIGGER update_timestamp_{table_name} 
+                AFTER UPDATE ON {table_name} 
+                BEGIN UPDATE {table_name} 
+                SET updated = CURRENT_TIMESTAMP 
+                WHERE id = OLD.id; END;
+            """
+            ).commit()
+
+        if track_changes:
+            LiteTable.track_changes(table_name, lite_connection)
+
+        if fulltext:
+            LiteTable.create_fulltext_index(table_name, fulltext, lite_connection)
+
+        for column_name, path in json_indexes or []:
+            LiteTable.create_json_index(table_name, column_name, path, lite_connection)
+
+        return LiteTable(table_name, lite_connection)
+
+    @staticmethod
+    def compress_columns(
+        table_name: str,
+        columns: dict,
+        min_size: int = 128,
+        lite_connection: LiteConnection = None,
+    ) -> None:
+        """Compresses values written to TEXT or BLOB columns of a table, by LiteTable's
+        write methods. LiteModel decompresses them on first access. Values are only
+        stored compressed if that makes them smaller.
+
+        Columns are registered for the current process, like .pivots_with(), so this
+        should be called on startup. Compressed columns can't be compared by queries.
+
+        Args:
+            table_name (str): Table name
+            columns (dict): {column_name: "zlib" or "lzma"}
+            min_size (int, optional): Smallest value compressed, in bytes.
+                Defaults to 128.
+            lite_connection (LiteConnection, optional): Connection used to check the
+                table's full-text index. Defaults to Lite.DEFAULT_CONNECTION, if any.
+
+        Raises:
+            ValueError: Unknown compression algorithm, or a column is full-text indexed
+        """
+
+        if not lite_connection:
+            lite_connection = Lite.DEFAULT_CONNECTION
+
+        for algorithm in columns.values():
+            if algorithm not in LiteTable.COMPRESSION_ALGORITHMS:
+                raise ValueError(
+                    f"Unknown compression algorithm: {algorithm}. "
+                    f"Use one of {list(LiteTable.COMPRESSION_ALGORITHMS)}."
+                )
+
+        if lite_connection:
+            fulltext_columns = [
+                column[1]
+                for column in lite_connection.execute(
+                    f"PRAGMA table_info({table_name}_fts)"
+                ).fetchall()
+            ]
+            LiteTable._check_fulltext_columns(table_name, fulltext_columns, columns)
+
+        for column_name, algorithm in columns.items():
+            LiteTable.COMPRESSED_COLUMNS.setdefault(table_name, {})[column_name] = (
+                algorithm,
+                min_size,
+            )
+
+    @staticmethod
+    def get_compression_stats(table_name: str) -> dict:
+        """Returns statistics of the values written to a table's compressed columns
+        by the current process.
+
+        Args:
+            table_name (str): Table name
+
+        Returns:
+            dict: {
+                column_name: {
+                    "values": int,
+                    "raw_bytes": int,
+                    "stored_bytes": int,
+                    "ratio": float  # raw_bytes / stored_bytes
+                }
+            }
+        """
+
+        return {
+            column_name: {
+                **stats,
+                "ratio": stats["raw_bytes"] / max(stats["stored_bytes"], 1),
+            }
+            for (stats_table_name, column_name), stats in (
+                LiteTable.COMPRESSION_STATS.items()
+            )
+            if stats_table_name == table_name
+        }
+
+    @staticmethod
+    def create_json_index(
+        table_name: str,
+        column_name: str,
+        path: str,
+        lite_connection: LiteConnection = None,
+    ) -> None:
+        """Creates an expression index on a path within a JSON column, used by queries
+        comparing the path's value. See LiteModel.where_json().
+
+        Args:
+            table_name (str): Table name
+            column_name (str): JSON column name
+            path (str): JSON path, e.g. '$.user.id'
+            lite_connection (LiteConnection, optional): Defaults to Lite.DEFAULT_CONNECTION.
+
+        Raises:
+            ValueError: Invalid JSON path
+        """
+
+        if not lite_connection:
+            lite_connection = Lite.DEFAULT_CONNECTION
+
+        expression = LiteTable._json_expression(column_name, path)
+        lite_connection.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS "{table_name}_{column_name}_{path}" 
+            ON {table_name} ({expression})
+        """
+        ).commit()
+
+    @staticmethod
+    def _json_expression(column_name: str, path: str) -> str:
+        """Internal method. Returns the SQL expression extracting a path from a JSON
+        column. Paths are inlined rather than bound, so that queries match the
+        expression of an index on the path.
+
+        Raises:
+            ValueError: Invalid JSON path
+        """
+
+        if not re.fullmatch(r"\$(\.[A-Za-z_][A-Za-z0-9_]*|\[[0-9]+\])*", path):
+            raise ValueError(
+                f"Invalid JSON path: {path}. Paths look like '$.key[0].other_key'."
+            )
+        return f"json_extract(\"{column_name}\", '{path}')"
+
+    @staticmethod
+    def create_fulltext_index(
+        table_name: str, columns: list, lite_connection: LiteConnection = None
+    ) -> None:
+        """Creates an FTS5 full-text index over text columns of a table, and indexes
+        existing rows. The index is kept in sync by triggers, and is searched with
+        LiteQuery.matches().
+
+        The index is an external content table, '{table_name}_fts', reading the text
+        from the table itself rather than storing a second copy of it.
+
+        Args:
+            table_name (str): Table name
+            columns (list): [column_name,..]
+            lite_connection (LiteConnection, optional): Defaults to Lite.DEFAULT_CONNECTION.
+
+        Raises:
+            ValueError: A column is compressed
+        """
+
+        if not lite_connection:
+            lite_connection = Lite.DEFAULT_CONNECTION
+
+        LiteTable._check_fulltext_columns(
+            table_name, columns, LiteTable.COMPRESSED_COLUMNS.get(table_name, {})
+        )
+
+        fulltext_table = f"{table_name}_fts"
+        columns_str = ", ".join(f'"{column}"' for column in columns)
+        new_str = ", ".join(f'NEW."{column}"' for column in columns)
+        old_str = ", ".join(f'OLD."{column}"' for column in columns)
+
+        lite_connection.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fulltext_table} 
+            USING fts5({columns_str}, content='{table_name}', content_rowid='id')
+        """
+        ).commit()
+
+        # External content indexes remove rows by re-inserting their old values
+        delete_str = f"""
+            INSERT INTO {fulltext_table} ({fulltext_table}, rowid, {columns_str}) 
+            VALUES ('delete', OLD.id, {old_str});
+        """
+        insert_str = f"""
+            INSERT INTO {fulltext_table} (rowid, {columns_str}) 
+            VALUES (NEW.id, {new_str});
+        """
+
+        for event, body in [
+            ("insert", insert_str),
+            ("delete", delete_str),
+            ("update", delete_str + insert_str),
+        ]:
+            # Only reindex rows when an indexed column is updated
+            of_str = f"OF {columns_str}" if event == "update" else ""
+            lite_connection.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {fulltext_table}_{event} 
+                AFTER {event.upper()} {of_str} ON {table_name} 
+                BEGIN {body} END;
+            """
+            ).commit()
+
+        lite_connection.execute(
+            f"INSERT INTO {fulltext_table} ({fulltext_table}) VALUES ('rebuild')"
+        ).commit()
+
+    @staticmethod
+    def _check_fulltext_columns(
+        table_name: str, fulltext_columns: list, compressed_columns: dict
+    ) -> None:
+        """Internal method. Raises ValueError if a column would be both compressed
+        and full-text indexed, since the index would then read compressed values."""
+
+        for column_name in fulltext_columns:
+            if column_name in compressed_columns:
+                raise ValueError(
+                    f"Column '{column_name}' of table '{table_name}' can't be both "
+                    "compressed and full-text indexed."
+                )
+
+    @staticmethod
+    def drop_fulltext_index(
+        table_name: str, lite_connection: LiteConnection = None
+    ) -> None:
+        """Drops the full-text index of a table, and the triggers maintaining it.
+
+        Args:
+            table_name (str): Table name
+            lite_connection (LiteConnection, optional): Defaults to Lite.DEFAULT_CONNECTION.
+        """
+
+        if not lite_connection:
+            lite_connection = Lite.DEFAULT_CONNECTION
+
+        for event in ["insert", "delete", "update"]:
+            lite_connection.execute(
+                f"DROP TRIGGER IF EXISTS {table_name}_fts_{event}"
+            ).commit()
+        lite_connection.execute(f"DROP TABLE IF EXISTS {table_name}_fts").commit()
+
+    @staticmethod
+    def track_changes(table_name: str, lite_connection: LiteConnection = None) -> None:
+        """Installs triggers recording every insert, update and delete on a table in
+        the change log, as (seq, table_name, row_id, op) rows, so consumers can process
+        changes incrementally. See Lite.changes_since().
+
+        Updates that only change the 'updated' field, such as those made by
+        the timestamp trigger, aren't recorded.
+
+        Args:
+            table_name (str): Table name
+            lite_connection (LiteConnection, optional): Defaults to Lite.DEFAULT_CONNECTION.
+
+        Raises:
+            TableNotFoundError: Table not found within database
+        """
+
+        if not lite_connection:
+            lite_connection = Lite.DEFAULT_CONNECTION
+
+        columns = [
+            column
+            for column in LiteTable(table_name, lite_connection).get_column_names()
+            if column not in ["id", "updated"]
+        ]
+        changed_str = " OR ".join(
+            f'OLD."{column}" IS NOT NEW."{column}"' for column in ["id"] + columns
+        )
+
+        # AUTOINCREMENT keeps sequence numbers of compacted changes from being reused
+        lite_connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {Lite.CHANGE_LOG_TABLE} (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                table_name TEXT NOT NULL,
+                row_id INTEGER NOT NULL,
+                op TEXT NOT NULL
+            )
+        """
+        ).commit()
+
+        for op, event, row in [
+            ("I", "INSERT", "NEW"),
+            ("U", "UPDATE", "NEW"),
+            ("D", "DELETE", "OLD"),
+        ]:
+            when_str = f"WHEN {changed_str}" if event == "UPDATE" else ""
+            lite_connection.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {table_name}_changes_{event.lower()} 
+                AFTER {event} ON {table_name} {when_str}
+                BEGIN INSERT INTO {Lite.CHANGE_LOG_TABLE} (table_name, row_id, op) 
+                VALUES ('{table_name}', {row}.id, '{op}'); END;
+            """
+            ).commit()
+
+    @staticmethod
+    def untrack_changes(
+        table_name: str, lite_connection: LiteConnection = None
+    ) -> None:
+        """Removes the triggers installed by LiteTable.track_changes().
+        Changes already recorded are kept.
+
+        Args:
+            table_name (str): Table name
+            lite_connection (LiteConnection, optional): Defaults to Lite.DEFAULT_CONNECTION.
+        """
+
+        if not lite_connection:
+            lite_connection = Lite.DEFAULT_CONNECTION
+
+        for event in ["insert", "update", "delete"]:
+            lite_connection.execute(
+                f"DROP TRIGGER IF EXISTS {table_name}_changes_{event}"
+            ).commit()
+
+    @staticmethod
+    def create_pivot(
+        table_name: str, foreign_keys: dict, lite_connection: LiteConnection = None
+    ) -> "LiteTable":
+        """Creates a compact pivot table within the database. The table holds only the
+        two foreign key columns, which form a composite primary key, and is created
+        WITHOUT ROWID, along with an index covering the reverse lookup.
+        Unlike .create(), no id, timestamp fields, or update trigger are added.
+
+        Args:
+            table_name (str): Table name
+            foreign_keys (dict): {
+                column_name: [foreign_table_name, foreign_column_name]
+            }
+
+        Raises:
+            ValueError: foreign_keys does not describe exactly two columns.
+        """
+
+        if len(foreign_keys) != 2:
+            raise ValueError("A pivot table must have exactly two foreign keys.")
+        if not lite_connection:
+            lite_connection = Lite.DEFAULT_CONNECTION
+
+        columns = list(foreign_keys)
+
+        table_desc = [f'"{column_name}" INTEGER NOT NULL' for column_name in columns]
+        table_desc.append(f'PRIMARY KEY("{columns[0]}", "{columns[1]}")')
+        table_desc.extend(
+            f"""
+                FOREIGN KEY("{column_name}") 
+                REFERENCES "{value_[0]}" ("{value_[1]}")
+            """
+            for column_name, value_ in foreign_keys.items()
+        )
+        table_desc_str = ",\n".join(table_desc)
+
+        lite_connection.execute(
+            f"""
+            CREATE TABLE "{table_name}" (
+                {table_desc_str}
+            ) WITHOUT ROWID;
+        """
+        ).commit()
+
+        # Reverse index, used for lookups from the second foreign key
         lite_connection.execute(
             f"""
-            CREATE TRIGGER update_timestamp_{table_name} 
-            AFTER UPDATE ON {table_name} 
-            BEGIN UPDATE {table_name} 
-            SET updated = CURRENT_TIMESTAMP 
-            WHERE id = OLD.id; END;
+            CREATE INDEX "{table_name}_{columns[1]}_{columns[0]}" 
+            ON "{table_name}" ("{columns[1]}", "{columns[0]}");
+        """
+        ).commit()
+
+        return LiteTable(table_name, lite_connection)
+
+    @staticmethod
+    def create_closure(
+        table_name: str, lite_connection: LiteConnection = None
+    ) -> "LiteTable":
+        """Creates a closure table storing (ancestor, descendant, depth) rows.
+        Used by LiteModel.tracks_hierarchy() for constant-time ancestry lookups.
+
+        Args:
+            table_name (str): Table name
+        """
+
+        if not lite_connection:
+            lite_connection = Lite.DEFAULT_CONNECTION
+
+        lite_connection.execute(
+            f"""
+            CREATE TABLE "{table_name}" (
+                "ancestor_id" INTEGER NOT NULL,
+                "descendant_id" INTEGER NOT NULL,
+                "depth" INTEGER NOT NULL,
+                PRIMARY KEY("ancestor_id", "descendant_id")
+            ) WITHOUT ROWID;
+        """
+        ).commit()
+
+        # Reverse index, used for ancestor lookups
+        lite_connection.execute(
+            f"""
+            CREATE INDEX "{table_name}_descendant" 
+            ON "{table_name}" ("descendant_id", "ancestor_id", "depth");
         """
         ).commit()
 
@@ -191,7 +648,40 @@ class LiteTable:
         if not lite_connection:
             lite_connection = Lite.DEFAULT_CONNECTION
 
+        LiteTable.drop_fulltext_index(table_name, lite_connection)
         lite_connection.execute(f"DROP TABLE IF EXISTS {table_name}").commit()
+        LiteCache.bump_table_version(lite_connection, table_name)
+
+    @staticmethod
+    def drop_timestamp_triggers(
+        table_names: list = None, lite_connection: LiteConnection = None
+    ) -> list:
+        """Drops the update triggers maintaining the 'updated' field of existing tables.
+        LiteTable.update_row() then sets the field within the UPDATE statement itself.
+
+        Args:
+            table_names (list, optional): Tables to migrate. Defaults to all tables.
+
+        Returns:
+            list: Names of the tables whose trigger was dropped
+        """
+
+        lite_connection = lite_connection or Lite.DEFAULT_CONNECTION
+
+        triggers = lite_connection.execute(
+            """
+            SELECT tbl_name, name FROM sqlite_master 
+            WHERE type='trigger' AND name = 'update_timestamp_' || tbl_name
+        """
+        ).fetchall()
+
+        dropped = []
+        for table_name, trigger_name in triggers:
+            if table_names is None or table_name in table_names:
+                lite_connection.execute(f"DROP TRIGGER {trigger_name}").commit()
+                dropped.append(table_name)
+
+        return dropped
 
     @staticmethod
     def get_table_names(lite_connection: LiteConnection = None) -> list:
@@ -215,19 +705,140 @@ class LiteTable:
 
     def get_column_names(self) -> list:
         """Returns a list of the table's column names.
+        Also caches the table's JSON columns, see .get_json_columns().
+
+        Returns:
+            list: Column names
+        """
+
+        columns = self.connection.execute(
+            f"PRAGMA table_info({self.table_name})"
+        ).fetchall()
+        self._json_columns = [
+            column[1] for column in columns if column[2].upper() == "JSON"
+        ]
+
+        return [column[1] for column in columns]
+
+    def get_json_columns(self) -> list:
+        """Returns the names of the table's columns declared with the JSON type.
 
         Returns:
             list: Column names
         """
 
+        if self._json_columns is None:
+            self.get_column_names()
+        return self._json_columns
+
+    def _encode_row(self, row: dict) -> dict:
+        """Internal method. Encodes the values of a row written to the table.
+        Values written to JSON columns are encoded as JSON text, except for None,
+        bytes and LiteTable.JSONText, which are written as stored. Values of
+        compressed columns are then compressed.
+
+        Args:
+            row (dict): {column_name: row_value,..}
+
+        Returns:
+            dict: {column_name: encoded_row_value,..}
+        """
+
+        json_columns = self.get_json_columns()
+        compressed_columns = LiteTable.COMPRESSED_COLUMNS.get(self.table_name, {})
+        if not json_columns and not compressed_columns:
+            return row
+
+        encoded_row = {}
+        for column, value in row.items():
+            if column in json_columns and not isinstance(
+                value, (type(None), bytes, LiteTable.JSONText)
+            ):
+                value = json.dumps(value)
+            if column in compressed_columns:
+                value = self._compress(column, value, *compressed_columns[column])
+            encoded_row[column] = value
+        return encoded_row
+
+    def _compress(self, column: str, value, algorithm: str, min_size: int):
+        """Internal method. Compresses a value written to a compressed column.
+        Bytes are always stored with a header, so they can't be mistaken for
+        compressed values, while text is stored as-is if not compressed.
+        LiteTable.CompressedValue values are written as stored."""
+
+        header = LiteTable.COMPRESSION_HEADER
+        if isinstance(value, LiteTable.CompressedValue):
+            return bytes(value)  # Already compressed
+        if not isinstance(value, (str, bytes)):
+            return value  # Not compressible
+
+        data = value.encode("utf-8") if isinstance(value, str) else value
+        kind = b"s" if isinstance(value, str) else b"b"
+
+        tag, compress, _ = LiteTable.COMPRESSION_ALGORITHMS[algorithm]
+        compressed = compress(data) if len(data) >= min_size else data
+        if len(compressed) < len(data):
+            stored = header + tag + kind + compressed
+        elif isinstance(value, str):
+            stored = value
+        else:
+            stored = header + b"-" + kind + data
+
+        stats = LiteTable.COMPRESSION_STATS.setdefault(
+            (self.table_name, column),
+            {"values": 0, "raw_bytes": 0, "stored_bytes": 0},
+        )
+        stats["values"] += 1
+        stats["raw_bytes"] += len(data)
+        stats["stored_bytes"] += len(data) if stored is value else len(stored)
+
+        return stored
+
+    def _decode_value(self, column: str, value):
+        """Internal method. Decodes a value read from the table, decompressing it
+        and decoding JSON. Used by LiteModel.__getattr__()."""
+
+        header = LiteTable.COMPRESSION_HEADER
+        if (
+            isinstance(value, bytes)
+            and value[: len(header)] == header
+            and column in LiteTable.COMPRESSED_COLUMNS.get(self.table_name, {})
+        ):
+            tag, kind, data = value[2:3], value[3:4], value[4:]
+            for algorithm in LiteTable.COMPRESSION_ALGORITHMS.values():
+                if tag == algorithm[0]:
+                    data = algorithm[2](data)
+            value = data.decode("utf-8") if kind == b"s" else data
+
+        if column in self.get_json_columns() and isinstance(value, (str, bytes)):
+            value = json.loads(value)
+
+        return value
+
+    def _is_encoded_column(self, column: str) -> bool:
+        """Internal method. Checks if values of a column are decoded when read,
+        because it's a JSON or compressed column."""
+
+        return column in self.get_json_columns() or column in (
+            LiteTable.COMPRESSED_COLUMNS.get(self.table_name, {})
+        )
+
+    def get_fulltext_columns(self) -> list:
+        """Returns the columns of the table's full-text index.
+        See LiteTable.create_fulltext_index().
+
+        Returns:
+            list: Column names, empty if the table has no full-text index
+        """
+
         return [
             column[1]
             for column in self.connection.execute(
-                f"PRAGMA table_info({self.table_name})"
+                f"PRAGMA table_info({self.table_name}_fts)"
             ).fetchall()
         ]
 
-    def insert_row(self, columns, or_ignore=False) -> None:
+    def insert_row(self, columns, or_ignore=False) -> int:
         """Inserts row into database table.
 
         Args:
@@ -235,8 +846,13 @@ class LiteTable:
                 column_name: row_value
             }
             or_ignore (bool, optional): Ignore if row already exists. Defaults to False.
+
+        Returns:
+            int: Row id of the inserted row
         """
 
+        columns = self._encode_row(columns)
+
         # Refactor pythonic variables into SQLite query string
         columns_str = ", ".join(list(columns))
 
@@ -248,7 +864,11 @@ class LiteTable:
             INTO {self.table_name} ({columns_str})
             VALUES({values_str})
         """
-        self.connection.execute(insert_sql, tuple(values_list)).commit()
+        result = self.connection.execute(insert_sql, tuple(values_list))
+        result.commit()
+        self._bump_version()
+
+        return result.lastrowid
 
     def update_row(
         self, update_columns: dict, where_columns: list, or_ignore: bool = False
@@ -265,11 +885,17 @@ class LiteTable:
             or_ignore (bool, optional): Ignore if row already exists. Defaults to False.
         """
 
+        update_columns = self._encode_row(update_columns)
+
         # Refactor pythonic variables into SQLite query string
         set_str = ",".join([f"{cname} = ?" for cname in update_columns])
         values_list = [
             update_columns[cname] for cname in update_columns
         ]  # collect update values
+
+        # Without an update trigger, set the 'updated' field within this statement
+        if self._sets_timestamp_inline() and "updated" not in update_columns:
+            set_str += ", updated = CURRENT_TIMESTAMP"
         where_str, where_values = self._where_to_string(where_columns)
 
         values_list += where_values
@@ -282,6 +908,7 @@ class LiteTable:
         """,
             tuple(values_list),
         ).commit()
+        self._bump_version()
 
     def select_rows(self, where_columns: list, result_columns: list = None) -> list:
         """Executes a select statement on database table.
@@ -296,6 +923,36 @@ class LiteTable:
             list: Query results
         """
 
+        sql_str, values = self._select_to_string(where_columns, result_columns)
+        return self.connection.execute(sql_str, values).fetchall()
+
+    def iter_rows(self, where_columns: list, result_columns: list = None):
+        """Executes a select statement on database table, yielding rows as they are
+        read rather than loading them all. Other queries may run on the connection
+        while rows are streamed.
+
+        Args:
+            where_columns (list): [
+                [column_name, ('=','<','>','LIKE'), column_value]
+            ]
+            result_columns (list, optional): List of columns to include in results. Defaults to all.
+
+        Yields:
+            tuple: Query result rows
+        """
+
+        sql_str, values = self._select_to_string(where_columns, result_columns)
+        with self.connection.execute(sql_str, values) as result:
+            yield from result
+
+    def _select_to_string(self, where_columns: list, result_columns: list = None):
+        """Internal method. Builds the select statement used by .select_rows() and
+        .iter_rows().
+
+        Returns:
+            tuple: (sql_str, values)
+        """
+
         if not result_columns:
             result_columns = ["*"]
 
@@ -307,7 +964,7 @@ class LiteTable:
         if not where_columns:
             sql_str = f"SELECT {get_str} FROM {self.table_name}"
 
-        return self.connection.execute(sql_str, tuple(values_list)).fetchall()
+        return sql_str, tuple(values_list)
 
     def delete_rows(self, where_columns: list = None) -> None:
         """Deletes rows from a database table. If where_columns is an empty list, deletes all rows.
@@ -327,6 +984,364 @@ class LiteTable:
             sql_str = f"DELETE FROM {self.table_name} WHERE {where_str}"
 
         self.connection.execute(sql_str, tuple(values_list)).commit()
+        self._bump_version()
+
+    def insert_many(self, columns: list, rows: list, or_ignore: bool = False) -> None:
+        """Inserts many rows into database table using multi-row INSERT statements.
+
+        Args:
+            columns (list): [column_name,..]
+            rows (list): [(row_value,..),..] ordered as columns
+            or_ignore (bool, optional): Ignore rows that already exist. Defaults to False.
+        """
+
+        if self.get_json_columns() or self.table_name in LiteTable.COMPRESSED_COLUMNS:
+            rows = [
+                tuple(self._encode_row(dict(zip(columns, row))).values())
+                for row in rows
+            ]
+
+        columns_str = ", ".join(columns)
+        row_str = f"({', '.join('?' for _ in columns)})"
+
+        with self.connection.transaction():
+            for chunk in self._chunk_rows(rows, len(columns)):
+                self.connection.execute(
+                    f"""
+                    INSERT {'OR IGNORE' if or_ignore else ''} 
+                    INTO {self.table_name} ({columns_str})
+                    VALUES {', '.join(row_str for _ in chunk)}
+                """,
+                    tuple(value for row in chunk for value in row),
+                ).commit()
+        self._bump_version()
+
+    def insert_rows(self, rows: list, or_ignore: bool = False) -> None:
+        """Inserts many rows into database table within a single transaction.
+        Rows with the same columns are inserted by a single prepared statement.
+
+        Args:
+            rows (list): [{column_name: row_value,..},..]
+            or_ignore (bool, optional): Ignore rows that already exist. Defaults to False.
+        """
+
+        with self.connection.transaction():
+            for columns, values_list in self._group_rows(rows):
+                self.connection.execute_many(
+                    f"""
+                    INSERT {'OR IGNORE' if or_ignore else ''} 
+                    INTO {self.table_name} ({', '.join(columns)})
+                    VALUES({', '.join('?' for _ in columns)})
+                """,
+                    values_list,
+                )
+        self._bump_version()
+
+    def update_rows(self, rows: list) -> int:
+        """Updates many rows of database table, keyed by id, within a single transaction.
+        Rows updating the same columns are updated by a single prepared statement.
+
+        Args:
+            rows (list): [{"id": row_id, column_name: updated_row_value,..},..]
+
+        Raises:
+            ValueError: A row has no id
+
+        Returns:
+            int: Number of rows updated
+        """
+
+        if any("id" not in row for row in rows):
+            raise ValueError("Rows passed to .update_rows() must include an id.")
+
+        rowcount = 0
+        with self.connection.transaction():
+            for columns, values_list in self._group_rows(rows):
+                update_columns = [column for column in columns if column != "id"]
+                if not update_columns:
+                    continue
+
+                set_str = ", ".join(f"{column} = ?" for column in update_columns)
+                if self._sets_timestamp_inline() and "updated" not in columns:
+                    set_str += ", updated = CURRENT_TIMESTAMP"
+
+                id_index = columns.index("id")
+                rowcount += self.connection.execute_many(
+                    f"UPDATE {self.table_name} SET {set_str} WHERE id = ?",
+                    (
+                        tuple(v for i, v in enumerate(values) if i != id_index)
+                        + (values[id_index],)
+                        for values in values_list
+                    ),
+                )
+        self._bump_version()
+        return rowcount
+
+    def delete_rows_by_ids(self, ids: list) -> int:
+        """Deletes the rows with the given ids within a single transaction.
+
+        Args:
+            ids (list): [row_id,..]
+
+        Returns:
+            int: Number of rows deleted
+        """
+
+        rowcount = self.connection.execute_many(
+            f"DELETE FROM {self.table_name} WHERE id = ?", ((_id,) for _id in ids)
+        )
+        self._bump_version()
+        return rowcount
+
+    def upsert_rows(
+        self, rows: list, conflict_columns: list, update_columns: list = None
+    ) -> list:
+        """Inserts rows into database table, or updates the existing rows they conflict
+        with, using INSERT ... ON CONFLICT DO UPDATE. Rows are written by multi-row
+        statements within a single transaction, so concurrent writers can't interleave.
+
+        Args:
+            rows (list): [{column_name: row_value,..},..]
+            conflict_columns (list): [column_name,..] Columns of a unique index or
+                primary key, identifying existing rows
+            update_columns (list, optional): [column_name,..] Columns updated on conflict.
+                Defaults to the rows' other columns. If empty, existing rows are left as-is.
+
+        Raises:
+            ValueError: A row is missing a conflict column
+
+        Returns:
+            list: Ids of the inserted or updated rows, in the order of the passed rows
+        """
+
+        if any(column not in row for row in rows for column in conflict_columns):
+            raise ValueError(
+                "Rows passed to .upsert_rows() must include conflict columns."
+            )
+
+        row_ids = {}
+        conflict_str = ", ".join(conflict_columns)
+        with self.connection.transaction():
+            for columns, values_list in self._group_rows(rows):
+                set_columns = update_columns
+                if set_columns is None:
+                    set_columns = [
+                        column
+                        for column in columns
+                        if column not in conflict_columns and column != "id"
+                    ]
+
+                set_str = ", ".join(
+                    f"{column} = excluded.{column}" for column in set_columns
+                )
+                if set_str and self._sets_timestamp_inline():
+                    if "updated" not in columns:
+                        set_str += ", updated = CURRENT_TIMESTAMP"
+                conflict_action = f"DO UPDATE SET {set_str}" if set_str else "DO NOTHING"
+
+                row_str = f"({', '.join('?' for _ in columns)})"
+                for chunk in self._chunk_rows(values_list, len(columns)):
+                    returned_rows = self.connection.execute(
+                        f"""
+                        INSERT INTO {self.table_name} ({', '.join(columns)})
+                        VALUES {', '.join(row_str for _ in chunk)}
+                        ON CONFLICT ({conflict_str}) {conflict_action}
+                        RETURNING id, {conflict_str}
+                    """,
+                        tuple(value for row in chunk for value in row),
+                    ).fetchall()
+
+                    for returned_row in returned_rows:
+                        row_ids[returned_row[1:]] = returned_row[0]
+
+            keys = [
+                tuple(self._encode_row(row)[column] for column in conflict_columns)
+                for row in rows
+            ]
+            ids = [row_ids.get(key) for key in keys]
+
+            # Rows left as-is by DO NOTHING aren't returned, and returned keys
+            # may have been converted by the columns' type affinity
+            missing_rows = [
+                (index, *key) for index, key in enumerate(keys) if ids[index] is None
+            ]
+            for index, _id in self._select_ids_by_key(conflict_columns, missing_rows):
+                ids[index] = _id
+
+        self._bump_version()
+        return ids
+
+    def _select_ids_by_key(self, columns: list, rows: list) -> list:
+        """Internal method. Selects the ids of the rows matching keys, compared by
+        SQLite so the columns' type affinity applies to them as when written.
+
+        Args:
+            columns (list): [column_name,..]
+            rows (list): [(index, key_value,..),..] key values ordered as columns
+
+        Returns:
+            list: [(index, id),..] for each key matching a row
+        """
+
+        keys_str = ", ".join(["lite_index", *(f'"{column}"' for column in columns)])
+        join_str = " AND ".join(
+            f'{self.table_name}."{column}" = lite_keys."{column}"' for column in columns
+        )
+        row_str = f"({', '.join('?' for _ in range(len(columns) + 1))})"
+
+        results = []
+        for chunk in self._chunk_rows(rows, len(columns) + 1):
+            results.extend(
+                self.connection.execute(
+                    f"""
+                    WITH lite_keys ({keys_str}) 
+                    AS (VALUES {', '.join(row_str for _ in chunk)}) 
+                    SELECT lite_keys.lite_index, {self.table_name}.id FROM lite_keys 
+                    JOIN {self.table_name} ON {join_str}
+                """,
+                    tuple(value for row in chunk for value in row),
+                ).fetchall()
+            )
+        return results
+
+    def _group_rows(self, rows: list) -> list:
+        """Internal method. Groups rows by their set of columns, encoding their values.
+
+        Args:
+            rows (list): [{column_name: row_value,..},..]
+
+        Returns:
+            list: [(columns <list>, values_list <list>),..]
+        """
+
+        groups = {}
+        for row in rows:
+            values = tuple(self._encode_row(row).values())
+            groups.setdefault(tuple(row), []).append(values)
+        return [(list(columns), values_list) for columns, values_list in groups.items()]
+
+    def select_many(
+        self, columns: list, rows: list, result_columns: list = None
+    ) -> list:
+        """Selects the rows whose values for the given columns match any of the passed rows.
+
+        Args:
+            columns (list): [column_name,..]
+            rows (list): [(row_value,..),..] ordered as columns
+            result_columns (list, optional): List of columns to include in results.
+                Defaults to columns.
+
+        Returns:
+            list: Query results
+        """
+
+        get_str = ", ".join(result_columns or columns)
+        results = []
+        for chunk, in_str in self._chunk_row_values(columns, rows):
+            results.extend(
+                self.connection.execute(
+                    f"SELECT {get_str} FROM {self.table_name} WHERE {in_str}",
+                    tuple(value for row in chunk for value in row),
+                ).fetchall()
+            )
+        return results
+
+    def delete_many(self, columns: list, rows: list) -> None:
+        """Deletes the rows whose values for the given columns match any of the passed rows.
+
+        Args:
+            columns (list): [column_name,..]
+            rows (list): [(row_value,..),..] ordered as columns
+        """
+
+        with self.connection.transaction():
+            for chunk, in_str in self._chunk_row_values(columns, rows):
+                self.connection.execute(
+                    f"DELETE FROM {self.table_name} WHERE {in_str}",
+                    tuple(value for row in chunk for value in row),
+                ).commit()
+        self._bump_version()
+
+    def _bump_version(self) -> None:
+        """Internal method. Invalidates cached query results that read from the table.
+        Within a transaction, they're invalidated again once it ends, since results
+        cached in the meantime may predate the commit."""
+
+        LiteCache.bump_table_version(self.connection, self.table_name)
+
+        if self.connection.in_transaction():
+            self.connection.after_transaction(
+                lambda: LiteCache.bump_table_version(self.connection, self.table_name)
+            )
+
+    def _chunk_rows(self, rows: list, width: int):
+        """Internal method. Splits rows into chunks that stay within MAX_VARIABLES.
+
+        Args:
+            rows (list): Rows to split
+            width (int): Number of values per row
+
+        Yields:
+            list: Chunk of rows
+        """
+
+        rows = list(rows)
+        chunk_size = max(1, self.MAX_VARIABLES // max(1, width))
+        for i in range(0, len(rows), chunk_size):
+            yield rows[i : i + chunk_size]
+
+    def _chunk_row_values(self, columns: list, rows: list):
+        """Internal method. Splits rows into chunks and generates a
+        `(column,..) IN (VALUES (?,..),..)` SQL substring for each.
+
+        Yields:
+            tuple: (chunk <list>, sql_substr <str>)
+        """
+
+        row_str = f"({', '.join('?' for _ in columns)})"
+        for chunk in self._chunk_rows(rows, len(columns)):
+            values_str = ", ".join(row_str for _ in chunk)
+            yield chunk, f"({', '.join(columns)}) IN (VALUES {values_str})"
+
+    @property
+    def has_timestamp_trigger(self) -> bool:
+        """Whether the table's 'updated' field is maintained by an update trigger.
+        Looked up again whenever the database schema changes, so triggers dropped or
+        created after this instance was made are taken into account."""
+
+        schema_version = self._read_schema_version()
+        if schema_version != self._schema_version:
+            self._has_timestamp_trigger = bool(
+                self.connection.execute(
+                    f"""
+                    SELECT 1 
+                    FROM sqlite_master 
+                    WHERE type='trigger' 
+                    AND name='update_timestamp_{self.table_name}'
+                """
+                ).fetchall()
+            )
+            self._schema_version = schema_version
+            self._inline_timestamp = None
+            self._json_columns = None
+        return self._has_timestamp_trigger
+
+    def _read_schema_version(self) -> int:
+        """Internal method. Reads PRAGMA schema_version, which SQLite bumps on
+        every schema change."""
+
+        return self.connection.execute("PRAGMA schema_version").fetchone()[0]
+
+    def _sets_timestamp_inline(self) -> bool:
+        """Internal method. Checks if the table has an 'updated' field
+        that isn't maintained by an update trigger."""
+
+        has_timestamp_trigger = self.has_timestamp_trigger  # Refreshes stale caches
+        if self._inline_timestamp is None:
+            self._inline_timestamp = (
+                not has_timestamp_trigger and "updated" in self.get_column_names()
+            )
+        return self._inline_timestamp
 
     def _where_to_string(self, where_columns: list) -> tuple:
         """Internal method. Converts where_columns dict to a proper SQL query substring.
@@ -396,21 +1411,25 @@ class LiteTable:
             lite_connection = Lite.DEFAULT_CONNECTION
         self.connection = lite_connection
 
-        # Check if table with provided name exists
-        if (
-            len(
-                self.connection.execute(
-                    f"""
-            SELECT name 
+        # Check if table with provided name exists, and look up its update trigger
+        schema_rows = self.connection.execute(
+            f"""
+            SELECT type, name 
             FROM sqlite_master 
-            WHERE type='table' 
-            AND name='{table_name}'
+            WHERE type IN ('table', 'trigger') 
+            AND tbl_name='{table_name}'
         """
-                ).fetchall()
-            )
-            < 1
-        ):  # Table doesn't exist
+        ).fetchall()
+
+        if ("table", table_name) not in schema_rows:  # Table doesn't exist
             raise TableNotFoundError(table_name)
 
         # Store database and table attributes for later use
         self.table_name = table_name
+        self._has_timestamp_trigger = (
+            "trigger",
+            f"update_timestamp_{table_name}",
+        ) in schema_rows
+        self._schema_version = self._read_schema_version()
+        self._inline_timestamp = None  # Determined by ._sets_timestamp_inline()
+        self._json_columns = None  # Determined by .get_json_columns()
@@ -0,0 +1,270 @@
+"""Contains the LiteWriter class"""
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from pylite import LiteConnection, LiteTable
+
+
+class LiteWriter:
+    """Applies writes submitted from any number of threads through a single background
+    writer thread. Queued writes are grouped into shared transactions, committed every
+    `max_batch` operations or `max_delay` seconds, whichever comes first.
+
+    Each write method returns a concurrent.futures.Future, resolved once the transaction
+    containing the write has been committed. A write that raises only fails its own
+    future; the other writes in its group are unaffected.
+
+    Usage:
+        with LiteWriter("database.sqlite") as writer:
+            future = writer.insert_row("people", {"name": "John"})
+            person_id = future.result()
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        max_batch: int = 100,
+        max_delay: float = 0.005,
+        **connection_args,
+    ) -> None:
+        """LiteWriter initializer. Opens the writer connection on the background thread.
+
+        Args:
+            database_path (str): Path to the database
+            max_batch (int, optional): Maximum writes per transaction. Defaults to 100.
+            max_delay (float, optional): Maximum seconds a write waits for others to
+                join its transaction. Defaults to 0.005.
+            **connection_args: Arguments passed to LiteConnection.
+
+        Raises:
+            DatabaseNotFoundError: Database not found
+        """
+
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.stats = {"operations": 0, "transactions": 0}
+
+        self._closed = False
+        self._lock = threading.Lock()  # Orders writes queued against .close()
+        self._queue = queue.Queue()
+        self._tables = {}  # Used only by the writer thread
+        self._undo_callbacks = []  # Used only by the writer thread
+
+        connected = Future()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(database_path, connection_args, connected),
+            name="pylite-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+        # Re-raise connection errors in the calling thread
+        connected.result()
+
+    def __enter__(self) -> "LiteWriter":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _run(self, database_path: str, connection_args: dict, connected: Future):
+        """Internal method. Body of the writer thread."""
+
+        try:
+            self.connection = LiteConnection(database_path, **connection_args)
+        except Exception as exc:
+            connected.set_exception(exc)
+            return
+        connected.set_result(True)
+
+        stopping = False
+        while not stopping:
+            operation = self._queue.get()
+            if operation is None:
+                break
+
+            # Collect further writes until the group is full or its deadline passes
+            batch = [operation]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    operation = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if operation is None:
+                    stopping = True
+                    break
+                batch.append(operation)
+
+            self._apply(batch)
+
+        self.connection.close()
+
+    def _apply(self, batch: list) -> None:
+        """Internal method. Applies a group of writes within a single transaction,
+        isolating each write in a savepoint."""
+
+        def _apply_group():
+            # Undo changes to model instances made by a rolled back attempt
+            self._undo()
+
+            outcomes = []
+            for func, future in batch:
+                undo_count = len(self._undo_callbacks)
+                try:
+                    with self.connection.transaction():
+                        outcomes.append((future, func(self.connection), None))
+                except sqlite3.OperationalError as exc:
+                    if self.connection._is_lock_error(exc):
+                        raise
+                    self._undo(undo_count)
+                    outcomes.append((future, None, exc))
+                except Exception as exc:
+                    self._undo(undo_count)
+                    outcomes.append((future, None, exc))
+            return outcomes
+
+        try:
+            # Retried as a whole if the database is locked by another process
+            outcomes = self.connection.run_transaction(_apply_group)
+        except Exception as exc:
+            # The transaction failed, so none of the writes were applied
+            self._undo()
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        self._undo_callbacks.clear()
+
+        self.stats["operations"] += len(batch)
+        self.stats["transactions"] += 1
+
+        for future, result, exc in outcomes:
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def _on_rollback(self, callback) -> None:
+        """Internal method. Registers a function undoing changes made outside the
+        database by the current write, called if its transaction is rolled back."""
+
+        self._undo_callbacks.append(callback)
+
+    def _undo(self, undo_count: int = 0) -> None:
+        """Internal method. Calls the functions registered by ._on_rollback() since
+        `undo_count` were registered, most recent first."""
+
+        while len(self._undo_callbacks) > undo_count:
+            self._undo_callbacks.pop()()
+
+    def _get_table(self, table_name: str) -> LiteTable:
+        """Internal method. Returns a cached LiteTable bound to the writer connection."""
+
+        if table_name not in self._tables:
+            self._tables[table_name] = LiteTable(table_name, self.connection)
+        return self._tables[table_name]
+
+    def submit(self, func) -> Future:
+        """Queues a function to run on the writer thread within a grouped transaction.
+
+        Args:
+            func (callable): Called with the writer's LiteConnection
+
+        Raises:
+            RuntimeError: The writer has been closed.
+
+        Returns:
+            Future: Resolves to the function's return value once committed
+        """
+
+        with self._lock:
+            if self._closed or not self._thread.is_alive():
+                raise RuntimeError("This LiteWriter has been closed.")
+
+            future = Future()
+            self._queue.put((func, future))
+        return future
+
+    def insert_row(self, table_name: str, columns: dict, or_ignore=False) -> Future:
+        """Queues LiteTable.insert_row().
+
+        Returns:
+            Future: Resolves to the row id of the inserted row
+        """
+
+        return self.submit(
+            lambda _: self._get_table(table_name).insert_row(columns, or_ignore)
+        )
+
+    def update_row(
+        self,
+        table_name: str,
+        update_columns: dict,
+        where_columns: list,
+        or_ignore: bool = False,
+    ) -> Future:
+        """Queues LiteTable.update_row().
+
+        Returns:
+            Future: Resolves to None once committed
+        """
+
+        return self.submit(
+            lambda _: self._get_table(table_name).update_row(
+                update_columns, where_columns, or_ignore
+            )
+        )
+
+    def delete_rows(self, table_name: str, where_columns: list = None) -> Future:
+        """Queues LiteTable.delete_rows().
+
+        Returns:
+            Future: Resolves to None once committed
+        """
+
+        return self.submit(
+            lambda _: self._get_table(table_name).delete_rows(where_columns)
+        )
+
+    def save(self, model_instance) -> Future:
+        """Queues LiteModel.save() for a model instance.
+
+        Args:
+            model_instance (LiteModel): Model instance to save
+
+        Returns:
+            Future: Resolves to the model instance's id once committed
+        """
+
+        def _save(_):
+            saved_state = (model_instance.id, model_instance._saved_values)
+
+            def _restore():
+                model_instance.id, model_instance._saved_values = saved_state
+
+            self._on_rollback(_restore)
+
+            model_instance._save_to(self._get_table(model_instance.table.table_name))
+            return model_instance.id
+
+        return self.submit(_save)
+
+    def flush(self) -> None:
+        """Blocks until every write queued so far has been committed."""
+
+        self.submit(lambda _: None).result()
+
+    def close(self) -> None:
+        """Commits queued writes, then stops the writer thread and closes its connection."""
+
+        with self._lock:
+            if not self._closed and self._thread.is_alive():
+                self._queue.put(None)
+            self._closed = True
+        self._thread.join()
@@ -48,3 +48,10 @@ class Sibling(LiteModel):
 
 
 Sibling.pivots_with(Sibling, "sibling_sibling")
+
+
+class Category(LiteModel):
+    table_name = "categories"
+
+    def parent(self) -> LiteModel:
+        return self.belongs_to(Category)
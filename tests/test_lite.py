@@ -57,6 +57,30 @@ class TestLite(unittest.TestCase):
         with self.assertRaises(DatabaseAlreadyExistsError):
             Lite.create_database(TEST_DB_PATH)
 
+        # Test that named in-memory databases are kept alive until dropped
+        memory_db = LiteConnection.memory_database("test_create_database")
+        Lite.create_database(memory_db)
+        with self.assertRaises(DatabaseAlreadyExistsError):
+            Lite.create_database(memory_db)
+
+        conn = LiteConnection(memory_db)
+        conn.execute("CREATE TABLE test_table (id INTEGER)").commit()
+        conn.close()
+        conn = LiteConnection(memory_db)
+        self.assertEqual(
+            conn.execute("SELECT name FROM sqlite_master").fetchall(),
+            [("test_table",)],
+        )
+        conn.close()
+
+        Lite.drop_memory_database(memory_db)
+        with self.assertRaises(DatabaseNotFoundError):
+            Lite.drop_memory_database(memory_db)
+
+        # Test that file URIs are created on disk
+        Lite.create_database("file:uri.sqlite?mode=rw")
+        self.assertTrue(os.path.exists("uri.sqlite"))
+
     # Test Lite.connect()
     def test_connect(self):
         conn = LiteConnection(database_path=TEST_DB_PATH)
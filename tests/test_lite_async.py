@@ -0,0 +1,74 @@
+import os
+import glob
+import threading
+import unittest
+from tests import *
+
+# Define the database path for the test database
+TEST_DB_PATH = "test.sqlite"
+
+
+class TestLiteAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        Lite.create_database(TEST_DB_PATH)
+        self.conn = AsyncLiteConnection(TEST_DB_PATH)
+        Lite.connect(self.conn)
+
+        LiteTable.create("people", {"name": "TEXT", "age": "INTEGER"})
+
+    def tearDown(self):
+        Lite.disconnect()
+
+        # remove test database
+        for file_name in glob.glob("*.sqlite*"):
+            os.remove(file_name)
+
+    async def test_models(self):
+        person = await Person.acreate({"name": "John", "age": 25})
+        self.assertEqual((await Person.afind(person.id)).name, "John")
+
+        person.age = 26
+        await person.asave()
+        await person.afresh()
+        self.assertEqual(person.age, 26)
+
+        self.assertEqual(len(await Person.aall()), 1)
+
+        await person.adelete()
+        self.assertIsNone(await Person.afind(1))
+        with self.assertRaises(ModelInstanceNotFoundError):
+            await Person.afind_or_fail(1)
+
+    async def test_queries(self):
+        for age in range(10):
+            await Person.acreate({"name": f"Person {age}", "age": age})
+
+        query = Person.where("age").is_greater_than(4)
+        self.assertEqual(len(await query.aall()), 5)
+        self.assertEqual((await query.afirst()).age, 5)
+        self.assertEqual((await query.alast()).age, 9)
+
+        ages = [person.age async for person in query.aiter(batch_size=2)]
+        self.assertEqual(ages, [5, 6, 7, 8, 9])
+
+        # Rows are built from the query itself, keeping its column selection
+        people = [person async for person in query.only("name").aiter(batch_size=2)]
+        self.assertEqual(people[0].name, "Person 5")
+        self.assertTrue(people[0]._is_deferred("age"))
+
+        LiteTable.create_fulltext_index("people", ["name"])
+        query = Person.where("name").matches("5", snippet=True)
+        people = [person async for person in query.aiter()]
+        self.assertEqual(people[0].name_snippet, "Person <b>5</b>")
+
+    async def test_executor_thread(self):
+        # Test that queries run on the connection's executor thread
+        thread_names = await self.conn.run(lambda: threading.current_thread().name)
+        self.assertTrue(thread_names.startswith("pylite"))
+
+        rows = await self.conn.aexecute("SELECT COUNT(*) FROM people")
+        self.assertEqual(rows, [(0,)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import glob
+import time
+import unittest
+from tests import *
+
+# Define the database path for the test database
+TEST_DB_PATH = "test.sqlite"
+
+
+class TestLiteCache(unittest.TestCase):
+    def setUp(self):
+        Lite.create_database(TEST_DB_PATH)
+        Lite.connect(LiteConnection(TEST_DB_PATH))
+
+        LiteTable.create("people", {"name": "TEXT", "age": "INTEGER"})
+        self.person = Person.create({"name": "John", "age": 25})
+        self.cache = Lite.enable_query_cache()
+
+    def tearDown(self):
+        Lite.disable_query_cache()
+        Lite.disconnect()
+
+        # remove test database
+        for file_name in glob.glob("*.sqlite*"):
+            os.remove(file_name)
+
+    def test_query_cache(self):
+        query = Person.where("name").is_equal_to("John")
+        self.assertEqual(query.first().id, self.person.id)
+        self.assertEqual(query.all().model_keys(), [self.person.id])
+        self.assertEqual(query.first().id, self.person.id)
+        self.assertEqual(self.cache.stats["hits"], 1)
+        self.assertEqual(self.cache.stats["misses"], 2)
+
+        # Test that writes through LiteTable invalidate cached results
+        self.person.name = "Jack"
+        self.person.save()
+        self.assertIsNone(query.first())
+        self.assertEqual(self.cache.stats["invalidations"], 1)
+
+        Person.create({"name": "John", "age": 30})
+        self.assertEqual(len(Person.where("name").is_equal_to("John").all()), 1)
+
+        # Test that writes within a transaction invalidate results cached before commit
+        with Lite.DEFAULT_CONNECTION.transaction():
+            Person.create({"name": "John", "age": 35})
+            self.assertEqual(len(query.all()), 2)
+        self.assertEqual(len(query.all()), 2)
+
+    def test_eviction(self):
+        cache = Lite.enable_query_cache(max_entries=2, ttl=0.05)
+        for name in ["John", "Jane", "Jack"]:
+            Person.where("name").is_equal_to(name).all()
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats["evictions"], 1)
+
+        Person.where("name").is_equal_to("Jack").all()
+        self.assertEqual(cache.stats["hits"], 1)
+
+        time.sleep(0.1)
+        Person.where("name").is_equal_to("Jack").all()
+        self.assertEqual(cache.stats["hits"], 1)
+
+    def test_data_version(self):
+        cache = Lite.enable_query_cache(check_data_version=True)
+        query = Person.where("age").is_equal_to(25)
+        self.assertEqual(len(query.all()), 1)
+
+        # Test that writes from other connections invalidate cached results
+        other = LiteConnection(TEST_DB_PATH)
+        other.execute("DELETE FROM people").commit()
+        other.close()
+
+        self.assertEqual(len(query.all()), 0)
+        self.assertEqual(cache.stats["hits"], 0)
+
+        # Test that checks don't reset rows being read from the shared cursor
+        Person.create({"name": "Jane", "age": 30})
+        Person.create({"name": "Jack", "age": 35})
+        cursor = Lite.DEFAULT_CONNECTION.cursor
+        cursor.execute("SELECT name FROM people")
+        cursor.fetchone()
+        cache._get_data_version(Lite.DEFAULT_CONNECTION)
+        self.assertEqual(len(cursor.fetchall()), 1)
+
+        # Test that results from other databases aren't invalidated
+        Lite.create_database("other.sqlite")
+        other = LiteConnection("other.sqlite")
+        other.execute("CREATE TABLE notes (body TEXT)").commit()
+        cache.fetch(other, ["notes"], "SELECT body FROM notes")
+
+        writer = LiteConnection(TEST_DB_PATH)
+        writer.execute("DELETE FROM people").commit()
+        writer.close()
+
+        cache.fetch(other, ["notes"], "SELECT body FROM notes")
+        self.assertEqual(cache.stats["hits"], 1)
+        other.close()
+
+    def test_database_keys(self):
+        # Test that private in-memory databases don't share cached results
+        first, second = LiteConnection(":memory:"), LiteConnection(":memory:")
+        for lite_connection, name in [(first, "John"), (second, "Jane")]:
+            LiteTable.create("people", {"name": "TEXT"}, lite_connection=lite_connection)
+            LiteTable("people", lite_connection).insert_row({"name": name})
+
+        sql_str = "SELECT name FROM people"
+        self.assertEqual(self.cache.fetch(first, ["people"], sql_str), [("John",)])
+        self.assertEqual(self.cache.fetch(second, ["people"], sql_str), [("Jane",)])
+
+        # Test that relative paths to the same file invalidate each other's results
+        relative = LiteConnection(f"./{TEST_DB_PATH}")
+        self.assertEqual(len(self.cache.fetch(relative, ["people"], sql_str)), 1)
+        LiteTable("people").insert_row({"name": "Jack", "age": 30})
+        self.assertEqual(len(self.cache.fetch(relative, ["people"], sql_str)), 2)
+        relative.close()
@@ -0,0 +1,87 @@
+import os
+import glob
+import sqlite3
+import unittest
+from tests import *
+
+# Define the database path for the test database
+TEST_DB_PATH = "test.sqlite"
+
+
+class TestLiteCheckpointer(unittest.TestCase):
+    def setUp(self):
+        Lite.create_database(TEST_DB_PATH)
+        self.conn = LiteConnection(TEST_DB_PATH, wal_autocheckpoint=0)
+        self.conn.execute("CREATE TABLE test_table (id INTEGER, name TEXT)").commit()
+
+    def tearDown(self):
+        self.conn.close()
+
+        # remove test database
+        for file_name in glob.glob("*.sqlite*"):
+            os.remove(file_name)
+
+    def insert_rows(self, count: int = 200):
+        with self.conn.transaction():
+            for i in range(count):
+                self.conn.execute(
+                    "INSERT INTO test_table VALUES (?, ?)", (i, "x" * 100)
+                )
+
+    def test_checkpoint(self):
+        self.insert_rows()
+        self.assertGreater(self.conn.wal_size(), 0)
+
+        result = self.conn.checkpoint("TRUNCATE")
+        self.assertFalse(result["busy"])
+        self.assertEqual(self.conn.wal_size(), 0)
+
+        with self.assertRaises(ValueError):
+            self.conn.checkpoint("NEVER")
+
+    def test_checkpointer(self):
+        blocked = []
+        checkpointer = self.conn.start_checkpointer(
+            interval=60, max_wal_size=0, on_blocked=blocked.append, busy_timeout=50
+        )
+
+        # Test that an oversized log is truncated
+        self.insert_rows()
+        checkpointer.checkpoint()
+        self.assertEqual(self.conn.wal_size(), 0)
+        self.assertEqual(checkpointer.metrics["checkpoints"], 1)
+        self.assertEqual(checkpointer.metrics["lag_frames"], 0)
+
+        # Test that checkpoints held back by a reader are reported
+        reader = sqlite3.connect(TEST_DB_PATH, isolation_level=None)
+        reader.execute("BEGIN")
+        reader.execute("SELECT COUNT(*) FROM test_table").fetchone()
+        self.insert_rows()
+
+        checkpointer.checkpoint("PASSIVE")
+        self.assertGreater(checkpointer.metrics["lag_frames"], 0)
+        self.assertEqual(blocked, [])
+
+        checkpointer.checkpoint("TRUNCATE")
+        self.assertEqual(len(blocked), 1)
+        self.assertEqual(blocked[0]["blocked"], 1)
+
+        reader.execute("COMMIT")
+        reader.close()
+
+        # Test that the checkpointer is stopped with its connection
+        self.conn.close()
+        with self.assertRaises(RuntimeError):
+            checkpointer.checkpoint()
+        self.conn = LiteConnection(TEST_DB_PATH)
+
+        with self.assertRaises(ValueError):
+            LiteCheckpointer(":memory:")
+
+        # Test that databases in rollback journal mode are rejected, not converted
+        self.conn.close()
+        self.conn = LiteConnection(TEST_DB_PATH, wal=False)
+        with self.assertRaises(ValueError):
+            LiteCheckpointer(TEST_DB_PATH)
+        mode = self.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "delete")
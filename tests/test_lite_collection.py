@@ -112,6 +112,28 @@ class TestLiteCollection(unittest.TestCase):
         with self.assertRaises(RelationshipError):
             self.dollar_bills.attach_many_to_all([self.person1, self.person2])
 
+    def test_save_all(self):
+        collection = LiteCollection([self.person1, self.person2, self.person3])
+        self.person1.age = 40
+        self.person2.name = "Janet Smith"
+        self.person2.age = 41
+
+        collection.save_all()
+        self.assertEqual(Person.find(self.person1.id).age, 40)
+        self.assertEqual(Person.find(self.person2.id).name, "Janet Smith")
+        self.assertIsNone(Person.find(self.person3.id).age)
+
+        # Test that only changed columns are written
+        stale = Person.find(self.person1.id)
+        stale.age = 50
+        self.person1.name = "Johnny Smith"
+        collection.save_all()
+        LiteCollection([stale]).save_all()
+
+        person = Person.find(self.person1.id)
+        self.assertEqual((person.name, person.age), ("Johnny Smith", 50))
+        self.assertEqual(self.person1._get_changed_columns(), {})
+
     def test_first(self):
         collection = LiteCollection([self.person1, self.person2])
 
@@ -221,6 +243,29 @@ class TestLiteCollection(unittest.TestCase):
 
         person1.delete()
 
+    def test_fresh_delta(self):
+        people = Person.create_many([{"name": f"Person {i}"} for i in range(5)])
+        copies = Person.where("name").starts_with("Person ").all()
+        self.assertEqual(copies.fresh(delta=True), [])
+
+        # Test that updated rows are reloaded, and deleted rows removed
+        people[0].name = "Renamed"
+        people[0].save()
+        deleted_id = people[1].id
+        people[1].delete()
+
+        removed = copies.fresh(delta=True)
+        self.assertEqual([person.id for person in removed], [deleted_id])
+        self.assertEqual(len(copies), 4)
+        self.assertEqual(copies[0].name, "Renamed")
+        self.assertFalse(copies[0]._get_changed_columns())
+
+        copies[1].name = "Unsaved"
+        copies.fresh()
+        self.assertEqual(copies[1].name, "Person 2")
+
+        copies.delete_all()
+
     def test_delete_all(self):
         all_people = Person.all()
         all_people.delete_all()
@@ -1,6 +1,7 @@
 import os
 import glob
 import sqlite3
+import threading
 import unittest
 from tests import *
 
@@ -49,6 +50,210 @@ class TestLiteConnection(unittest.TestCase):
         result = self.conn.execute(select_data_sql).fetchone()
         self.assertEqual(result, (1, "John"))
 
+    def test_streaming_results(self):
+        self.conn.execute("CREATE TABLE test_table (id INTEGER, name TEXT)").commit()
+        result = self.conn.execute(
+            "INSERT INTO test_table VALUES (?, ?), (?, ?), (?, ?)",
+            (1, "John", 2, "Jane", 3, "Jack"),
+        )
+        self.assertEqual(result.rowcount, 3)
+        self.assertEqual(result.lastrowid, 3)
+
+        # Test that results are independent of each other
+        pairs = []
+        with self.conn.execute("SELECT id FROM test_table ORDER BY id") as outer:
+            for (outer_id,) in outer:
+                inner = self.conn.execute(
+                    "SELECT id FROM test_table WHERE id > ?", (outer_id,)
+                )
+                pairs.extend((outer_id, inner_id) for (inner_id,) in inner)
+        self.assertEqual(pairs, [(1, 2), (1, 3), (2, 3)])
+
+        result = self.conn.execute("SELECT id FROM test_table ORDER BY id")
+        self.assertEqual(result.fetchmany(2), [(1,), (2,)])
+        self.assertEqual(result.fetchmany(2), [(3,)])
+
+    def test_execute_many(self):
+        self.conn.execute_script("""
+            CREATE TABLE test_table (id INTEGER, name TEXT);
+            CREATE TABLE log (name TEXT);
+            CREATE TRIGGER log_insert AFTER INSERT ON test_table BEGIN
+                INSERT INTO log VALUES (new.name);
+            END;
+            INSERT INTO test_table VALUES (0, 'semi;colon')
+            """)
+
+        rowcount = self.conn.execute_many(
+            "INSERT INTO test_table VALUES (?, ?)",
+            ((i, f"Person {i}") for i in range(1, 2501)),
+        )
+        self.assertEqual(rowcount, 2500)
+        self.assertEqual(
+            self.conn.execute("SELECT COUNT(*) FROM log").fetchone(), (2501,)
+        )
+
+        # Test that failed scripts and executions are rolled back as a whole
+        with self.assertRaises(sqlite3.OperationalError):
+            self.conn.execute_script(
+                "DELETE FROM test_table; INSERT INTO missing VALUES (1);"
+            )
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.conn.execute_many(
+                "DELETE FROM test_table WHERE id = ?", [(1,), (2, 3)]
+            )
+        self.assertEqual(
+            self.conn.execute("SELECT COUNT(*) FROM test_table").fetchone(), (2501,)
+        )
+
+    def test_transaction(self):
+        # Test that statements within a transaction are committed together
+        self.conn.execute("CREATE TABLE test_table (id INTEGER, name TEXT)").commit()
+        with self.conn.transaction():
+            self.conn.execute("INSERT INTO test_table VALUES (?, ?)", (1, "John"))
+            with self.conn.transaction():
+                self.conn.execute("INSERT INTO test_table VALUES (?, ?)", (2, "Jane"))
+
+        # Test that an exception rolls back the transaction
+        with self.assertRaises(ValueError):
+            with self.conn.transaction():
+                self.conn.execute("INSERT INTO test_table VALUES (?, ?)", (3, "Jack"))
+                raise ValueError
+
+        result = self.conn.execute("SELECT * FROM test_table").fetchall()
+        self.assertEqual(result, [(1, "John"), (2, "Jane")])
+
+    def test_pragma_profiles(self):
+        # Test that profiles and explicit overrides are applied at connect time
+        conn = LiteConnection(TEST_DB_PATH, profile="read_heavy", cache_size=-1000)
+        pragmas = conn.get_pragmas("synchronous", "cache_size", "temp_store")
+        self.assertEqual(
+            pragmas, {"synchronous": 1, "cache_size": -1000, "temp_store": 2}
+        )
+
+        # Test that a temporary profile restores the previous settings
+        with conn.use_profile("bulk_load"):
+            self.assertEqual(conn.get_pragmas("synchronous")["synchronous"], 0)
+        self.assertEqual(conn.get_pragmas("synchronous")["synchronous"], 1)
+
+        conn.apply_profile("durable")
+        self.assertEqual(conn.get_pragmas("synchronous")["synchronous"], 2)
+        conn.close()
+
+        with self.assertRaises(ValueError):
+            LiteConnection(TEST_DB_PATH, profile="unknown")
+        with self.assertRaises(ValueError):
+            LiteConnection(TEST_DB_PATH, journal_size_limit=100)
+        with self.assertRaises(ValueError):
+            self.conn.set_pragmas(synchronous="OFF; DROP TABLE x")
+
+    def test_lock_retries(self):
+        self.conn.execute("CREATE TABLE test_table (id INTEGER, name TEXT)").commit()
+
+        retrying = LiteConnection(
+            TEST_DB_PATH, retries=20, retry_delay=0.01, busy_timeout=0
+        )
+        failing = LiteConnection(TEST_DB_PATH, busy_timeout=0)
+
+        # Hold the write lock, then release it from another thread
+        holder = sqlite3.connect(
+            TEST_DB_PATH, isolation_level=None, check_same_thread=False
+        )
+        holder.execute("BEGIN IMMEDIATE")
+        release = threading.Timer(0.05, lambda: holder.execute("COMMIT"))
+
+        with self.assertRaises(sqlite3.OperationalError):
+            failing.execute("INSERT INTO test_table VALUES (?, ?)", (1, "John"))
+        self.assertEqual(failing.lock_stats["failures"], 1)
+
+        release.start()
+        retrying.execute("INSERT INTO test_table VALUES (?, ?)", (1, "John")).commit()
+        release.join()
+        self.assertGreater(retrying.lock_stats["retries"], 0)
+        self.assertEqual(retrying.lock_stats["failures"], 0)
+
+        # Test that whole transactions are retried
+        holder.execute("BEGIN IMMEDIATE")
+        release = threading.Timer(0.05, lambda: holder.execute("COMMIT"))
+        release.start()
+
+        def _insert(conn):
+            conn.execute("INSERT INTO test_table VALUES (?, ?)", (2, "Jane"))
+            return conn.execute("SELECT COUNT(*) FROM test_table").fetchone()[0]
+
+        self.assertEqual(retrying.run_transaction(_insert, retrying), 2)
+        release.join()
+
+        holder.close()
+        retrying.close()
+        failing.close()
+
+    def test_memory_databases(self):
+        # Test that private in-memory databases don't need to exist
+        conn = LiteConnection(":memory:")
+        conn.execute("CREATE TABLE test_table (id INTEGER)").commit()
+        self.assertEqual(
+            conn.execute("SELECT COUNT(*) FROM test_table").fetchone(), (0,)
+        )
+        conn.close()
+
+        # Test that connections to a named in-memory database share it
+        memory_db = LiteConnection.memory_database("test_memory_databases")
+        first, second = LiteConnection(memory_db), LiteConnection(memory_db)
+        first.execute("CREATE TABLE test_table (id INTEGER)").commit()
+        first.execute("INSERT INTO test_table VALUES (1)").commit()
+        self.assertEqual(second.execute("SELECT id FROM test_table").fetchall(), [(1,)])
+        first.close()
+        second.close()
+
+        # Test file URIs
+        self.conn.execute("CREATE TABLE test_table (id INTEGER)").commit()
+        conn = LiteConnection(f"file:{TEST_DB_PATH}?mode=ro")
+        self.assertEqual(
+            conn.execute("SELECT COUNT(*) FROM test_table").fetchone(), (0,)
+        )
+        with self.assertRaises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO test_table VALUES (1)")
+        conn.close()
+
+        with self.assertRaises(DatabaseNotFoundError):
+            LiteConnection("file:missing.sqlite")
+        conn = LiteConnection("file:created.sqlite?mode=rwc")
+        conn.close()
+        self.assertTrue(os.path.exists("created.sqlite"))
+
+    def test_backup(self):
+        self.conn.execute("CREATE TABLE test_table (id INTEGER, name TEXT)").commit()
+        with self.conn.transaction():
+            for i in range(500):
+                self.conn.execute(
+                    "INSERT INTO test_table VALUES (?, ?)", (i, "x" * 100)
+                )
+
+        # Test that backups are copied in steps, reporting progress
+        steps = []
+        stats = self.conn.backup_to(
+            "backup.sqlite",
+            pages_per_step=4,
+            progress=lambda copied, total: steps.append((copied, total)),
+        )
+        self.assertGreater(stats["steps"], 1)
+        self.assertEqual(steps[-1], (stats["pages"], stats["pages"]))
+
+        backup = LiteConnection("backup.sqlite")
+        self.assertEqual(
+            backup.execute("SELECT COUNT(*) FROM test_table").fetchone(), (500,)
+        )
+        backup.close()
+
+        # Test that snapshots are independent of the source database
+        snapshot = self.conn.snapshot_in_memory()
+        self.conn.execute("DELETE FROM test_table").commit()
+        self.assertEqual(
+            snapshot.execute("SELECT COUNT(*) FROM test_table").fetchone(), (500,)
+        )
+        self.assertEqual(snapshot.backup_stats["pages"], stats["pages"])
+        snapshot.close()
+
     def test_connection_modes(self):
         # Create test databases
         isolation_wal_db = "isolation_wal.sqlite"
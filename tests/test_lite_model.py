@@ -1,5 +1,6 @@
 import os
 import glob
+import json
 import unittest
 from tests import *
 
@@ -14,6 +15,15 @@ class Car(LiteModel):
         return self.belongs_to(Person)
 
 
+class Document(LiteModel):
+    table_name = "documents"
+
+
+class DocumentSummary(LiteModel):
+    table_name = "documents"
+    DEFERRED_COLUMNS = ["body"]
+
+
 class TestLiteModel(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -99,6 +109,12 @@ class TestLiteModel(unittest.TestCase):
             },
         )
 
+        Category.requires_table(
+            {"name": "TEXT", "parent_id": "INTEGER"},
+            {"parent_id": ["categories", "id"]},
+        )
+        Category.tracks_hierarchy("category_closure")
+
     @classmethod
     def tearDownClass(cls):
         """Delete the test database"""
@@ -326,6 +342,66 @@ class TestLiteModel(unittest.TestCase):
 
         self.assertEqual(sibling1.siblings().first(), sibling2)
 
+    def test_hierarchy(self):
+        """Test closure table maintenance for self-referential relationships"""
+
+        root = Category.create({"name": "root"})
+        child = Category.create({"name": "child"})
+        grandchild = Category.create({"name": "grandchild"})
+
+        child.attach(root)
+        grandchild.attach(child)
+
+        self.assertTrue(grandchild.is_descendant_of(root))
+        self.assertFalse(root.is_descendant_of(grandchild))
+        self.assertEqual(grandchild.path_length_to(root), 2)
+        self.assertEqual(root.path_length_to(child), 1)
+        self.assertEqual(root.descendants().model_keys(), [child.id, grandchild.id])
+        self.assertEqual(root.descendants(max_depth=1).model_keys(), [child.id])
+        self.assertEqual(grandchild.ancestors().model_keys(), [child.id, root.id])
+        self.assertEqual(grandchild.ancestors()[1].name, "root")
+
+        # Models without a closure table cannot be navigated as a hierarchy
+        with self.assertRaises(RelationshipError):
+            self.person.ancestors()
+        with self.assertRaises(RelationshipError):
+            self.person.descendants()
+        with self.assertRaises(RelationshipError):
+            self.person.is_descendant_of(self.person)
+        with self.assertRaises(RelationshipError):
+            self.person.path_length_to(self.person)
+
+        # Cycles and second parents are rejected
+        with self.assertRaises(RelationshipError):
+            root.attach(grandchild)
+        with self.assertRaises(RelationshipError):
+            grandchild.attach(root)
+
+        # Attaching several parents at once is rolled back as a whole
+        orphan = Category.create({"name": "orphan"})
+        with self.assertRaises(RelationshipError):
+            orphan.attach_many([child, root])
+        self.assertEqual(len(orphan.ancestors()), 0)
+        self.assertIsNone(Category.find(orphan.id).parent_id)
+        orphan.delete()
+
+        child.detach(root)
+        self.assertFalse(grandchild.is_descendant_of(root))
+        self.assertTrue(grandchild.is_descendant_of(child))
+
+        # Rebuilding from the foreign key column yields the same closure
+        child.attach(root)
+        root.rebuild_hierarchy()
+        self.assertEqual(root.descendants().model_keys(), [child.id, grandchild.id])
+
+        child.delete()
+        grandchild.fresh()
+        self.assertEqual(len(grandchild.ancestors()), 0)
+        self.assertEqual(len(root.descendants()), 0)
+
+        root.delete()
+        grandchild.delete()
+
     def test_all(self):
         """Test the all() method"""
 
@@ -385,6 +461,34 @@ class TestLiteModel(unittest.TestCase):
         new_pets.delete_all()
         assert len(Pet.all()) == 1
 
+    def test_upsert_many(self):
+        ids = Pet.upsert_many(
+            [
+                {"id": self.pet.id, "name": "Rex", "age": 4},
+                {"id": 1000, "name": "Tulip", "age": 3},
+            ],
+            ["id"],
+        )
+        self.assertEqual(ids, [self.pet.id, 1000])
+        self.assertEqual(Pet.find(self.pet.id).name, "Rex")
+        self.assertEqual(Pet.find(1000).name, "Tulip")
+
+        Pet.find(1000).delete()
+
+    def test_update_many(self):
+        pets = Pet.create_many([{"name": f"Pet {i}", "age": i} for i in range(10)])
+        updated = Pet.update_many(
+            [{"id": pet.id, "age": pet.age * 2} for pet in pets]
+            + [{"id": pets[0].id, "name": "Renamed"}]
+        )
+        self.assertEqual(updated, 11)
+
+        pets.fresh()
+        self.assertEqual([pet.age for pet in pets], [i * 2 for i in range(10)])
+        self.assertEqual(pets[0].name, "Renamed")
+
+        pets.delete_all()
+
     # def test_values(self):
     #     self.person.age = [{"value": 30, "unit": "years"}]
     #     self.person.save()
@@ -418,6 +522,58 @@ class TestLiteModel(unittest.TestCase):
         self.assertEqual(len(self.person.memberships()), 0)
         person2.delete()
 
+    def test_bulk_attach_detach(self):
+        """Test attaching and detaching many pivot relationships at once"""
+
+        people = Person.create_many([{"name": f"Person {i}"} for i in range(20)])
+        people.attach_many_to_all(self.memberships)
+
+        self.assertEqual(len(self.memberships[0].people()), 20)
+        self.assertEqual(len(people[5].memberships()), 2)
+
+        # Existing relationships raise unless ignored
+        with self.assertRaises(RelationshipError):
+            people[0].attach_many(self.memberships)
+        people[0].attach_many(self.memberships, or_ignore=True)
+
+        people.detach_from_all(self.memberships[0])
+        self.assertEqual(len(self.memberships[0].people()), 0)
+
+        with self.assertRaises(RelationshipError):
+            people[0].detach_many(self.memberships)
+        people[0].detach_many(self.memberships, or_ignore=True)
+        self.assertEqual(len(people[0].memberships()), 0)
+
+        people.delete_all()
+
+    def test_sync(self):
+        """Test the sync() method"""
+
+        membership3 = Membership.create({"name": "membership3"})
+        self.person.attach(self.memberships[0])
+
+        changes = self.person.sync(Membership, [self.memberships[1], membership3.id])
+        self.assertEqual(
+            changes,
+            {
+                "attached": [self.memberships[1].id, membership3.id],
+                "detached": [self.memberships[0].id],
+            },
+        )
+        self.assertEqual(
+            self.person.memberships().model_keys(),
+            [self.memberships[1].id, membership3.id],
+        )
+
+        # Unchanged relationships are not written
+        changes = self.person.sync(Membership, [membership3.id, self.memberships[1]])
+        self.assertEqual(changes, {"attached": [], "detached": []})
+
+        self.person.sync(Membership, [])
+        self.assertEqual(len(self.person.memberships()), 0)
+
+        membership3.delete()
+
     def test_save(self):
         """Test the save() method"""
 
@@ -515,3 +671,175 @@ class TestLiteModel(unittest.TestCase):
         self.assertIn(
             "Hello, world! Hello, world! Hello, world! Hello, w...", str(self.person)
         )
+
+    def test_json_columns(self):
+        """Test JSON columns, and queries on paths within them"""
+
+        Document.requires_table(
+            {"title": "TEXT", "payload": "JSON"},
+            json_indexes=[("payload", "$.user.id")],
+        )
+        documents = Document.create_many(
+            [
+                {"title": f"Document {i}", "payload": {"user": {"id": i % 3}}}
+                for i in range(6)
+            ]
+        )
+
+        # Test that values are decoded on first access, and cached
+        document = documents[1]
+        self.assertNotIn("payload", vars(document))
+        self.assertEqual(document.payload, {"user": {"id": 1}})
+        self.assertIs(document.payload, document.payload)
+
+        # Test that values changed in place are saved
+        document.payload["tags"] = ["a", "b"]
+        self.assertIn("payload", document._get_changed_columns())
+        document.save()
+        self.assertEqual(Document.find(document.id).payload["tags"], ["a", "b"])
+
+        # Test that untouched values are saved as stored
+        documents[2].title = "Renamed"
+        documents[2].save()
+        self.assertEqual(Document.find(documents[2].id).payload, {"user": {"id": 2}})
+
+        # Test queries on JSON paths, and that they use the path's index
+        query = Document.where_json("payload", "$.user.id").is_equal_to(1)
+        self.assertEqual(
+            [doc.id for doc in query.all()], [documents[1].id, documents[4].id]
+        )
+        self.assertEqual(
+            Document.where("title")
+            .is_equal_to("Renamed")
+            .or_where("payload")
+            .json_path("$.tags[1]")
+            .is_equal_to("b")
+            .all(),
+            [Document.find(documents[1].id), Document.find(documents[2].id)],
+        )
+
+        plan = Lite.DEFAULT_CONNECTION.execute(
+            f"EXPLAIN QUERY PLAN {query._select()}", query._get_params()
+        ).fetchall()
+        self.assertIn("documents_payload_$.user.id", str(plan))
+
+        with self.assertRaises(ValueError):
+            Document.where_json("payload", "$.user'); DROP TABLE documents; --")
+
+        # Test that JSON scalars round-trip
+        document.payload = "text"
+        document.save()
+        document.fresh()
+        self.assertEqual(document.payload, "text")
+
+        # Test that strings are encoded as JSON however they're written
+        created = Document.create({"title": "Created", "payload": "hello"})
+        Document.update_many([{"id": documents[3].id, "payload": "updated"}])
+        Document.upsert_many([{"id": documents[4].id, "payload": "upserted"}], ["id"])
+        self.assertEqual(
+            [Document.find(doc.id).payload for doc in [created, *documents[3:5]]],
+            ["hello", "updated", "upserted"],
+        )
+
+        # Test that undecoded text is saved as stored, not encoded again
+        created.title = "Renamed"
+        created.save()
+        self.assertEqual(Document.find(created.id).payload, "hello")
+
+        LiteTable.delete("documents")
+
+    def test_compressed_columns(self):
+        """Test that compressed columns are decompressed on first access"""
+
+        Document.requires_table(
+            {"title": "TEXT", "body": "TEXT", "payload": "JSON"},
+            compressed={"body": "lzma", "payload": "zlib"},
+        )
+        body = "All work and no play makes Jack a dull boy. " * 200
+        payload = {"words": ["all", "work", "and", "no", "play"] * 50}
+        document = Document.create({"title": "Novel", "body": body, "payload": payload})
+
+        stored = Lite.DEFAULT_CONNECTION.execute(
+            "SELECT length(body), length(payload) FROM documents"
+        ).fetchone()
+        self.assertLess(stored[0], len(body) / 10)
+        self.assertLess(stored[1], len(json.dumps(payload)) / 10)
+
+        self.assertNotIn("body", vars(document))
+        self.assertEqual(document.body, body)
+        self.assertEqual(document.payload, payload)
+        self.assertFalse(document._get_changed_columns())
+
+        # Test saving values, whether or not they were decompressed
+        document = Document.find(document.id)
+        document.title = "Short story"
+        document.save()
+        document.body = "The end."
+        document.save()
+
+        document = Document.find(document.id)
+        self.assertEqual(document.body, "The end.")
+        self.assertEqual(document.payload, payload)
+
+        # Test that compressed columns can't also be full-text indexed
+        with self.assertRaises(ValueError):
+            Document.requires_table(
+                {"body": "TEXT"}, fulltext=["body"], compressed={"body": "zlib"}
+            )
+
+        LiteTable.COMPRESSED_COLUMNS.pop("documents")
+        LiteTable.delete("documents")
+
+    def test_deferred_columns(self):
+        """Test that deferred columns are loaded on first access"""
+
+        Document.requires_table(
+            {"title": "TEXT", "body": "TEXT", "payload": "JSON"},
+            compressed={"body": "zlib"},
+        )
+        Document.create_many(
+            [
+                {"title": f"Document {i}", "body": f"Body {i} " * 100, "payload": [i]}
+                for i in range(5)
+            ]
+        )
+
+        # Test deferring columns for a model
+        summaries = DocumentSummary.where("title").starts_with("Document").all()
+        self.assertEqual(len(summaries), 5)
+        self.assertTrue(all(summary._is_deferred("body") for summary in summaries))
+        self.assertEqual(summaries[0].payload, [0])
+        self.assertEqual(summaries[0].body, "Body 0 " * 100)
+        self.assertEqual(DocumentSummary.find(summaries[1].id), summaries[1])
+
+        # Test that printing instances doesn't load their deferred columns
+        self.assertNotIn("body", summaries[1].to_dict())
+        str(summaries)
+        self.assertTrue(summaries[1]._is_deferred("body"))
+        self.assertIn("body", summaries[0].to_dict())
+
+        # Test loading deferred columns for a collection
+        summaries.load("body")
+        self.assertEqual(summaries[1].__dict__["_raw_values"]["body"][:2], b"\x1fL")
+        self.assertEqual([summary.body for summary in summaries][4], "Body 4 " * 100)
+        self.assertFalse(summaries[4]._get_changed_columns())
+
+        # Test that unloaded columns aren't saved
+        summary = DocumentSummary.find(summaries[2].id)
+        Document.update_many([{"id": summary.id, "body": "Rewritten"}])
+        summary.title = "Renamed"
+        summary.save()
+        summary.fresh()
+        self.assertTrue(summary._is_deferred("body"))
+        self.assertEqual((summary.title, summary.body), ("Renamed", "Rewritten"))
+
+        # Test deferring columns for a query
+        document = Document.where("title").is_equal_to("Renamed").only("title").first()
+        self.assertTrue(document._is_deferred("payload"))
+        self.assertEqual(document.payload, [2])
+        documents = Document.where("title").starts_with("Document").defer("body").all()
+        self.assertFalse(documents[0]._is_deferred("payload"))
+        self.assertTrue(documents[0]._is_deferred("body"))
+
+        LiteTable.COMPRESSED_COLUMNS.pop("documents")
+        LiteTable.delete("documents")
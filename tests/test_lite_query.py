@@ -189,6 +189,12 @@ class TestLiteQuery(unittest.TestCase):
             .all()
         ) == [person3, person4]
 
+        # Test that queries can be iterated, streaming models
+        self.assertEqual(
+            [person.id for person in Person.where("age").is_greater_than(50)],
+            [person3.id, person4.id],
+        )
+
         # Test that an appropriate exception is raised if the query is invalid
         with self.assertRaises(ValueError):
             query = (
@@ -203,3 +209,58 @@ class TestLiteQuery(unittest.TestCase):
         assert query.first() is None
         assert query.last() is None
         assert query.all() == []
+
+    def test_full_text_search(self):
+        # Index the existing table
+        Brain.requires_table(
+            {"name": "TEXT", "person_id": "INTEGER"}, fulltext=["name"]
+        )
+        brains = Brain.create_many(
+            [
+                {"name": "fox cat dog bird", "person_id": 1},
+                {"name": "lazy dog", "person_id": 1},
+                {"name": "fox fox", "person_id": 2},
+            ]
+        )
+
+        # Test that multi-word queries match, ordered by relevance
+        results = Brain.where("name").matches("fox").all()
+        self.assertEqual([brain.id for brain in results], [brains[2].id, brains[0].id])
+        self.assertEqual(Brain.where("name").matches("dog bird").all(), [brains[0]])
+        self.assertEqual(
+            Brain.where("name").matches("lazy", snippet=True).first().name_snippet,
+            "<b>lazy</b> dog",
+        )
+
+        # Test combining matches with other conditions
+        self.assertEqual(
+            Brain.where("person_id")
+            .is_equal_to(1)
+            .and_where("name")
+            .matches("fox")
+            .all(),
+            [brains[0]],
+        )
+        self.assertEqual(
+            len(
+                Brain.where("name")
+                .matches("lazy")
+                .or_where("person_id")
+                .is_equal_to(2)
+                .all()
+            ),
+            2,
+        )
+
+        # Test that the index follows updates and deletes
+        brains[2].name = "hen"
+        brains[2].save()
+        brains[0].delete()
+        self.assertEqual(Brain.where("name").matches("fox").all(), [])
+        self.assertEqual(Brain.where("name").matches("hen").last(), brains[2])
+
+        with self.assertRaises(ValueError):
+            Person.where("name").matches("John")
+
+        Brain.all().delete_all()
+        LiteTable.drop_fulltext_index("brains")
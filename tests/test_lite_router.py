@@ -0,0 +1,81 @@
+import os
+import glob
+import sqlite3
+import threading
+import unittest
+from tests import *
+
+# Define the database path for the test database
+TEST_DB_PATH = "test.sqlite"
+
+
+class TestLiteRouter(unittest.TestCase):
+    def setUp(self):
+        Lite.create_database(TEST_DB_PATH)
+        self.router = LiteRouter(TEST_DB_PATH, readers=2)
+        Lite.connect(self.router)
+
+        LiteTable.create("people", {"name": "TEXT", "age": "INTEGER"})
+
+    def tearDown(self):
+        Lite.disconnect()
+
+        # remove test database
+        for file_name in glob.glob("*.sqlite*"):
+            os.remove(file_name)
+
+    def test_memory_database(self):
+        memory_db = LiteConnection.memory_database("test_router")
+        Lite.create_database(memory_db)
+        router = LiteRouter(memory_db, readers=2)
+        router.execute("CREATE TABLE test_table (id INTEGER)").commit()
+        router.execute("INSERT INTO test_table VALUES (1)").commit()
+
+        # Test that readers share the database, but can't write to it
+        self.assertEqual(router.execute("SELECT id FROM test_table").fetchall(), [(1,)])
+        self.assertEqual(router.route_stats["reads"], 1)
+        with self.assertRaises(sqlite3.OperationalError):
+            router.readers[0].execute("DELETE FROM test_table")
+
+        router.close()
+        Lite.drop_memory_database(memory_db)
+
+        with self.assertRaises(ValueError):
+            LiteRouter(":memory:")
+
+    def test_routing(self):
+        # Test that reads go to the read-only connections
+        person = Person.create({"name": "John", "age": 25})
+        reads, writes = self.router.route_stats.values()
+
+        self.assertEqual(Person.find(person.id).name, "John")
+        self.assertEqual(Person.where("age").is_equal_to(25).first().id, person.id)
+        self.assertEqual(self.router.route_stats["writes"], writes)
+        self.assertGreater(self.router.route_stats["reads"], reads)
+
+        # Test that read-only connections reject writes
+        with self.assertRaises(sqlite3.OperationalError):
+            self.router.readers[0].execute("DELETE FROM people")
+
+    def test_read_your_writes(self):
+        # Test that reads within a transaction observe its uncommitted writes
+        with self.router.transaction():
+            person = Person.create({"name": "Jane", "age": 30})
+            self.assertEqual(Person.find(person.id).name, "Jane")
+
+            # Other threads only see committed data
+            results = []
+            thread = threading.Thread(
+                target=lambda: results.append(
+                    self.router.execute("SELECT name FROM people").fetchall()
+                )
+            )
+            thread.start()
+            thread.join()
+            self.assertEqual(results, [[]])
+
+        self.assertEqual(len(Person.all()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import glob
+import multiprocessing
+import unittest
+from tests import *
+
+# Define the database path for the test database
+TEST_DB_PATH = "test.sqlite"
+TEST_CACHE_PATH = "test.sqlite-cache"
+
+
+class TestLiteSharedCache(unittest.TestCase):
+    def setUp(self):
+        Lite.create_database(TEST_DB_PATH)
+        Lite.connect(LiteConnection(TEST_DB_PATH))
+
+        LiteTable.create("people", {"name": "TEXT", "age": "INTEGER"})
+        self.person = Person.create({"name": "John", "age": 25})
+        self.cache = Lite.enable_shared_query_cache(TEST_CACHE_PATH, slots=64)
+
+    def tearDown(self):
+        Lite.disable_query_cache()
+        Lite.disconnect()
+
+        # remove test database
+        for file_name in glob.glob("*.sqlite*"):
+            os.remove(file_name)
+
+    def test_shared_cache(self):
+        # Test that results cached through one mapping are read through another
+        self.assertEqual(Person.find(self.person.id).name, "John")
+        other = LiteSharedCache(TEST_CACHE_PATH, slots=64)
+        rows = other.fetch(
+            Lite.DEFAULT_CONNECTION,
+            ["people"],
+            "SELECT * FROM people WHERE id = ?",
+            (self.person.id,),
+        )
+        self.assertIn("John", rows[0])
+        self.assertEqual(other.stats["hits"], 1)
+
+        # Test that writes invalidate results cached by every mapping
+        self.person.name = "Jack"
+        self.person.save()
+        self.assertEqual(Person.find(self.person.id).name, "Jack")
+        self.assertEqual(self.cache.stats["invalidations"], 1)
+
+        Person.where("age").is_equal_to(25).all()
+        other.clear()
+        Person.where("age").is_equal_to(25).all()
+        self.assertEqual(self.cache.stats["invalidations"], 2)
+        other.close()
+
+        with self.assertRaises(ValueError):
+            LiteSharedCache(TEST_CACHE_PATH, slots=32)
+
+    def test_data_version(self):
+        cache = Lite.enable_shared_query_cache(
+            TEST_CACHE_PATH, slots=64, check_data_version=True
+        )
+        Lite.create_database("other.sqlite")
+        other = LiteConnection("other.sqlite")
+        other.execute("CREATE TABLE notes (body TEXT)").commit()
+
+        query = Person.where("age").is_equal_to(25)
+        sql_str = "SELECT body FROM notes"
+        self.assertEqual(len(query.all()), 1)
+        cache.fetch(other, ["notes"], sql_str)
+
+        # Test that writes from other connections only invalidate their database
+        writer = LiteConnection(TEST_DB_PATH)
+        writer.execute("DELETE FROM people").commit()
+        writer.close()
+
+        self.assertEqual(len(query.all()), 0)
+        cache.fetch(other, ["notes"], sql_str)
+        self.assertEqual(cache.stats["hits"], 1)
+        other.close()
+
+    def test_corrupt_slots(self):
+        # Test that keys hash the same whether or not their strings are interned
+        key = (LiteCache.database_key(Lite.DEFAULT_CONNECTION), "people", ())
+        built_key = (key[0], "".join(["peo", "ple"]), ())
+        self.assertEqual(self.cache._hash(key), self.cache._hash(built_key))
+
+        # Test that unreadable slots are treated as misses
+        connection = Lite.DEFAULT_CONNECTION
+        sql_str = "SELECT name FROM people"
+        self.assertEqual(self.cache.fetch(connection, [], sql_str), [("John",)])
+
+        key_hash = self.cache._hash((key[0], sql_str, ()))
+        start = self.cache._slot_offset(key_hash) + self.cache._slot_header_size
+        self.cache._map[start : start + 8] = b"\x00" * 8
+
+        self.assertEqual(self.cache.fetch(connection, [], sql_str), [("John",)])
+        self.assertEqual(self.cache.stats["misses"], 2)
+
+    def test_worker_processes(self):
+        Person.where("age").is_equal_to(25).all()
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+
+        def worker():
+            Lite.connect(LiteConnection(TEST_DB_PATH))
+            hits = Lite.QUERY_CACHE.stats["hits"]
+            Person.where("age").is_equal_to(25).all()
+            person = Person.find(self.person.id)
+            person.age = 26
+            person.save()
+            results.put(Lite.QUERY_CACHE.stats["hits"] - hits)
+
+        process = context.Process(target=worker)
+        process.start()
+        process.join()
+
+        # Test that the worker read the parent's results, and its writes invalidated them
+        self.assertEqual(results.get(timeout=5), 1)
+        self.assertEqual(len(Person.where("age").is_equal_to(25).all()), 0)
@@ -35,6 +35,26 @@ class TestLiteTable(unittest.TestCase):
         self.assertFalse(self.table.is_pivot_table("test"))
         self.assertFalse(self.table.is_pivot_table("test_table"))
 
+    def test_create_pivot(self):
+        LiteTable.create("parents", {"name": "TEXT"})
+        pivot = LiteTable.create_pivot(
+            "parent_test_row",
+            {"parent_id": ["parents", "id"], "test_row_id": ["test_table", "id"]},
+        )
+
+        self.assertSetEqual(
+            set(pivot.get_column_names()), {"parent_id", "test_row_id"}
+        )
+        self.assertTrue(LiteTable.is_pivot_table("parent_test_row"))
+
+        # The composite primary key rejects duplicate relationships
+        pivot.insert_many(["parent_id", "test_row_id"], [(1, 1), (1, 2)])
+        pivot.insert_row({"parent_id": 1, "test_row_id": 1}, or_ignore=True)
+        self.assertEqual(len(pivot.select_rows([["parent_id", "=", 1]])), 2)
+
+        with self.assertRaises(ValueError):
+            LiteTable.create_pivot("invalid", {"parent_id": ["parents", "id"]})
+
     def test_column_names(self):
         self.assertSetEqual(
             set(self.table.get_column_names()),
@@ -57,11 +77,243 @@ class TestLiteTable(unittest.TestCase):
             [(1, "John", 26, None)],
         )
 
+    def test_inline_timestamp(self):
+        self.assertTrue(self.table.has_timestamp_trigger)
+
+        table = LiteTable.create(
+            "counters", {"count": "INTEGER"}, timestamp_trigger=False
+        )
+        self.assertFalse(table.has_timestamp_trigger)
+
+        # The 'updated' field is set by the UPDATE statement itself
+        table.insert_row({"id": 1, "count": 0, "updated": "2000-01-01 00:00:00"})
+        table.update_row({"count": 1}, [("id", "=", 1)])
+        self.assertNotEqual(
+            table.select_rows([("id", "=", 1)], ["updated"]),
+            [("2000-01-01 00:00:00",)],
+        )
+
+        # Drop the trigger from existing tables
+        self.assertListEqual(LiteTable.drop_timestamp_triggers(), ["test_table"])
+        self.assertFalse(LiteTable(self.table.table_name).has_timestamp_trigger)
+
+        # Existing instances notice the dropped trigger and set 'updated' inline
+        self.assertFalse(self.table.has_timestamp_trigger)
+        self.table.insert_row({"id": 9, "updated": "2000-01-01 00:00:00"})
+        self.table.update_row({"age": 9}, [("id", "=", 9)])
+        self.assertNotEqual(
+            self.table.select_rows([("id", "=", 9)], ["updated"]),
+            [("2000-01-01 00:00:00",)],
+        )
+
     def test_delete_row(self):
         self.table.insert_row({"id": 1, "name": "John", "age": 25, "parent_id": None})
         self.table.delete_rows([("id", "=", 1)])
         self.assertListEqual(self.table.select_rows([]), [])
 
+    def test_many_rows(self):
+        rows = [(i, f"Person {i}", i % 50) for i in range(1, 1201)]
+        self.table.insert_many(["id", "name", "age"], rows)
+        self.assertEqual(len(self.table.select_rows([])), 1200)
+
+        # Existing rows are skipped with or_ignore
+        self.table.insert_many(["id", "name", "age"], rows[:10], or_ignore=True)
+
+        pairs = [(1, "Person 1"), (600, "Person 600"), (2, "Person 3")]
+        self.assertListEqual(
+            sorted(self.table.select_many(["id", "name"], pairs, ["id"])),
+            [(1,), (600,)],
+        )
+
+        self.table.delete_many(["id"], [(i,) for i in range(1, 1101)])
+        self.assertEqual(len(self.table.select_rows([])), 100)
+
+    def test_iter_rows(self):
+        rows = [(i, f"Person {i}", i % 50) for i in range(1, 101)]
+        self.table.insert_many(["id", "name", "age"], rows)
+
+        streamed = self.table.iter_rows([["age", "<", 10]], ["id"])
+        self.assertEqual(next(streamed), (1,))
+        self.table.update_row({"name": "Updated"}, [["id", "=", 1]])
+        self.assertEqual(len(list(streamed)), 19)
+
+    def test_bulk_rows(self):
+        self.table.insert_rows(
+            [{"id": i, "name": f"Person {i}", "age": i} for i in range(1, 101)]
+            + [{"id": 101, "name": "Person 101"}]
+        )
+        self.assertEqual(len(self.table.select_rows([])), 101)
+
+        updated = self.table.update_rows(
+            [{"id": i, "age": 0} for i in range(1, 51)]
+            + [{"id": 101, "name": "Updated", "age": 1}]
+        )
+        self.assertEqual(updated, 51)
+        self.assertEqual(len(self.table.select_rows([["age", "=", 0]])), 50)
+        self.assertEqual(
+            self.table.select_rows([["id", "=", 101]], ["name", "age"]),
+            [("Updated", 1)],
+        )
+
+        with self.assertRaises(ValueError):
+            self.table.update_rows([{"age": 2}])
+
+        self.assertEqual(self.table.delete_rows_by_ids(range(1, 51)), 50)
+        self.assertEqual(len(self.table.select_rows([])), 51)
+
+    def test_upsert_rows(self):
+        table_name = self.table.table_name
+        self.table.connection.execute(
+            f"CREATE UNIQUE INDEX {table_name}_name ON {table_name} (name)"
+        ).commit()
+        self.table.insert_rows(
+            [{"name": "John", "age": 25}, {"name": "Jane", "age": 30}]
+        )
+        john_id, jane_id = (row[0] for row in self.table.select_rows([], ["id"]))
+
+        # Test that conflicting rows are updated, and others inserted
+        rows = [{"name": f"Person {i}", "age": i} for i in range(500)]
+        rows.insert(250, {"name": "Jane", "age": 31})
+        ids = self.table.upsert_rows(rows, ["name"])
+        self.assertEqual(len(ids), 501)
+        self.assertEqual(ids[250], jane_id)
+        self.assertEqual(
+            self.table.select_rows([["id", "=", jane_id]], ["age"]), [(31,)]
+        )
+        self.assertEqual(len(self.table.select_rows([])), 502)
+
+        # Test that only the given columns are updated
+        ids = self.table.upsert_rows(
+            [{"name": "John", "age": 40, "parent_id": 1}], ["name"], ["parent_id"]
+        )
+        self.assertEqual(ids, [john_id])
+        self.assertEqual(
+            self.table.select_rows([["id", "=", john_id]], ["age", "parent_id"]),
+            [(25, 1)],
+        )
+
+        # Test that keys converted by the column's type affinity are matched
+        codes = LiteTable.create("codes", {"code": "INTEGER UNIQUE", "name": "TEXT"})
+        ids = codes.upsert_rows([{"code": "7", "name": "x"}], ["code"])
+        self.assertEqual(ids, [codes.select_rows([["code", "=", 7]], ["id"])[0][0]])
+        self.assertEqual(codes.upsert_rows([{"code": 7.0}], ["code"]), ids)
+        self.assertEqual(codes.upsert_rows([{"code": "7", "name": "y"}], ["code"]), ids)
+
+        # Test that existing rows are left as-is without update columns
+        ids = self.table.upsert_rows([{"name": "John", "age": 50}], ["name"], [])
+        self.assertEqual(ids, [john_id])
+        self.assertEqual(
+            self.table.select_rows([["id", "=", john_id]], ["age"]), [(25,)]
+        )
+
+        with self.assertRaises(ValueError):
+            self.table.upsert_rows([{"age": 50}], ["name"])
+
+    def test_track_changes(self):
+        self.assertListEqual(list(Lite.changes_since()), [])
+
+        LiteTable.track_changes(self.table.table_name)
+        table = LiteTable.create("counters", {"count": "INTEGER"}, track_changes=True)
+
+        self.table.insert_rows([{"name": "John", "age": 25}, {"name": "Jane"}])
+        self.table.update_row({"age": 26}, [("name", "=", "John")])
+        self.table.update_row({"age": 26}, [("name", "=", "John")])
+        table.insert_row({"count": 1})
+        self.table.delete_rows([("name", "=", "Jane")])
+
+        # Test that no-op updates and timestamp updates aren't recorded
+        changes = list(Lite.changes_since(batch_size=2))
+        self.assertListEqual(
+            [change[1:] for change in changes],
+            [
+                ("test_table", 1, "I"),
+                ("test_table", 2, "I"),
+                ("test_table", 1, "U"),
+                ("counters", 1, "I"),
+                ("test_table", 2, "D"),
+            ],
+        )
+
+        # Test consuming changes incrementally
+        last_seq = changes[2][0]
+        self.assertListEqual(
+            [change[2] for change in Lite.changes_since(last_seq, ["test_table"])],
+            [2],
+        )
+
+        self.assertEqual(Lite.compact_changes(last_seq), 3)
+        self.assertListEqual(list(Lite.changes_since()), changes[3:])
+
+        LiteTable.untrack_changes(self.table.table_name)
+        self.table.insert_row({"name": "Jim"})
+        self.assertEqual(len(list(Lite.changes_since())), 2)
+
+    def test_compress_columns(self):
+        table = LiteTable.create("notes", {"body": "TEXT", "data": "BLOB"})
+        LiteTable.compress_columns("notes", {"body": "zlib", "data": "lzma"})
+
+        body = "Lorem ipsum dolor sit amet. " * 100
+        table.insert_rows(
+            [
+                {"body": body, "data": body.encode()},
+                {"body": "Short", "data": b"Short"},
+                {"body": None, "data": None},
+            ]
+        )
+
+        # Test that large values are compressed, and small text is stored as-is
+        rows = table.select_rows([], ["body", "data"])
+        self.assertTrue(rows[0][0].startswith(LiteTable.COMPRESSION_HEADER + b"z"))
+        self.assertTrue(rows[0][1].startswith(LiteTable.COMPRESSION_HEADER + b"x"))
+        self.assertEqual(rows[1][0], "Short")
+        self.assertEqual(rows[2], (None, None))
+
+        self.assertEqual(table._decode_value("body", rows[0][0]), body)
+        self.assertEqual(table._decode_value("data", rows[0][1]), body.encode())
+        self.assertEqual(table._decode_value("data", rows[1][1]), b"Short")
+
+        # Test that values marked as compressed are written as-is
+        compressed = LiteTable.CompressedValue(rows[0][0])
+        table.update_row({"body": compressed}, [("body", "=", "Short")])
+        self.assertEqual(table.select_rows([], ["body"])[1][0], rows[0][0])
+
+        # Test that bytes looking like compressed values are still compressed
+        data = LiteTable.COMPRESSION_HEADER + b"zs not compressed"
+        table.update_row({"data": data}, [("id", "=", 2)])
+        stored = table.select_rows([("id", "=", 2)], ["data"])[0][0]
+        self.assertEqual(table._decode_value("data", stored), data)
+
+        stats = LiteTable.get_compression_stats("notes")
+        self.assertEqual(stats["body"]["values"], 2)
+        self.assertGreater(stats["body"]["ratio"], 10)
+
+        # Test that multi-row inserts compress values too
+        table.insert_many(["body"], [(body,)])
+        self.assertTrue(
+            table.select_rows([], ["body"])[-1][0].startswith(
+                LiteTable.COMPRESSION_HEADER
+            )
+        )
+
+        with self.assertRaises(ValueError):
+            LiteTable.compress_columns("notes", {"body": "gzip"})
+
+        # Test that compressed columns can't be full-text indexed, in either order
+        with self.assertRaises(ValueError):
+            LiteTable.create_fulltext_index("notes", ["body"])
+        LiteTable.compress_columns("notes_copy", {"body": "zlib"})
+        with self.assertRaises(ValueError):
+            LiteTable.create("notes_copy", {"body": "TEXT"}, fulltext=["body"])
+        self.assertFalse(LiteTable.exists("notes_copy"))
+
+        LiteTable.create("articles", {"body": "TEXT"}, fulltext=["body"])
+        with self.assertRaises(ValueError):
+            LiteTable.compress_columns("articles", {"body": "zlib"})
+        self.assertNotIn("articles", LiteTable.COMPRESSED_COLUMNS)
+
+        LiteTable.COMPRESSED_COLUMNS.pop("notes")
+        LiteTable.COMPRESSED_COLUMNS.pop("notes_copy")
+
     def test_delete_all(self):
         self.table.insert_row({"id": 1, "name": "John", "age": 25, "parent_id": None})
         self.table.insert_row({"id": 2, "name": "John", "age": 25, "parent_id": None})
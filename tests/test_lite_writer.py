@@ -0,0 +1,95 @@
+import os
+import glob
+import sqlite3
+import threading
+import unittest
+from tests import *
+
+# Define the database path for the test database
+TEST_DB_PATH = "test.sqlite"
+
+
+class TestLiteWriter(unittest.TestCase):
+    def setUp(self):
+        Lite.create_database(TEST_DB_PATH)
+        Lite.connect(LiteConnection(TEST_DB_PATH))
+
+        LiteTable.create("people", {"name": "TEXT UNIQUE", "age": "INTEGER"})
+        self.writer = LiteWriter(TEST_DB_PATH, max_batch=50, max_delay=0.05)
+
+    def tearDown(self):
+        self.writer.close()
+        Lite.disconnect()
+
+        # remove test database
+        for file_name in glob.glob("*.sqlite*"):
+            os.remove(file_name)
+
+    def test_group_commit(self):
+        # Test that writes from many threads are grouped into shared transactions
+        futures = []
+
+        def insert_people(thread_index):
+            for i in range(25):
+                futures.append(
+                    self.writer.insert_row(
+                        "people", {"name": f"Person {thread_index}-{i}", "age": i}
+                    )
+                )
+
+        threads = [threading.Thread(target=insert_people, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        ids = [future.result() for future in futures]
+        self.assertEqual(len(set(ids)), 100)
+        self.assertEqual(len(Person.all()), 100)
+        self.assertEqual(self.writer.stats["operations"], 100)
+        self.assertLess(self.writer.stats["transactions"], 100)
+
+    def test_write_methods(self):
+        person = Person()
+        person.name = "John"
+        person.age = 25
+        self.assertEqual(self.writer.save(person).result(), person.id)
+
+        self.writer.update_row("people", {"age": 26}, [["id", "=", person.id]])
+        self.writer.flush()
+        self.assertEqual(Person.find(person.id).age, 26)
+
+        # Test that a failing write doesn't affect the rest of its group
+        failing = self.writer.insert_row("people", {"name": "John"})
+        succeeding = self.writer.insert_row("people", {"name": "Jane"})
+        with self.assertRaises(sqlite3.IntegrityError):
+            failing.result()
+        self.assertIsNotNone(Person.find(succeeding.result()))
+
+        # Test that a group retried after a lock error saves model instances again
+        attempts = []
+
+        def locked_once(_):
+            attempts.append(True)
+            if len(attempts) == 1:
+                raise sqlite3.OperationalError("database is locked")
+
+        with LiteWriter(TEST_DB_PATH, max_delay=0.05, retries=1) as writer:
+            person = Person()
+            person.name = "Jack"
+            person.age = 30
+            saved = writer.save(person)
+            writer.submit(locked_once).result()
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(Person.find(saved.result()).name, "Jack")
+
+        self.writer.delete_rows("people").result()
+        self.assertEqual(len(Person.all()), 0)
+
+        self.writer.close()
+        with self.assertRaises(RuntimeError):
+            self.writer.flush()
+
+
+if __name__ == "__main__":
+    unittest.main()